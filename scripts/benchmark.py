@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Benchmark archive scanning, generation helpers and web endpoints.
+
+Builds a synthetic YYYY/MM/DD/HHMMSS.jpg archive (days, captures per day,
+image size and thumbs/ configurable), then times the functions that
+scale with archive size -- _list_available_dates, _list_images_for_date,
+collect_images, detect_resolution, generate_thumbnail, cleanup_old_days
+-- and the main Flask endpoints through the test client. Runs offline.
+
+Images are a few encoded templates hard-linked (or copied, where links
+are not supported) into place, so a large archive costs little disk
+space and builds quickly.
+
+Results are printed as a table, or written as JSON with --output for
+comparison across commits with --compare:
+
+    python scripts/benchmark.py --days 60 --per-day 288 --output before.json
+    git checkout feature && python scripts/benchmark.py --days 60 \\
+        --per-day 288 --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+# Benchmark the checkout this script belongs to, not an installed copy
+sys.path.insert(0, str(SRC_DIR))
+
+# Distinct encoded images the archive is built from
+_TEMPLATES = 4
+
+# Old days created (untimed) for each cleanup_old_days deletion run
+_CLEANUP_DAYS = 2
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    try:
+        width, height = value.lower().split("x")
+        return int(width), int(height)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size {value!r}; use WxH")
+
+
+def _make_templates(work_dir: Path, size: tuple[int, int]) -> list[tuple[Path, Path]]:
+    """Encode template images and their thumbnails.
+
+    Returns:
+        List of (image path, thumbnail path).
+    """
+    from PIL import Image
+
+    from timelapse.thumbnails import generate_thumbnail
+
+    templates = []
+    for index in range(_TEMPLATES):
+        # Noise gives camera-like JPEG sizes; the tint keeps templates distinct
+        noise = Image.effect_noise(size, 40 + 10 * index)
+        image = Image.merge(
+            "RGB",
+            (noise, noise.point(lambda v: v * 0.9), noise.point(lambda v: v * 0.8)),
+        )
+        path = work_dir / f"template{index}.jpg"
+        image.save(path, "JPEG", quality=85)
+        templates.append((path, generate_thumbnail(path, work_dir / "thumbs")))
+    return templates
+
+
+def _place(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def build_day(root: Path, day: date, per_day: int, templates: list, thumbs: bool) -> None:
+    """Write one day of evenly spaced captures under root."""
+    day_dir = root / f"{day:%Y}" / f"{day:%m}" / f"{day:%d}"
+    thumb_dir = day_dir / "thumbs"
+    thumb_dir.mkdir(parents=True, exist_ok=True)
+    step = 86400 / per_day
+    for index in range(per_day):
+        seconds = int(index * step)
+        name = f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}.jpg"
+        image, thumb = templates[index % len(templates)]
+        _place(image, day_dir / name)
+        if thumbs:
+            _place(thumb, thumb_dir / name)
+
+
+def build_archive(
+    root: Path, days: int, per_day: int, templates: list, thumbs: bool
+) -> list[date]:
+    """Build an archive of days ending yesterday. Returns the days, oldest first."""
+    last = date.today() - timedelta(days=1)
+    dates = [last - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+    for day in dates:
+        build_day(root, day, per_day, templates, thumbs)
+    return dates
+
+
+def _time(func, repeat: int, setup=None) -> list[float]:
+    """Run func repeat times; return wall-clock milliseconds per run."""
+    samples = []
+    for _ in range(repeat):
+        args = setup() if setup is not None else ()
+        started = time.perf_counter()
+        func(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def run_benchmarks(args, root: Path, work_dir: Path, templates: list, dates: list) -> dict:
+    """Time every benchmark. Returns {name: [ms, ...]}."""
+    from timelapse.generate import collect_images, detect_resolution
+    from timelapse.storage import cleanup_old_days
+    from timelapse.thumbnails import generate_thumbnail
+    from timelapse.web.blueprints.timeline import (
+        _list_available_dates,
+        _list_images_for_date,
+    )
+
+    repeat = args.repeat
+    first, last = dates[0], dates[-1]
+    samples = {}
+
+    samples["list_available_dates"] = _time(lambda: _list_available_dates([root]), repeat)
+    samples["list_images_for_date"] = _time(
+        lambda: _list_images_for_date([root], last.isoformat()), repeat
+    )
+    samples["collect_images"] = _time(lambda: collect_images(root, first, last), repeat)
+    if args.thumbs:
+        samples["collect_images_thumbs"] = _time(
+            lambda: collect_images(root, first, last, use_thumbnails=True), repeat
+        )
+    images = collect_images(root, first, last)
+    samples["detect_resolution"] = _time(lambda: detect_resolution(images), repeat)
+
+    counter = iter(range(repeat))
+    samples["generate_thumbnail"] = _time(
+        generate_thumbnail,
+        repeat,
+        setup=lambda: (templates[0][0], work_dir / f"thumbs-run{next(counter)}"),
+    )
+
+    # Nothing is old enough to delete: measures the directory walk alone
+    samples["cleanup_old_days_scan"] = _time(
+        lambda: cleanup_old_days(root, len(dates) + 2), repeat
+    )
+
+    def cleanup_setup():
+        scratch = Path(tempfile.mkdtemp(dir=work_dir))
+        for offset in range(_CLEANUP_DAYS):
+            day = first - timedelta(days=30 + offset)
+            build_day(scratch, day, args.per_day, templates, args.thumbs)
+        return (scratch,)
+
+    samples["cleanup_old_days"] = _time(
+        lambda scratch: cleanup_old_days(scratch, 7), repeat, setup=cleanup_setup
+    )
+
+    samples.update(_run_endpoints(args, root, work_dir, last))
+    return samples
+
+
+def _run_endpoints(args, root: Path, work_dir: Path, last: date) -> dict:
+    """Time unauthenticated web endpoints through the Flask test client."""
+    import yaml
+
+    from timelapse.web import create_app
+
+    config_path = work_dir / "benchmark.yml"
+    with open(config_path, "w") as f:
+        yaml.safe_dump(
+            {"storage": {"output_dir": str(root), "status_dir": str(work_dir)}}, f
+        )
+    app = create_app(config_path)
+    client = app.test_client()
+
+    day_path = f"{last:%Y}/{last:%m}/{last:%d}"
+    name = sorted(p.name for p in (root / day_path).glob("*.jpg"))[-1]
+    endpoints = {
+        "timeline_page": "/",
+        "api_dates": "/api/dates",
+        "api_images": f"/api/images/{last.isoformat()}",
+        "image": f"/image/{day_path}/{name}",
+        "latest_page": "/latest/",
+        "latest_image": "/latest/image",
+        "latest_status": "/latest/status",
+    }
+    if args.thumbs:
+        endpoints["thumb"] = f"/thumb/{day_path}/{name}"
+
+    samples = {}
+    for label, url in endpoints.items():
+
+        def get(url=url):
+            response = client.get(url)
+            response.get_data()
+            if response.status_code != 200:
+                raise SystemExit(f"GET {url} returned {response.status_code}")
+            response.close()
+
+        get()  # warm up: template compilation, first-request setup
+        samples[f"web_{label}"] = _time(get, args.repeat)
+    return samples
+
+
+def _summarize(values: list[float]) -> dict:
+    return {
+        "min": round(min(values), 3),
+        "median": round(statistics.median(values), 3),
+        "mean": round(statistics.fmean(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _print_table(results: dict, baseline: dict | None) -> None:
+    header = f"{'benchmark':28} {'median ms':>10} {'min ms':>10} {'max ms':>10}"
+    if baseline:
+        header += f" {'vs base':>9}"
+    print(header)
+    for name, result in results.items():
+        ms = result["ms"]
+        line = f"{name:28} {ms['median']:10.2f} {ms['min']:10.2f} {ms['max']:10.2f}"
+        base = (baseline or {}).get(name)
+        if base:
+            line += f" {ms['median'] / base['ms']['median']:8.2f}x"
+        elif baseline:
+            line += f" {'new':>9}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=30, help="Days in the archive (default: 30)")
+    parser.add_argument(
+        "--per-day", type=int, default=288, help="Captures per day (default: 288, every 5 minutes)"
+    )
+    parser.add_argument(
+        "--size", type=_parse_size, default=(1920, 1080), help="Image size WxH (default: 1920x1080)"
+    )
+    parser.add_argument(
+        "--thumbs",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Create thumbs/ directories (default: on)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark (default: 5)")
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="Build the archive here and keep it (default: temporary, removed afterwards)",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results to this file")
+    parser.add_argument(
+        "--compare", type=Path, default=None, help="Earlier JSON results to compare medians with"
+    )
+    args = parser.parse_args()
+    if args.days < 1 or args.per_day < 1 or args.per_day > 86400 or args.repeat < 1:
+        parser.error("--days, --per-day (at most 86400) and --repeat must be positive")
+
+    work_dir = Path(tempfile.mkdtemp(prefix="timelapse-bench-"))
+    root = args.archive or work_dir / "archive"
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        templates = _make_templates(work_dir, args.size)
+        started = time.perf_counter()
+        dates = build_archive(root, args.days, args.per_day, templates, args.thumbs)
+        build_s = time.perf_counter() - started
+
+        samples = run_benchmarks(args, root, work_dir, templates, dates)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "days": args.days,
+            "per_day": args.per_day,
+            "images": args.days * args.per_day,
+            "size": list(args.size),
+            "thumbs": args.thumbs,
+            "repeat": args.repeat,
+            "build_seconds": round(build_s, 1),
+        },
+        "results": {
+            name: {"ms": _summarize(values), "samples": [round(v, 3) for v in values]}
+            for name, values in samples.items()
+        },
+    }
+
+    baseline = None
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    _print_table(report["results"], baseline)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
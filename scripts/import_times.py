@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Check the CLI's startup imports and report their cost.
+
+Imports each entry module in a fresh interpreter with ``-X importtime``,
+prints the cumulative import time, and fails if the module pulled in a
+dependency its command does not need (numpy or Pillow for argument
+parsing, Flask for the capture daemon, ...). Module checks catch
+regressions reliably on any machine; --max-ms adds a time budget for
+runs on the target hardware.
+
+Usage:
+    python scripts/import_times.py [--repeat N] [--max-ms MS] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Entry module -> modules it must not import at startup
+CHECKS = {
+    # --help, argument errors, and dispatch to any subcommand
+    "timelapse.__main__": (
+        "numpy",
+        "PIL",
+        "flask",
+        "cv2",
+        "picamera2",
+        "timelapse.daemon",
+        "timelapse.generate",
+    ),
+    # generate --dry-run and the web job runner
+    "timelapse.generate": ("numpy", "PIL", "flask", "cv2", "picamera2"),
+    # The capture daemon never serves HTTP or encodes videos up front
+    "timelapse.daemon": ("flask", "timelapse.generate", "cv2", "picamera2"),
+}
+
+
+def measure(module: str) -> tuple[float, set[str]]:
+    """Import module in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative import time in ms, names of modules imported).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(SRC_DIR), env.get("PYTHONPATH")) if p
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{result.stderr}")
+
+    total_us = 0
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header line
+        name = fields[2].strip()
+        loaded.add(name)
+        if name == module:
+            total_us = int(fields[1])
+    return total_us / 1000, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per module; the median is reported"
+    )
+    parser.add_argument(
+        "--max-ms", type=float, default=None, help="Fail if any module takes longer"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    failed = False
+    for module, forbidden in CHECKS.items():
+        times = []
+        for _ in range(max(1, args.repeat)):
+            ms, loaded = measure(module)
+            times.append(ms)
+        unexpected = sorted(
+            name
+            for name in forbidden
+            if any(m == name or m.startswith(name + ".") for m in loaded)
+        )
+        median = statistics.median(times)
+        over_budget = args.max_ms is not None and median > args.max_ms
+        failed = failed or bool(unexpected) or over_budget
+        results[module] = {
+            "import_ms": round(median, 1),
+            "modules": len(loaded),
+            "unexpected": unexpected,
+            "over_budget": over_budget,
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for module, result in results.items():
+            status = "ok"
+            if result["unexpected"]:
+                status = "imports " + ", ".join(result["unexpected"])
+            elif result["over_budget"]:
+                status = f"over {args.max_ms:g} ms"
+            print(
+                f"{module:24} {result['import_ms']:8.1f} ms "
+                f"{result['modules']:4} modules  {status}"
+            )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,21 @@ Usage:
     python -m timelapse [--config PATH]              # run daemon (default)
     python -m timelapse generate-thumbnails [--config PATH]  # backfill thumbnails
     python -m timelapse generate --start DATE [--end DATE | --range RANGE]  # generate video
+    python -m timelapse stats [--start DATE] [--end DATE | --range RANGE]  # capture timings
+
+Each subcommand imports its own stack (camera and daemon, thumbnails, or
+the video generator) only once it is selected, so --help and argument
+errors return without loading numpy, Pillow or the camera backends.
 """
 
 import argparse
+import json
 import logging
 import sys
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 
 from timelapse.config import load_config
-from timelapse.daemon import CaptureDaemon
-from timelapse.storage import StorageManager
 
 
 def _resolve_config(config_arg: Path | None) -> Path:
@@ -51,8 +55,25 @@ def _resolve_config(config_arg: Path | None) -> Path:
     sys.exit(1)
 
 
+def _parse_duration(value: str) -> int:
+    """argparse type for --duration; defers importing the generator."""
+    from timelapse.generate import parse_duration
+
+    return parse_duration(value)
+
+
+def _parse_range(value: str) -> str:
+    """argparse type for --range; defers importing the generator."""
+    from timelapse.generate import parse_range
+
+    return parse_range(value)
+
+
 def _run_daemon(args: argparse.Namespace) -> None:
     """Run the capture daemon (default subcommand)."""
+    from timelapse.daemon import CaptureDaemon
+    from timelapse.storage import StorageManager
+
     config_path = _resolve_config(args.config)
 
     logger = logging.getLogger("timelapse")
@@ -76,7 +97,7 @@ def _run_daemon(args: argparse.Namespace) -> None:
 
 def _run_generate_thumbnails(args: argparse.Namespace) -> None:
     """Walk output directory and generate thumbnails for existing images."""
-    from timelapse.web.thumbnails import generate_thumbnail
+    from timelapse.thumbnails import generate_thumbnail
 
     config_path = _resolve_config(args.config)
 
@@ -140,13 +161,17 @@ def _run_generate(args: argparse.Namespace) -> None:
             )
             sys.exit(1)
 
-    # Determine images directory
+    # Determine images directory (and secondary storage tiers)
     if args.images:
         images_dir = args.images
+        extra_tiers = []
     else:
+        from timelapse.storage import tier_dirs
+
         config_path = _resolve_config(args.config)
         config = load_config(config_path)
         images_dir = Path(config["storage"]["output_dir"])
+        extra_tiers = tier_dirs(config)
 
     # Compute end date
     if hasattr(args, "range") and args.range:
@@ -165,6 +190,10 @@ def _run_generate(args: argparse.Namespace) -> None:
         sort=args.sort,
         resolution=resolution,
         codec=args.codec,
+        dedupe=args.dedupe,
+        min_brightness=args.min_brightness,
+        deflicker=args.deflicker,
+        tier_dirs=extra_tiers,
         dry_run=args.dry_run,
         show_progress=not args.summary_only,
         verbose=args.verbose,
@@ -172,6 +201,47 @@ def _run_generate(args: argparse.Namespace) -> None:
     )
 
 
+def _run_stats(args: argparse.Namespace) -> None:
+    """Report capture timings and missed slots from the capture trace."""
+    from timelapse.config import camera_configs
+    from timelapse.storage import tier_dirs
+    from timelapse.trace_report import build_report, format_report
+
+    config = load_config(_resolve_config(args.config))
+
+    cameras = {camera["name"]: camera for camera in camera_configs(config)}
+    name = args.camera or next(iter(cameras))
+    if name not in cameras:
+        print(
+            f"Unknown camera: {name!r} (configured: {', '.join(cameras)})",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    subdir = cameras[name]["subdir"]
+    roots = [
+        Path(root) / subdir if subdir else Path(root)
+        for root in (config["storage"]["output_dir"], *tier_dirs(config))
+    ]
+
+    if args.range:
+        from timelapse.generate import range_to_end_date
+
+        start = args.start or date.today()
+        end = range_to_end_date(start, args.range)
+    else:
+        end = args.end or date.today()
+        start = args.start or end - timedelta(days=6)
+    if start > end:
+        print(f"Start date {start} is after end date {end}", file=sys.stderr)
+        sys.exit(1)
+
+    report = build_report(roots, start, end)
+    if args.json:
+        print(json.dumps({"camera": name, **report}, indent=2))
+    else:
+        print(format_report(report, name))
+
+
 def main() -> None:
     """Parse arguments and dispatch to the appropriate subcommand."""
     parser = argparse.ArgumentParser(
@@ -208,8 +278,6 @@ def main() -> None:
     )
 
     # generate subcommand
-    from timelapse.generate import parse_duration, parse_range
-
     gen_parser = subparsers.add_parser(
         "generate",
         help="Generate a timelapse video from captured images",
@@ -228,12 +296,12 @@ def main() -> None:
     )
     date_group.add_argument(
         "--range",
-        type=parse_range,
+        type=_parse_range,
         help="Date range relative to start (e.g. 7d, 2w, 1m)",
     )
     gen_parser.add_argument(
         "--duration",
-        type=parse_duration,
+        type=_parse_duration,
         default=120,
         help="Target video duration (e.g. 2m, 90s, 1h30m). Default: 2m",
     )
@@ -278,6 +346,37 @@ def main() -> None:
         default="libx264",
         help="FFmpeg video codec (default: libx264)",
     )
+    gen_parser.add_argument(
+        "--dedupe",
+        type=int,
+        nargs="?",
+        const=2,
+        default=None,
+        metavar="BITS",
+        help=(
+            "Collapse runs of near-identical frames; BITS is the maximum "
+            "perceptual hash distance (default when given: 2)"
+        ),
+    )
+    gen_parser.add_argument(
+        "--min-brightness",
+        type=float,
+        default=None,
+        metavar="LEVEL",
+        help="Skip frames with mean luminance below LEVEL (0-255), e.g. night frames",
+    )
+    gen_parser.add_argument(
+        "--deflicker",
+        type=int,
+        nargs="?",
+        const=15,
+        default=None,
+        metavar="FRAMES",
+        help=(
+            "Smooth exposure flicker over a rolling window of FRAMES frames "
+            "(default when given: 15)"
+        ),
+    )
     gen_parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -308,6 +407,50 @@ def main() -> None:
         ),
     )
 
+    # stats subcommand
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Report capture timings and missed slots from the capture trace",
+    )
+    stats_parser.add_argument(
+        "--start",
+        type=lambda s: date.fromisoformat(s),
+        default=None,
+        help="First day (YYYY-MM-DD). Default: 6 days before the end",
+    )
+    stats_date_group = stats_parser.add_mutually_exclusive_group()
+    stats_date_group.add_argument(
+        "--end",
+        type=lambda s: date.fromisoformat(s),
+        default=None,
+        help="Last day (YYYY-MM-DD). Default: today",
+    )
+    stats_date_group.add_argument(
+        "--range",
+        type=_parse_range,
+        default=None,
+        help="Date range relative to start (e.g. 7d, 2w, 1m)",
+    )
+    stats_parser.add_argument(
+        "--camera",
+        default=None,
+        help="Camera name from the config's cameras list (default: the first)",
+    )
+    stats_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON",
+    )
+    stats_parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help=(
+            "Path to YAML config file "
+            "(default: /etc/timelapse/timelapse.yml or ./config/timelapse.yml)"
+        ),
+    )
+
     # Configure logging: INFO to stderr (systemd captures via journal)
     logging.basicConfig(
         level=logging.INFO,
@@ -321,6 +464,8 @@ def main() -> None:
         _run_generate_thumbnails(args)
     elif args.command == "generate":
         _run_generate(args)
+    elif args.command == "stats":
+        _run_stats(args)
     else:
         # Default: run the daemon
         _run_daemon(args)
@@ -0,0 +1,149 @@
+"""Cheap per-image analysis on downscaled grayscale frames.
+
+Images are decoded in JPEG draft mode (DCT scaling) straight to a small
+grayscale array, so analysing a 1080p capture costs a few milliseconds
+on a Pi instead of a full decode. All comparisons are vectorized NumPy
+operations on these fixed-size arrays.
+
+Per-image statistics are cached in each day's stats sidecar: the daemon
+records them at capture time, and image_stats() fills in anything
+missing for older images the first time they are needed.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from timelapse.storage.sidecar import append_stats, load_day_stats
+
+logger = logging.getLogger("timelapse.analysis")
+
+# Fixed analysis size so arrays from different captures are comparable
+ANALYSIS_SIZE = (64, 48)
+
+# Difference hash grid: 9x8 samples give 64 horizontal gradient bits
+_DHASH_SIZE = (9, 8)
+
+# Gradients at or below this many grey levels hash as 0, so flat regions
+# (sky, night) do not flip bits on sensor noise
+_DHASH_TOLERANCE = 2
+
+# Keys produced by compute_stats(); image_stats() fills these in when missing
+STAT_KEYS = ("dhash", "luma")
+
+
+def load_gray(image_path: Path) -> np.ndarray:
+    """Decode an image to a small grayscale array.
+
+    Args:
+        image_path: Path to a JPEG image.
+
+    Returns:
+        uint8 array of shape (ANALYSIS_SIZE[1], ANALYSIS_SIZE[0]).
+    """
+    with Image.open(image_path) as im:
+        # Let libjpeg downscale during decode (up to 1/8) -- much cheaper
+        # than decoding at full size and resizing afterwards
+        im.draft("L", ANALYSIS_SIZE)
+        gray = im.convert("L").resize(ANALYSIS_SIZE, Image.BILINEAR)
+        return np.asarray(gray, dtype=np.uint8)
+
+
+def change_score(previous: np.ndarray, current: np.ndarray) -> float:
+    """Score how much the scene changed between two grayscale frames.
+
+    Args:
+        previous: Grayscale array from load_gray().
+        current: Grayscale array from load_gray(), same shape.
+
+    Returns:
+        Mean absolute pixel difference as a percentage of full scale
+        (0 = identical, 100 = black to white everywhere).
+    """
+    diff = np.abs(current.astype(np.int16) - previous.astype(np.int16))
+    return float(diff.mean()) / 255 * 100
+
+
+def dhash(gray: np.ndarray) -> int:
+    """Compute a 64-bit difference hash of a grayscale frame.
+
+    Each bit records whether a cell is clearly brighter than its
+    right-hand neighbour on a box-averaged 9x8 downscale. Near-identical
+    images differ in only a few bits, regardless of JPEG noise or small
+    exposure changes.
+
+    Args:
+        gray: Grayscale array from load_gray().
+
+    Returns:
+        The hash as an unsigned 64-bit integer.
+    """
+    small = np.asarray(
+        Image.fromarray(gray).resize(_DHASH_SIZE, Image.BOX), dtype=np.int16
+    )
+    bits = (small[:, 1:] - small[:, :-1] > _DHASH_TOLERANCE).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def compute_stats(gray: np.ndarray) -> dict:
+    """Compute the cached per-image statistics for a grayscale frame.
+
+    Args:
+        gray: Grayscale array from load_gray().
+
+    Returns:
+        Dict with one entry per STAT_KEYS item, JSON-serializable.
+    """
+    return {
+        "dhash": f"{dhash(gray):016x}",
+        "luma": round(float(gray.mean()), 1),
+    }
+
+
+def image_stats(image_paths: list[Path]) -> list[dict]:
+    """Return cached statistics for each image, computing any that are missing.
+
+    Sidecars are read once per day. Images without a complete record are
+    decoded once -- from the 120px thumbnail when one exists, otherwise
+    via a draft-mode decode of the original -- and the new record is
+    appended to the sidecar so later runs reuse it. Thumbnails (in
+    thumbs/) share their original's record.
+
+    Args:
+        image_paths: Image paths, typically from collect_images().
+
+    Returns:
+        One stats dict per input path, in the same order.
+    """
+    day_stats: dict[Path, dict[str, dict]] = {}
+    unwritable: set[Path] = set()
+    results: list[dict] = []
+
+    for path in image_paths:
+        day_dir = path.parent.parent if path.parent.name == "thumbs" else path.parent
+        if day_dir not in day_stats:
+            day_stats[day_dir] = load_day_stats(day_dir)
+        stats = day_stats[day_dir].setdefault(path.name, {})
+
+        if not all(key in stats for key in STAT_KEYS):
+            thumb = day_dir / "thumbs" / path.name
+            source = thumb if thumb.is_file() else path
+            stats.update(compute_stats(load_gray(source)))
+            if day_dir not in unwritable:
+                try:
+                    append_stats(day_dir, path.name, stats)
+                except OSError as exc:
+                    # Read-only archive: still works, just not cached
+                    logger.debug("Cannot cache stats in %s: %s", day_dir, exc)
+                    unwritable.add(day_dir)
+
+        results.append(stats)
+
+    return results
@@ -5,20 +5,29 @@ Provides a unified interface for Pi Camera (picamera2) and USB webcam
 """
 
 from timelapse.camera.base import CameraBackend
+from timelapse.camera.burst import BurstCameraBackend
+from timelapse.camera.isolated import IsolatedCameraBackend
 from timelapse.camera.picamera import PiCameraBackend
 from timelapse.camera.usb import USBCameraBackend
 
 # detect_camera is imported after detect.py is created (Task 2).
 # Use a conditional import so the package works during incremental development.
 try:
-    from timelapse.camera.detect import capture_with_timeout, detect_camera
+    from timelapse.camera.detect import (
+        capture_with_timeout,
+        create_camera,
+        detect_camera,
+    )
 except ImportError:
     pass
 
 __all__ = [
+    "BurstCameraBackend",
     "CameraBackend",
+    "IsolatedCameraBackend",
     "PiCameraBackend",
     "USBCameraBackend",
+    "create_camera",
     "detect_camera",
     "capture_with_timeout",
 ]
@@ -10,14 +10,43 @@ class CameraBackend(ABC):
     Subclasses must implement open, capture, close, and is_available.
     The camera pipeline should be kept open between captures for minimal
     latency and stable auto-exposure.
+
+    Attributes:
+        last_encode: How the last capture() produced its JPEG: "native"
+            (the camera's or libcamera's encoder output written as-is) or
+            "software" (decoded frame re-encoded in Python).
+        last_fresh_ms: Milliseconds the last capture spent discarding
+            buffered frames and waiting for a freshly exposed one, or None
+            if the backend does not measure it.
     """
 
+    last_encode: str = "software"
+    last_fresh_ms: float | None = None
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Human-readable backend name for logging."""
         ...
 
+    @property
+    def device_id(self) -> str:
+        """Identifier of the physical device, used to name its lock file.
+
+        Backends that can drive more than one device override this.
+        """
+        return self.name
+
+    @property
+    def max_capture_seconds(self) -> float | None:
+        """Longest a capture can block before the backend gives up itself.
+
+        None for backends without a timeout of their own. Wrappers that
+        enforce one (subprocess isolation) override this so an outer
+        watchdog can wait longer than they do.
+        """
+        return None
+
     @abstractmethod
     def open(self) -> None:
         """Initialize and start the camera pipeline.
@@ -40,6 +69,48 @@ class CameraBackend(ABC):
         """
         ...
 
+    def capture_frame(self):
+        """Capture a single raw frame from the open pipeline.
+
+        Optional: only needed by features that operate on pixel data
+        (e.g. subprocess isolation). Backends that cannot provide raw
+        frames keep this default.
+
+        Returns:
+            A numpy array of shape (height, width, 3), dtype uint8, in
+            RGB channel order.
+
+        Raises:
+            NotImplementedError: If the backend does not support raw frames.
+        """
+        raise NotImplementedError(
+            f"{self.name} backend does not support raw frame capture"
+        )
+
+    def reconfigure(self, capture_cfg: dict) -> None:
+        """Apply reloaded capture settings (SIGHUP) to the open backend.
+
+        Optional: backends that cache a reloadable setting override this.
+        Settings that need the camera reopened require a daemon restart.
+
+        Args:
+            capture_cfg: The camera's new capture settings.
+        """
+
+    def set_exposure_value(self, ev: float) -> bool:
+        """Apply an exposure compensation offset for subsequent frames.
+
+        Optional: used for exposure-bracketed bursts. Backends without
+        exposure control keep this default.
+
+        Args:
+            ev: Exposure compensation in stops (0.0 = metered exposure).
+
+        Returns:
+            True if the offset was applied, False if unsupported.
+        """
+        return False
+
     @abstractmethod
     def close(self) -> None:
         """Release camera resources.
@@ -0,0 +1,228 @@
+"""Burst and exposure-bracket capture with in-process frame merging.
+
+Wraps a camera backend so that each capture grabs several frames from
+the already-open pipeline and merges them into a single JPEG:
+
+- mean:   noise-reducing average, accumulated one frame at a time
+- median: per-pixel median, robust to transient objects
+- fusion: exposure-bracketed frames blended by well-exposedness weights
+
+Memory is bounded for large (e.g. 4K) frames on the 256 MB MemoryMax
+cgroup: the mean is streamed into a uint16 accumulator, and the median
+and fusion modes hold at most max_memory_mb of frames and merge them in
+horizontal strips so float temporaries stay small.
+
+numpy is imported lazily (it ships with picamera2 and OpenCV).
+"""
+
+import logging
+from pathlib import Path
+
+from timelapse.camera.base import CameraBackend
+
+logger = logging.getLogger("timelapse.camera.burst")
+
+MERGE_MODES = ("mean", "median", "fusion")
+
+# Rows processed per strip in median/fusion merges
+_STRIP_ROWS = 64
+
+# Well-exposedness weight: gaussian around mid-grey (Mertens et al.)
+_FUSION_SIGMA = 0.2
+
+
+def merge_mean(frames) -> "numpy.ndarray":
+    """Average frames from an iterable, holding only one frame at a time.
+
+    Args:
+        frames: Iterable of equally-shaped uint8 arrays.
+
+    Returns:
+        The rounded mean as a uint8 array.
+    """
+    import numpy as np
+
+    acc = None
+    count = 0
+    for frame in frames:
+        if acc is None:
+            acc = frame.astype(np.uint16)
+        else:
+            acc += frame
+        # uint16 holds up to 257 full-white frames; config caps bursts at 64
+        count += 1
+
+    if acc is None:
+        raise ValueError("No frames to merge")
+
+    acc += count // 2
+    acc //= count
+    return acc.astype(np.uint8)
+
+
+def merge_median(frames: list) -> "numpy.ndarray":
+    """Per-pixel median of a list of frames, computed in row strips.
+
+    Args:
+        frames: List of equally-shaped uint8 arrays.
+
+    Returns:
+        The median as a uint8 array.
+    """
+    import numpy as np
+
+    out = np.empty_like(frames[0])
+    height = out.shape[0]
+    for top in range(0, height, _STRIP_ROWS):
+        bottom = min(top + _STRIP_ROWS, height)
+        strip = np.stack([f[top:bottom] for f in frames])
+        out[top:bottom] = np.median(strip, axis=0)
+    return out
+
+
+def merge_fusion(frames: list) -> "numpy.ndarray":
+    """Blend exposure-bracketed frames weighted by well-exposedness.
+
+    A single-scale variant of Mertens exposure fusion: each pixel's
+    weight is a gaussian of its luma distance from mid-grey, so the
+    best-exposed frame dominates in every region.
+
+    Args:
+        frames: List of equally-shaped uint8 RGB arrays.
+
+    Returns:
+        The fused image as a uint8 array.
+    """
+    import numpy as np
+
+    luma_coeffs = np.array([0.299, 0.587, 0.114], dtype=np.float32) / 255.0
+    out = np.empty_like(frames[0])
+    height = out.shape[0]
+    for top in range(0, height, _STRIP_ROWS):
+        bottom = min(top + _STRIP_ROWS, height)
+        strip = np.stack([f[top:bottom] for f in frames]).astype(np.float32)
+        luma = strip @ luma_coeffs
+        weights = np.exp(-((luma - 0.5) ** 2) / (2 * _FUSION_SIGMA**2)) + 1e-6
+        weights /= weights.sum(axis=0, keepdims=True)
+        fused = (strip * weights[..., np.newaxis]).sum(axis=0)
+        out[top:bottom] = np.clip(fused + 0.5, 0, 255)
+    return out
+
+
+class BurstCameraBackend(CameraBackend):
+    """Wrap a camera backend to capture and merge a burst per capture.
+
+    Args:
+        backend: The backend to draw frames from (must support capture_frame).
+        frames: Frames per capture for mean/median modes.
+        mode: One of MERGE_MODES.
+        bracket: EV offsets for fusion mode, one frame per entry.
+        max_memory_mb: Upper bound on frame data held at once for
+            median/fusion merges. The burst is shortened to fit.
+    """
+
+    def __init__(
+        self,
+        backend: CameraBackend,
+        frames: int = 3,
+        mode: str = "mean",
+        bracket: list[float] | None = None,
+        max_memory_mb: int = 96,
+    ):
+        if mode not in MERGE_MODES:
+            raise ValueError(f"Unknown burst mode: {mode!r}")
+        self._backend = backend
+        self._frames = frames
+        self._mode = mode
+        self._bracket = list(bracket) if bracket else [-1.0, 0.0, 1.0]
+        self._max_bytes = max_memory_mb * 1024 * 1024
+        self._bracket_warned = False
+
+    @property
+    def name(self) -> str:
+        return self._backend.name
+
+    @property
+    def device_id(self) -> str:
+        return self._backend.device_id
+
+    @property
+    def max_capture_seconds(self) -> float | None:
+        """The wrapped backend's bound for every frame and exposure change."""
+        per_call = self._backend.max_capture_seconds
+        if per_call is None:
+            return None
+        if self._mode == "fusion":
+            # One frame per offset, plus the EV probe and the EV 0 restore
+            return per_call * (2 * len(self._bracket) + 2)
+        return per_call * self._frames
+
+    def open(self) -> None:
+        self._backend.open()
+
+    def capture(self, output_path: Path, quality: int = 85) -> bool:
+        """Capture a burst, merge it, and save one JPEG."""
+        from PIL import Image
+
+        if self._mode == "mean":
+            merged = merge_mean(self._grab(self._frames))
+        elif self._mode == "median":
+            merged = merge_median(self._hold(self._grab(self._frames)))
+        else:
+            merged = merge_fusion(self._hold(self._grab_bracket()))
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(merged).save(str(output_path), quality=quality)
+        return True
+
+    def capture_frame(self):
+        return self._backend.capture_frame()
+
+    def close(self) -> None:
+        self._backend.close()
+
+    def is_available(self) -> bool:
+        return self._backend.is_available()
+
+    def _grab(self, count: int):
+        """Yield count frames from the wrapped backend, one at a time."""
+        for _ in range(count):
+            yield self._backend.capture_frame()
+
+    def _grab_bracket(self):
+        """Yield one frame per bracket EV offset, restoring EV 0 afterwards."""
+        if not self._backend.set_exposure_value(0.0):
+            if not self._bracket_warned:
+                logger.warning(
+                    "%s backend has no exposure control; fusing %d "
+                    "unbracketed frames",
+                    self._backend.name,
+                    len(self._bracket),
+                )
+                self._bracket_warned = True
+            yield from self._grab(len(self._bracket))
+            return
+
+        try:
+            for ev in self._bracket:
+                self._backend.set_exposure_value(ev)
+                yield self._backend.capture_frame()
+        finally:
+            self._backend.set_exposure_value(0.0)
+
+    def _hold(self, frames) -> list:
+        """Collect frames into a list, stopping at the memory budget."""
+        held = []
+        for frame in frames:
+            if held and (len(held) + 1) * frame.nbytes > self._max_bytes:
+                logger.warning(
+                    "Burst truncated to %d frames to stay within %d MB",
+                    len(held),
+                    self._max_bytes // (1024 * 1024),
+                )
+                # Close the generator so bracketing restores EV 0
+                if hasattr(frames, "close"):
+                    frames.close()
+                break
+            held.append(frame)
+        return held
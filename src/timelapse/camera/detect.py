@@ -1,12 +1,23 @@
 """Camera auto-detection and capture timeout wrapper.
 
 Provides a factory function that selects the appropriate camera backend
-based on configuration (auto, picamera, usb) and a timeout wrapper
-to prevent capture hangs.
+based on configuration (auto, picamera, usb), a builder that applies
+optional wrappers (subprocess isolation, burst merging), and a timeout
+wrapper to prevent capture hangs.
+
+Probing a Pi Camera instantiates Picamera2, which takes seconds, so
+availability results are cached in DETECT_CACHE_PATH. The cache is
+dropped whenever the set of /dev/video* and /dev/media* nodes changes
+(a camera plugged in or removed) and by invalidate_detection_cache(),
+which the daemon calls when a detected camera fails to open.
 """
 
+import glob
+import json
 import logging
+import os
 import threading
+import time
 from pathlib import Path
 
 from timelapse.camera.base import CameraBackend
@@ -15,6 +26,65 @@ from timelapse.camera.usb import USBCameraBackend
 
 logger = logging.getLogger("timelapse.camera.detect")
 
+DETECT_CACHE_PATH = Path("/tmp/timelapse-camera-detect.json")
+
+
+def _device_signature() -> list:
+    """Identify the current video/media device nodes.
+
+    Nodes are recreated on hotplug, so their change time is included.
+    """
+    signature = []
+    for path in sorted(glob.glob("/dev/video*") + glob.glob("/dev/media*")):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        signature.append([path, st.st_rdev, st.st_ctime_ns])
+    return signature
+
+
+def _load_cache(signature: list) -> dict:
+    """Return cached availability by device id, if the devices are unchanged."""
+    try:
+        with open(DETECT_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("devices") != signature:
+        return {}
+    return cache.get("available", {})
+
+
+def _probe(backend: CameraBackend) -> bool:
+    """Return backend.is_available(), cached while devices are unchanged."""
+    signature = _device_signature()
+    available = _load_cache(signature)
+    key = backend.device_id
+    if key in available:
+        logger.debug("Camera %s availability from cache: %s", key, available[key])
+        return available[key]
+
+    available[key] = backend.is_available()
+    tmp_path = DETECT_CACHE_PATH.with_name(f".{DETECT_CACHE_PATH.name}.{os.getpid()}")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"devices": signature, "available": available}, f)
+        os.replace(tmp_path, DETECT_CACHE_PATH)
+    except OSError as exc:
+        logger.debug("Could not write camera detection cache: %s", exc)
+    return available[key]
+
+
+def invalidate_detection_cache() -> None:
+    """Forget cached camera availability so the next detection probes again."""
+    try:
+        DETECT_CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.debug("Could not remove camera detection cache: %s", exc)
+
 
 def detect_camera(config: dict) -> CameraBackend:
     """Detect and instantiate the appropriate camera backend.
@@ -24,6 +94,14 @@ def detect_camera(config: dict) -> CameraBackend:
             - config["capture"]["source"]: "auto", "picamera", or "usb"
             - config["capture"]["resolution"]: [width, height]
             - config["capture"]["device_index"]: USB device index (optional, default 0)
+            - config["capture"]["native_jpeg"]: write the camera's own JPEG
+              encoding (optional, default False)
+            - config["capture"]["usb_fourcc"]: USB pixel format to request
+              (optional, default "MJPG")
+            - config["capture"]["usb_buffer_size"]: USB driver frame buffer
+              count (optional, default 1)
+            - config["capture"]["high_rate"]: stream at high_rate["fps"]
+              when high_rate["enabled"] (optional)
 
     Returns:
         An instance of CameraBackend (not yet opened).
@@ -36,10 +114,19 @@ def detect_camera(config: dict) -> CameraBackend:
     resolution_list = capture_cfg.get("resolution", [1920, 1080])
     resolution = (resolution_list[0], resolution_list[1])
     device_index = capture_cfg.get("device_index", 0)
+    native_jpeg = capture_cfg.get("native_jpeg", False)
+    # Captures below the configured quality (degraded mode) must re-encode
+    native_quality = capture_cfg.get("jpeg_quality", 85)
+    usb_fourcc = capture_cfg.get("usb_fourcc", "MJPG")
+    usb_buffer_size = capture_cfg.get("usb_buffer_size", 1)
+    high_rate = capture_cfg.get("high_rate", {})
+    frame_rate = high_rate.get("fps") if high_rate.get("enabled", False) else None
 
     if source == "picamera":
-        backend = PiCameraBackend(resolution=resolution)
-        if not backend.is_available():
+        backend = PiCameraBackend(
+            resolution=resolution, native_jpeg=native_jpeg, frame_rate=frame_rate
+        )
+        if not _probe(backend):
             raise RuntimeError(
                 "Pi Camera source requested but picamera2 is not available. "
                 "Ensure a Pi Camera Module is connected and picamera2 is installed."
@@ -49,9 +136,15 @@ def detect_camera(config: dict) -> CameraBackend:
 
     if source == "usb":
         backend = USBCameraBackend(
-            device_index=device_index, resolution=resolution
+            device_index=device_index,
+            resolution=resolution,
+            native_jpeg=native_jpeg,
+            native_quality=native_quality,
+            fourcc=usb_fourcc,
+            buffer_size=usb_buffer_size,
+            frame_rate=frame_rate,
         )
-        if not backend.is_available():
+        if not _probe(backend):
             raise RuntimeError(
                 f"USB camera source requested but no camera found at device index "
                 f"{device_index}. Ensure a USB webcam is connected."
@@ -60,15 +153,23 @@ def detect_camera(config: dict) -> CameraBackend:
         return backend
 
     # Auto-detection: try picamera2 first, then USB
-    pi_backend = PiCameraBackend(resolution=resolution)
-    if pi_backend.is_available():
+    pi_backend = PiCameraBackend(
+        resolution=resolution, native_jpeg=native_jpeg, frame_rate=frame_rate
+    )
+    if _probe(pi_backend):
         logger.info("Camera selected: picamera (auto-detected)")
         return pi_backend
 
     usb_backend = USBCameraBackend(
-        device_index=device_index, resolution=resolution
+        device_index=device_index,
+        resolution=resolution,
+        native_jpeg=native_jpeg,
+        native_quality=native_quality,
+        fourcc=usb_fourcc,
+        buffer_size=usb_buffer_size,
+        frame_rate=frame_rate,
     )
-    if usb_backend.is_available():
+    if _probe(usb_backend):
         logger.info("Camera selected: usb (auto-detected)")
         return usb_backend
 
@@ -80,11 +181,60 @@ def detect_camera(config: dict) -> CameraBackend:
     )
 
 
+def create_camera(config: dict) -> CameraBackend:
+    """Detect the camera backend and apply any configured wrappers.
+
+    Args:
+        config: Application configuration dict. Reads everything
+            detect_camera() reads, plus:
+            - config["capture"]["isolate"]: run the backend in a child process
+            - config["capture"]["isolate_timeout"]: seconds before the child
+              is killed
+            - config["capture"]["burst"]: burst/bracket merge settings
+
+    Returns:
+        An instance of CameraBackend (not yet opened).
+
+    Raises:
+        RuntimeError: If the requested camera is not available.
+    """
+    camera = detect_camera(config)
+    capture_cfg = config.get("capture", {})
+
+    if capture_cfg.get("isolate", False):
+        from timelapse.camera.isolated import IsolatedCameraBackend
+
+        resolution_list = capture_cfg.get("resolution", [1920, 1080])
+        camera = IsolatedCameraBackend(
+            camera,
+            resolution=(resolution_list[0], resolution_list[1]),
+            timeout=capture_cfg.get("isolate_timeout", 20),
+        )
+        logger.info("Camera backend isolated in a child process")
+
+    burst_cfg = capture_cfg.get("burst", {})
+    mode = burst_cfg.get("mode", "mean")
+    if burst_cfg.get("frames", 1) > 1 or mode == "fusion":
+        from timelapse.camera.burst import BurstCameraBackend
+
+        camera = BurstCameraBackend(
+            camera,
+            frames=burst_cfg.get("frames", 1),
+            mode=mode,
+            bracket=burst_cfg.get("bracket"),
+            max_memory_mb=burst_cfg.get("max_memory_mb", 96),
+        )
+        logger.info("Burst capture enabled (mode=%s)", mode)
+
+    return camera
+
+
 def capture_with_timeout(
     camera: CameraBackend,
     output_path: Path,
     quality: int = 85,
     timeout: int = 30,
+    stats: dict | None = None,
 ) -> bool:
     """Run a capture with a timeout to prevent hangs.
 
@@ -97,6 +247,10 @@ def capture_with_timeout(
         output_path: Full path for the output JPEG file.
         quality: JPEG quality (1-100).
         timeout: Maximum seconds to wait for capture. Default 30.
+        stats: If given, filled with "cpu_ms" (CPU time the capture thread
+            spent, i.e. frame retrieval and JPEG encoding), "encode" (the
+            backend's last_encode) and "fresh_ms" (its last_fresh_ms) once
+            the capture completes.
 
     Returns:
         True if capture succeeded within timeout, False otherwise.
@@ -105,10 +259,15 @@ def capture_with_timeout(
     exception = [None]
 
     def _do_capture():
+        started = time.thread_time()
         try:
             result[0] = camera.capture(output_path, quality)
         except Exception as exc:
             exception[0] = exc
+        if stats is not None:
+            stats["cpu_ms"] = (time.thread_time() - started) * 1000
+            stats["encode"] = camera.last_encode
+            stats["fresh_ms"] = camera.last_fresh_ms
 
     thread = threading.Thread(target=_do_capture, daemon=True)
     thread.start()
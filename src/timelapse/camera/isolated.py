@@ -0,0 +1,311 @@
+"""Subprocess-isolated camera backend.
+
+Runs a real camera backend in a child process. A capture that wedges
+inside V4L2 or libcamera C code cannot be cancelled by the thread-based
+timeout in capture_with_timeout(), but a child process can be SIGKILLed
+and respawned within seconds.
+
+Frames are passed back through a multiprocessing.shared_memory segment
+owned by the parent, so only a small (status, shape) tuple crosses the
+pipe per capture instead of megabytes of pickled pixel data. JPEG
+encoding happens in the parent.
+
+numpy is imported lazily (it ships with picamera2 and OpenCV).
+"""
+
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from pathlib import Path
+
+from timelapse.camera.base import CameraBackend
+
+logger = logging.getLogger("timelapse.camera.isolated")
+
+# Seconds to wait for the child to open the camera (picamera2 settles for 2s)
+_OPEN_TIMEOUT = 30
+
+# Seconds to wait for the child to exit after a close request
+_CLOSE_TIMEOUT = 5
+
+
+def _child_main(backend: CameraBackend, conn, shm_name: str) -> None:
+    """Child process entry point: own the camera and serve frame requests.
+
+    Protocol (parent -> child):
+        ("frame",)        capture a frame into shared memory
+        ("attach", name)  switch to a new (larger) shared memory segment
+        ("ev", value)     apply an exposure compensation offset
+        ("close",)        release the camera and exit
+
+    Replies (child -> parent):
+        ("ready", None)        camera opened
+        ("ok", shape)          frame written to shared memory
+        ("ok", applied)        exposure offset handled
+        ("resize", nbytes)     frame does not fit; parent must reallocate
+        ("error", message)     open or capture failed
+    """
+    import numpy as np
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        try:
+            backend.open()
+        except Exception as exc:
+            conn.send(("error", f"Camera open failed: {exc}"))
+            return
+        conn.send(("ready", None))
+
+        while True:
+            try:
+                msg = conn.recv()
+            except EOFError:
+                # Parent went away -- release the camera and exit
+                break
+
+            command = msg[0]
+            if command == "close":
+                break
+
+            if command == "attach":
+                shm.close()
+                shm = shared_memory.SharedMemory(name=msg[1])
+                conn.send(("ok", None))
+                continue
+
+            if command == "ev":
+                try:
+                    conn.send(("ok", backend.set_exposure_value(msg[1])))
+                except Exception as exc:
+                    conn.send(("error", str(exc)))
+                continue
+
+            if command == "frame":
+                try:
+                    frame = backend.capture_frame()
+                except Exception as exc:
+                    conn.send(("error", str(exc)))
+                    continue
+                if frame.nbytes > shm.size:
+                    conn.send(("resize", frame.nbytes))
+                    continue
+                view = np.ndarray(frame.shape, dtype=np.uint8, buffer=shm.buf)
+                view[...] = frame
+                # Release the buffer export so the segment can be closed later
+                del view
+                conn.send(("ok", frame.shape))
+    finally:
+        try:
+            backend.close()
+        finally:
+            shm.close()
+            conn.close()
+
+
+class IsolatedCameraBackend(CameraBackend):
+    """Wrap a camera backend so it runs in a killable child process.
+
+    Args:
+        backend: The real (unopened) backend. It is pickled into the
+            child, so it must not hold open hardware handles.
+        resolution: Expected frame size, used to size the shared memory
+            segment. The segment grows automatically if frames are larger.
+        timeout: Seconds to wait for a frame before SIGKILLing the child.
+    """
+
+    def __init__(
+        self,
+        backend: CameraBackend,
+        resolution: tuple[int, int] = (1920, 1080),
+        timeout: float = 20,
+    ):
+        self._backend = backend
+        self._frame_bytes = resolution[0] * resolution[1] * 3
+        self._timeout = timeout
+        self._process = None
+        self._conn = None
+        self._shm = None
+
+    @property
+    def name(self) -> str:
+        return self._backend.name
+
+    @property
+    def max_capture_seconds(self) -> float:
+        """A respawn plus two frame requests (the second after a resize)."""
+        return _OPEN_TIMEOUT + 2 * self._timeout
+
+    @property
+    def device_id(self) -> str:
+        return self._backend.device_id
+
+    def open(self) -> None:
+        """Spawn the child process and wait for it to open the camera."""
+        self._start()
+
+    def capture(self, output_path: Path, quality: int = 85) -> bool:
+        """Capture a frame in the child and encode it to JPEG in the parent."""
+        from PIL import Image
+
+        frame = self.capture_frame()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(frame).save(str(output_path), quality=quality)
+        return True
+
+    def capture_frame(self):
+        """Request a frame from the child via shared memory.
+
+        Respawns the child if it is not running (e.g. after a previous
+        timeout). On timeout the child is SIGKILLed.
+
+        Raises:
+            TimeoutError: If the child does not deliver a frame in time.
+            RuntimeError: If the child reports an error or dies.
+        """
+        import numpy as np
+
+        if self._process is None or not self._process.is_alive():
+            logger.warning("Camera process not running, respawning")
+            self._stop()
+            self._start()
+
+        for _ in range(2):
+            self._conn.send(("frame",))
+            reply = self._recv(self._timeout)
+
+            if reply is None:
+                logger.error(
+                    "Camera process did not deliver a frame within %.0fs, "
+                    "killing pid %d",
+                    self._timeout,
+                    self._process.pid,
+                )
+                self._kill()
+                raise TimeoutError(
+                    f"Capture timed out after {self._timeout:.0f}s in camera process"
+                )
+
+            status, payload = reply
+            if status == "ok":
+                view = np.ndarray(payload, dtype=np.uint8, buffer=self._shm.buf)
+                frame = view.copy()
+                del view
+                return frame
+            if status == "resize":
+                self._resize(payload)
+                continue
+            raise RuntimeError(payload)
+
+        raise RuntimeError("Camera process could not fit frame in shared memory")
+
+    def set_exposure_value(self, ev: float) -> bool:
+        """Forward an exposure offset to the backend in the child."""
+        if self._process is None or not self._process.is_alive():
+            return False
+        self._conn.send(("ev", ev))
+        reply = self._recv(self._timeout)
+        if reply is None:
+            self._kill()
+            raise TimeoutError("Camera process did not apply exposure in time")
+        if reply[0] == "error":
+            raise RuntimeError(reply[1])
+        return reply[1]
+
+    def close(self) -> None:
+        """Ask the child to release the camera and exit. Safe to call multiple times."""
+        self._stop()
+
+    def is_available(self) -> bool:
+        """Delegate to the wrapped backend."""
+        return self._backend.is_available()
+
+    # -- Child process management ------------------------------------------
+
+    def _start(self) -> None:
+        """Allocate shared memory, spawn the child, and wait for it to be ready."""
+        # spawn (not fork) so the child starts with clean libcamera/V4L2 state
+        ctx = multiprocessing.get_context("spawn")
+        self._shm = shared_memory.SharedMemory(create=True, size=self._frame_bytes)
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_child_main,
+            args=(self._backend, child_conn, self._shm.name),
+            name=f"timelapse-camera-{self._backend.name}",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        reply = self._recv(_OPEN_TIMEOUT)
+        if reply is None:
+            self._kill()
+            raise RuntimeError(
+                f"Camera process did not open camera within {_OPEN_TIMEOUT}s"
+            )
+        if reply[0] == "error":
+            self._stop()
+            raise RuntimeError(reply[1])
+
+        logger.info(
+            "Camera process started (%s, pid %d)",
+            self._backend.name,
+            self._process.pid,
+        )
+
+    def _resize(self, nbytes: int) -> None:
+        """Replace the shared memory segment with one of at least nbytes."""
+        logger.info(
+            "Growing camera shared memory from %d to %d bytes",
+            self._shm.size,
+            nbytes,
+        )
+        new_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._conn.send(("attach", new_shm.name))
+        reply = self._recv(self._timeout)
+        self._release_shm()
+        self._shm = new_shm
+        self._frame_bytes = nbytes
+        if reply is None or reply[0] != "ok":
+            self._kill()
+            raise RuntimeError("Camera process failed to attach shared memory")
+
+    def _recv(self, timeout: float):
+        """Wait for a reply from the child. Returns None on timeout or child exit."""
+        try:
+            if self._conn.poll(timeout):
+                return self._conn.recv()
+        except (EOFError, OSError):
+            pass
+        return None
+
+    def _stop(self) -> None:
+        """Gracefully stop the child, escalating to SIGKILL if it hangs."""
+        if self._process is not None:
+            try:
+                self._conn.send(("close",))
+            except (OSError, ValueError):
+                pass
+            self._process.join(_CLOSE_TIMEOUT)
+        self._kill()
+
+    def _kill(self) -> None:
+        """SIGKILL the child (if alive) and release IPC resources."""
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join(_CLOSE_TIMEOUT)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._release_shm()
+
+    def _release_shm(self) -> None:
+        """Close and unlink the parent-owned shared memory segment."""
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
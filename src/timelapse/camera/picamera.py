@@ -4,8 +4,18 @@ Uses picamera2 (the official Raspberry Pi camera library) for capture.
 All picamera2 imports are lazy so this module is importable on machines
 without picamera2 installed.
 
-CRITICAL: Uses capture_image() + PIL Image.save(quality=N) for JPEG
-quality control. capture_file() has no quality parameter.
+CRITICAL: By default uses capture_image() + PIL Image.save(quality=N)
+for JPEG quality control. capture_file() has no quality parameter.
+
+With native_jpeg, capture_file() encodes straight from the camera's
+buffer with picamera2's own libjpeg-turbo encoder, at the quality set
+through Picamera2.options["quality"], skipping the PIL image copy and
+PIL's encoder. The requested quality is always honoured on this path.
+
+With a frame_rate (high-rate capture), the camera runs a video
+configuration at that rate instead of the still one, and each capture
+takes the next frame from the running stream, so the stream paces the
+capture loop.
 """
 
 import logging
@@ -15,12 +25,29 @@ from timelapse.camera.base import CameraBackend
 
 logger = logging.getLogger("timelapse.camera.picamera")
 
+# Frames to drop after changing controls before they reach the output
+_CONTROL_SETTLE_FRAMES = 3
 
-class PiCameraBackend(CameraBackend):
-    """Camera backend for Raspberry Pi Camera Modules via picamera2."""
 
-    def __init__(self, resolution: tuple[int, int] = (1920, 1080)):
+class PiCameraBackend(CameraBackend):
+    """Camera backend for Raspberry Pi Camera Modules via picamera2.
+
+    Args:
+        resolution: Requested (width, height).
+        native_jpeg: Encode with picamera2's JPEG encoder instead of PIL.
+        frame_rate: Stream frames at this rate for high-rate capture, or
+            None for still captures.
+    """
+
+    def __init__(
+        self,
+        resolution: tuple[int, int] = (1920, 1080),
+        native_jpeg: bool = False,
+        frame_rate: float | None = None,
+    ):
         self._resolution = resolution
+        self._native_jpeg = native_jpeg
+        self._frame_rate = frame_rate
         self._camera = None
 
     @property
@@ -34,17 +61,25 @@ class PiCameraBackend(CameraBackend):
         from picamera2 import Picamera2
 
         self._camera = Picamera2()
-        config = self._camera.create_still_configuration(
-            main={"size": self._resolution}
-        )
+        if self._frame_rate is not None:
+            # BGR888 keeps the [R, G, B] layout capture_frame() documents
+            config = self._camera.create_video_configuration(
+                main={"size": self._resolution, "format": "BGR888"},
+                controls={"FrameRate": self._frame_rate},
+            )
+        else:
+            config = self._camera.create_still_configuration(
+                main={"size": self._resolution}
+            )
         self._camera.configure(config)
         self._camera.start()
         # Allow auto-exposure and auto-white-balance to settle
         time.sleep(2)
         logger.info(
-            "Pi Camera opened at %dx%d",
+            "Pi Camera opened at %dx%d%s",
             self._resolution[0],
             self._resolution[1],
+            f", streaming at {self._frame_rate:g} fps" if self._frame_rate else "",
         )
 
     def capture(self, output_path: Path, quality: int = 85) -> bool:
@@ -53,10 +88,38 @@ class PiCameraBackend(CameraBackend):
         Uses capture_image("main") to get a PIL Image, then saves with
         the specified quality parameter. This is the only way to control
         JPEG quality with picamera2 (capture_file has no quality param).
+
+        With native_jpeg, capture_file() writes picamera2's own encoding,
+        with the quality passed through Picamera2.options.
         """
-        img = self._camera.capture_image("main")
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._native_jpeg:
+            self._camera.options["quality"] = quality
+            self._camera.capture_file(str(output_path), name="main", format="jpeg")
+            self.last_encode = "native"
+            return True
+        img = self._camera.capture_image("main")
         img.save(str(output_path), quality=quality)
+        self.last_encode = "software"
+        return True
+
+    def capture_frame(self):
+        """Capture a raw RGB frame from the main stream.
+
+        The default still configuration uses the BGR888 format, which
+        picamera2 lays out in memory as [R, G, B].
+        """
+        return self._camera.capture_array("main")
+
+    def set_exposure_value(self, ev: float) -> bool:
+        """Set the libcamera ExposureValue control and let it take effect.
+
+        Controls apply a few frames after being set, so drop frames until
+        the new exposure reaches the output.
+        """
+        self._camera.set_controls({"ExposureValue": ev})
+        for _ in range(_CONTROL_SETTLE_FRAMES):
+            self._camera.capture_metadata()
         return True
 
     def close(self) -> None:
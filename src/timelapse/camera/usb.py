@@ -7,36 +7,88 @@ without OpenCV installed.
 CRITICAL: This backend is for USB webcams ONLY. OpenCV does NOT work
 with Pi Camera Modules on Raspberry Pi OS Bookworm (libcamera
 incompatibility -- see opencv/opencv#21653).
+
+With native_jpeg, the webcam is switched to MJPEG and OpenCV's RGB
+conversion is turned off, so each read returns the camera's compressed
+frame and capture() writes those bytes unchanged -- no decode or
+re-encode on the Pi. The webcam's compression level cannot be set, so
+captures requested below native_quality (e.g. degraded capture under
+storage pressure) are decoded and re-encoded in software instead.
+
+V4L2 queues several frames, so a single read() can return one exposed
+seconds ago. The backend asks for MJPG (which also lifts YUYV's
+bandwidth limit at high resolutions) and a small driver buffer, then
+drains it before each capture: frames are grabbed until one has to be
+waited for, meaning it was exposed after the capture was requested,
+and only that frame is decoded.
+
+With a frame_rate (high-rate capture), the webcam is asked for that
+rate and every streamed frame is wanted, so nothing is drained: each
+capture reads the next frame and the stream paces the capture loop.
 """
 
 import logging
+import time
 from pathlib import Path
 
 from timelapse.camera.base import CameraBackend
 
 logger = logging.getLogger("timelapse.camera.usb")
 
+# Frame period assumed when the driver does not report a frame rate
+_DEFAULT_FRAME_PERIOD = 1 / 30
+
 
 class USBCameraBackend(CameraBackend):
-    """Camera backend for USB webcams via OpenCV."""
+    """Camera backend for USB webcams via OpenCV.
+
+    Args:
+        device_index: V4L2 device index.
+        resolution: Requested (width, height).
+        native_jpeg: Write the webcam's own MJPEG frames directly.
+        native_quality: Lowest requested quality served by native frames.
+        fourcc: Pixel format to request (e.g. "MJPG"), or None to keep the
+            driver default. native_jpeg always requests MJPG.
+        buffer_size: Driver frame buffer count to request.
+        frame_rate: Frame rate to request for high-rate capture, or None
+            to keep the driver default and drain stale frames.
+    """
 
     def __init__(
         self,
         device_index: int = 0,
         resolution: tuple[int, int] = (1920, 1080),
+        native_jpeg: bool = False,
+        native_quality: int = 85,
+        fourcc: str | None = "MJPG",
+        buffer_size: int = 1,
+        frame_rate: float | None = None,
     ):
         self._device_index = device_index
         self._resolution = resolution
+        self._native_jpeg = native_jpeg
+        self._native_quality = native_quality
+        self._fourcc = "MJPG" if native_jpeg else fourcc
+        self._buffer_size = buffer_size
+        self._frame_rate = frame_rate
+        self._frame_period = _DEFAULT_FRAME_PERIOD
+        self._mjpeg = False
         self._cap = None
 
     @property
     def name(self) -> str:
         return "usb"
 
-    def open(self) -> None:
-        """Open the USB webcam and configure resolution."""
-        import time
+    def reconfigure(self, capture_cfg: dict) -> None:
+        """Follow a reloaded jpeg_quality for native passthrough."""
+        self._native_quality = capture_cfg.get("jpeg_quality", self._native_quality)
 
+    @property
+    def device_id(self) -> str:
+        return f"usb{self._device_index}"
+
+    def open(self) -> None:
+        """Open the USB webcam and negotiate format, resolution and buffering."""
         import cv2
 
         self._cap = cv2.VideoCapture(self._device_index, cv2.CAP_V4L2)
@@ -44,26 +96,92 @@ class USBCameraBackend(CameraBackend):
             raise RuntimeError(
                 f"Cannot open USB camera at device index {self._device_index}"
             )
+        if self._fourcc:
+            # FOURCC must be set before the frame size
+            self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self._fourcc))
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._resolution[0])
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._resolution[1])
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, self._buffer_size)
+        if self._frame_rate is not None:
+            self._cap.set(cv2.CAP_PROP_FPS, self._frame_rate)
+
+        code = int(self._cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+        if self._fourcc and fourcc != self._fourcc:
+            logger.warning(
+                "USB camera did not accept %s, using %r", self._fourcc, fourcc
+            )
+        fps = self._cap.get(cv2.CAP_PROP_FPS)
+        self._frame_period = 1 / fps if fps > 0 else _DEFAULT_FRAME_PERIOD
+
+        self._mjpeg = False
+        if self._native_jpeg:
+            if fourcc == "MJPG":
+                self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+                self._mjpeg = True
+            else:
+                logger.warning(
+                    "USB camera does not deliver MJPEG, using software JPEG encoding"
+                )
         # Allow auto-exposure to settle
         time.sleep(0.5)
         logger.info(
-            "USB camera opened at index %d (%dx%d)",
+            "USB camera opened at index %d (%dx%d, %s, %.0f fps)",
             self._device_index,
             self._resolution[0],
             self._resolution[1],
+            fourcc,
+            1 / self._frame_period,
         )
 
+    def _read_fresh(self):
+        """Drain buffered frames and return (ok, frame) for a fresh one.
+
+        A grab that returns in well under a frame period came from the
+        driver's queue; one that blocks waited for a new exposure. At most
+        buffer_size + 1 grabs are made, in case the driver ignored the
+        requested buffer size. Sets last_fresh_ms.
+
+        When streaming at a fixed frame_rate, the next frame is read as-is.
+        """
+        if self._frame_rate is not None:
+            return self._cap.read()
+        started = time.monotonic()
+        for _ in range(self._buffer_size + 1):
+            grab_start = time.monotonic()
+            if not self._cap.grab():
+                return False, None
+            if time.monotonic() - grab_start >= self._frame_period / 2:
+                break
+        self.last_fresh_ms = (time.monotonic() - started) * 1000
+        return self._cap.retrieve()
+
     def capture(self, output_path: Path, quality: int = 85) -> bool:
-        """Capture a JPEG frame using cv2.imwrite with IMWRITE_JPEG_QUALITY."""
+        """Capture a JPEG frame.
+
+        Writes the webcam's MJPEG bytes when native passthrough is active
+        and quality allows it, otherwise encodes with cv2.imwrite and
+        IMWRITE_JPEG_QUALITY.
+        """
         import cv2
 
-        ret, frame = self._cap.read()
+        ret, frame = self._read_fresh()
         if not ret:
             logger.error("Failed to read frame from USB camera")
             return False
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._mjpeg:
+            data = frame.tobytes()
+            if quality >= self._native_quality and data[:2] == b"\xff\xd8":
+                with open(output_path, "wb") as f:
+                    f.write(data)
+                self.last_encode = "native"
+                return True
+            frame = cv2.imdecode(frame, cv2.IMREAD_COLOR)
+            if frame is None:
+                logger.error("Failed to decode MJPEG frame from USB camera")
+                return False
+        self.last_encode = "software"
         cv2.imwrite(
             str(output_path),
             frame,
@@ -71,6 +189,19 @@ class USBCameraBackend(CameraBackend):
         )
         return True
 
+    def capture_frame(self):
+        """Capture a raw frame, converted from OpenCV's BGR to RGB order."""
+        import cv2
+
+        ret, frame = self._read_fresh()
+        if not ret:
+            raise RuntimeError("Failed to read frame from USB camera")
+        if self._mjpeg:
+            frame = cv2.imdecode(frame, cv2.IMREAD_COLOR)
+            if frame is None:
+                raise RuntimeError("Failed to decode MJPEG frame from USB camera")
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
     def close(self) -> None:
         """Release the capture device. Safe to call multiple times."""
         if self._cap is not None:
@@ -0,0 +1,221 @@
+"""Per-camera capture state for the capture daemon.
+
+The daemon runs one CameraChannel per configured camera (see
+timelapse.config.camera_configs). A channel owns its camera backend,
+its image root, its adaptive interval, its next capture slot, its
+failure/backoff state, and the figures reported for it in the status
+file. The daemon's timer heap decides which channel captures next.
+"""
+
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from timelapse.camera.base import CameraBackend
+from timelapse.metrics import summarize_ms
+from timelapse.scheduler import AdaptiveInterval, SlotTracker, next_slot
+
+# Captures averaged for the CPU and fresh-frame times in the status file
+_CPU_SAMPLES = 100
+
+
+def create_adaptive(capture_cfg: dict) -> AdaptiveInterval | None:
+    """Build the adaptive interval scheduler if enabled in capture settings."""
+    adaptive_cfg = capture_cfg["adaptive"]
+    if not adaptive_cfg.get("enabled", False):
+        return None
+    return AdaptiveInterval(
+        base_interval=capture_cfg["interval"],
+        min_interval=adaptive_cfg["min_interval"],
+        max_interval=adaptive_cfg["max_interval"],
+        active_threshold=adaptive_cfg["active_threshold"],
+        static_threshold=adaptive_cfg["static_threshold"],
+    )
+
+
+class CameraChannel:
+    """One camera and its capture state.
+
+    Args:
+        name: Camera name from the config ("default" for a single camera).
+        capture_cfg: The camera's full capture settings.
+        subdir: Directory under each storage tier root holding this
+            camera's images, or None for the root itself.
+        output_dir: Primary storage root.
+        camera: The (unopened) camera backend.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capture_cfg: dict,
+        subdir: str | None,
+        output_dir: Path,
+        camera: CameraBackend,
+    ):
+        self.name = name
+        self.capture_cfg = capture_cfg
+        self.subdir = subdir
+        self.root = self.tier_root(output_dir)
+        self.camera = camera
+        self.adaptive = create_adaptive(capture_cfg)
+
+        # Wall-clock time (epoch seconds) of the next capture slot
+        self.slot: float | None = None
+        self.slots = SlotTracker()
+        # Slots skipped just before the current one (for the capture trace)
+        self.missed_before = 0
+
+        # Failure tracking; a failed camera is closed and reopened when
+        # its backoff expires
+        self.consecutive_failures = 0
+        self.needs_reopen = False
+        self.backoff = 0.0
+
+        self.captures_today = 0
+        self.last_capture: str | None = None
+        self.last_capture_success: bool | None = None
+
+        # Change scoring against the previous capture (drives adaptive interval)
+        self.previous_gray = None
+        self.last_change_score: float | None = None
+
+        # Capture thread CPU time per encode path ("native" / "software")
+        self.capture_cpu: dict[str, deque] = {
+            "native": deque(maxlen=_CPU_SAMPLES),
+            "software": deque(maxlen=_CPU_SAMPLES),
+        }
+        self.last_encode: str | None = None
+
+        # Time spent draining stale buffered frames (backends that measure it)
+        self.fresh_ms: deque = deque(maxlen=_CPU_SAMPLES)
+
+        # Monotonic time of the last cleanup and forecast after a capture
+        # (throttled in high-rate mode)
+        self.housekeeping_at: float | None = None
+
+    def tier_root(self, tier_dir: Path) -> Path:
+        """Return this camera's image root within a storage tier."""
+        return Path(tier_dir) / self.subdir if self.subdir else Path(tier_dir)
+
+    @property
+    def high_rate(self) -> bool:
+        """Whether the camera streams frames for high-rate capture."""
+        return self.capture_cfg["high_rate"]["enabled"]
+
+    def reconfigure(self, capture_cfg: dict) -> None:
+        """Apply reloaded capture settings (interval, quality, adaptive)."""
+        self.capture_cfg = capture_cfg
+        self.adaptive = create_adaptive(capture_cfg)
+        self.camera.reconfigure(capture_cfg)
+
+    def interval(self, degraded_factor: float | None = None) -> float:
+        """Seconds until the next capture: adaptive if enabled, else configured.
+
+        In high-rate mode this is the nominal frame period; the camera's
+        frame stream sets the actual pace.
+
+        Args:
+            degraded_factor: Multiplier applied under storage pressure, or
+                None when not degraded.
+        """
+        if self.high_rate:
+            interval = 1 / self.capture_cfg["high_rate"]["fps"]
+        elif self.adaptive is not None:
+            interval = self.adaptive.interval
+        else:
+            interval = self.capture_cfg["interval"]
+        if degraded_factor is not None:
+            interval *= degraded_factor
+        return interval
+
+    def advance(self, now: float, degraded_factor: float | None = None) -> float:
+        """Move to the next capture slot and return it (epoch seconds).
+
+        A slot already more than half an interval in the past is skipped
+        in favour of the nearer next one and counted as missed. While the
+        camera is backing off after a failure, every slot before the
+        backoff expires is missed. In high-rate mode there are no slots:
+        the next capture is due at once and blocks on the frame stream.
+
+        Args:
+            now: Current wall-clock time.
+            degraded_factor: Interval multiplier under storage pressure.
+        """
+        if self.high_rate:
+            self.slot = now + self.backoff if self.needs_reopen else now
+            self.missed_before = 0
+            return self.slot
+
+        interval = self.interval(degraded_factor)
+        align = self.capture_cfg["align_slots"]
+
+        if self.slot is None or self.slot - now > interval:
+            # First slot, or the clock was stepped back: start a new grid
+            slot = next_slot(now, interval, align) if align else now
+        else:
+            slot = next_slot(self.slot, interval, align)
+
+        if self.needs_reopen:
+            earliest = now + self.backoff
+        else:
+            earliest = now - interval / 2
+        missed = 0
+        while slot < earliest:
+            missed += 1
+            slot = next_slot(slot, interval, align)
+        self.slots.skip(missed)
+        self.missed_before = missed
+
+        self.slot = slot
+        return slot
+
+    def record_capture(self, now: datetime, stats: dict) -> None:
+        """Update counters and timing samples after a successful capture.
+
+        Args:
+            now: Capture timestamp.
+            stats: Filled by capture_with_timeout().
+        """
+        self.last_capture = now.isoformat()
+        self.consecutive_failures = 0
+        self.captures_today += 1
+        self.last_capture_success = True
+        if "cpu_ms" in stats:
+            self.last_encode = stats["encode"]
+            self.capture_cpu[self.last_encode].append(stats["cpu_ms"])
+        if stats.get("fresh_ms") is not None:
+            self.fresh_ms.append(stats["fresh_ms"])
+
+    def status(self, degraded_factor: float | None = None) -> dict:
+        """Per-camera fields for the status file."""
+        return {
+            "camera": self.camera.name,
+            "device": self.camera.device_id,
+            "last_capture": self.last_capture,
+            "last_capture_success": self.last_capture_success,
+            "consecutive_failures": self.consecutive_failures,
+            "captures_today": self.captures_today,
+            "capture_interval": round(self.interval(degraded_factor), 1),
+            "change_score": (
+                round(self.last_change_score, 2)
+                if self.last_change_score is not None
+                else None
+            ),
+            "next_slot": (
+                datetime.fromtimestamp(self.slot).isoformat(timespec="seconds")
+                if self.slot is not None
+                else None
+            ),
+            "slots": self.slots.summary(),
+            "fresh_frame_ms": summarize_ms(self.fresh_ms),
+            "capture_cpu": {
+                "encode": self.last_encode,
+                **{
+                    f"{path}_ms": (
+                        round(sum(samples) / len(samples), 1) if samples else None
+                    )
+                    for path, samples in self.capture_cpu.items()
+                },
+            },
+        }
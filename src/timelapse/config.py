@@ -1,5 +1,6 @@
 """YAML configuration loading with validation and defaults."""
 
+import re
 from pathlib import Path
 
 import yaml
@@ -8,27 +9,117 @@ import yaml
 DEFAULTS = {
     "capture": {
         "interval": 60,
+        "align_slots": True,
         "source": "auto",
         "jpeg_quality": 85,
         "resolution": [1920, 1080],
+        "isolate": False,
+        "native_jpeg": False,
+        "usb_fourcc": "MJPG",
+        "usb_buffer_size": 1,
+        "isolate_timeout": 20,
+        "burst": {
+            "frames": 1,
+            "mode": "mean",
+            "bracket": [-1.0, 0.0, 1.0],
+            "max_memory_mb": 96,
+        },
+        "adaptive": {
+            "enabled": False,
+            "min_interval": 10,
+            "max_interval": 300,
+            "active_threshold": 4.0,
+            "static_threshold": 1.0,
+        },
+        "high_rate": {
+            "enabled": False,
+            "fps": 5,
+        },
     },
     "storage": {
         "output_dir": "~/timelapse-images",
         "stop_threshold": 90,
         "warn_threshold": 85,
+        "disk_sample_ttl": 30,
+        "status_dir": None,
+        "status_min_interval": 60,
+        "status_socket": "/run/timelapse/status.sock",
+        "dir_sync_every": 10,
+        "dir_sync_interval": 300,
         "cleanup_enabled": False,
         "retention_days": 30,
+        "previews_enabled": True,
+        "preview_duration": 10,
+        "tier_dir": None,
+        "tier_after_days": 14,
+        "tier_max_rate_mb": 8,
+        "compact_enabled": False,
+        "compact_after_days": 7,
+        "compact_quality": 60,
+        "compact_max_width": None,
+        "compact_workers": 2,
+        "forecast_horizon_hours": 48,
+        "degraded_quality": 60,
+        "degraded_interval_factor": 2.0,
     },
+    # Optional list of cameras run by one daemon; empty means the single
+    # camera described by "capture". See camera_configs().
+    "cameras": [],
     "logging": {
         "gap_tracking": False,
+        "capture_trace": True,
+    },
+    "metrics": {
+        "enabled": True,
+        "interval": 30,
+        "profile_cycles": 20,
     },
     "web": {
         "port": 8080,
         "host": "0.0.0.0",
+        "jobs": {
+            "dir": None,
+            "nice": 19,
+            "threads": 1,
+            "keep": 10,
+            "max_age_days": 14,
+        },
     },
 }
 
 
+# Keys of a cameras[] entry that are not capture settings
+_CAMERA_KEYS = ("name", "subdir")
+
+
+def camera_configs(config: dict) -> list[dict]:
+    """Return the cameras the daemon should run.
+
+    Each entry of config["cameras"] may override any capture setting; the
+    rest are inherited from config["capture"]. Without a cameras list, the
+    single camera from config["capture"] is returned, storing images at
+    the root of the output directory as before.
+
+    Returns:
+        List of dicts with keys name, subdir (relative directory under
+        the output directory and storage tiers, or None for their root),
+        and capture (the camera's full capture settings).
+    """
+    if not config["cameras"]:
+        return [{"name": "default", "subdir": None, "capture": config["capture"]}]
+    return [
+        {
+            "name": camera["name"],
+            "subdir": camera.get("subdir", camera["name"]),
+            "capture": _deep_merge(
+                config["capture"],
+                {k: v for k, v in camera.items() if k not in _CAMERA_KEYS},
+            ),
+        }
+        for camera in config["cameras"]
+    ]
+
+
 def _deep_merge(base: dict, override: dict) -> dict:
     """Deep-merge override into base. Returns a new dict."""
     result = base.copy()
@@ -44,6 +135,7 @@ def _validate(config: dict) -> None:
     """Validate configuration values. Raises SystemExit on invalid config."""
     capture = config.get("capture", {})
     storage = config.get("storage", {})
+    web = config.get("web", {})
 
     interval = capture.get("interval")
     if not isinstance(interval, (int, float)) or interval <= 0:
@@ -57,6 +149,117 @@ def _validate(config: dict) -> None:
             f"Invalid capture.jpeg_quality: {quality!r} (must be an integer 1-100)"
         )
 
+    if not isinstance(capture.get("align_slots"), bool):
+        raise SystemExit(
+            f"Invalid capture.align_slots: {capture.get('align_slots')!r} "
+            "(must be true or false)"
+        )
+
+    if not isinstance(capture.get("native_jpeg"), bool):
+        raise SystemExit(
+            f"Invalid capture.native_jpeg: {capture.get('native_jpeg')!r} "
+            "(must be true or false)"
+        )
+
+    usb_fourcc = capture.get("usb_fourcc")
+    if usb_fourcc is not None and (not isinstance(usb_fourcc, str) or len(usb_fourcc) != 4):
+        raise SystemExit(
+            f"Invalid capture.usb_fourcc: {usb_fourcc!r} "
+            "(must be a four-character code such as \"MJPG\", or null)"
+        )
+
+    usb_buffer_size = capture.get("usb_buffer_size")
+    if not isinstance(usb_buffer_size, int) or usb_buffer_size < 1:
+        raise SystemExit(
+            f"Invalid capture.usb_buffer_size: {usb_buffer_size!r} "
+            "(must be a positive integer)"
+        )
+
+    isolate_timeout = capture.get("isolate_timeout")
+    if not isinstance(isolate_timeout, (int, float)) or isolate_timeout <= 0:
+        raise SystemExit(
+            f"Invalid capture.isolate_timeout: {isolate_timeout!r} "
+            "(must be a positive number)"
+        )
+
+    burst = capture.get("burst", {})
+    frames = burst.get("frames")
+    if not isinstance(frames, int) or not (1 <= frames <= 64):
+        raise SystemExit(
+            f"Invalid capture.burst.frames: {frames!r} (must be an integer 1-64)"
+        )
+
+    mode = burst.get("mode")
+    if mode not in ("mean", "median", "fusion"):
+        raise SystemExit(
+            f"Invalid capture.burst.mode: {mode!r} "
+            "(must be 'mean', 'median', or 'fusion')"
+        )
+
+    bracket = burst.get("bracket")
+    if (
+        not isinstance(bracket, list)
+        or not bracket
+        or not all(isinstance(ev, (int, float)) for ev in bracket)
+    ):
+        raise SystemExit(
+            f"Invalid capture.burst.bracket: {bracket!r} "
+            "(must be a non-empty list of EV offsets)"
+        )
+
+    max_memory_mb = burst.get("max_memory_mb")
+    if not isinstance(max_memory_mb, (int, float)) or max_memory_mb <= 0:
+        raise SystemExit(
+            f"Invalid capture.burst.max_memory_mb: {max_memory_mb!r} "
+            "(must be a positive number)"
+        )
+
+    adaptive = capture.get("adaptive", {})
+    if not isinstance(adaptive.get("enabled"), bool):
+        raise SystemExit(
+            f"Invalid capture.adaptive.enabled: {adaptive.get('enabled')!r} "
+            "(must be true or false)"
+        )
+    for key in ("min_interval", "max_interval", "active_threshold", "static_threshold"):
+        value = adaptive.get(key)
+        if not isinstance(value, (int, float)) or value <= 0:
+            raise SystemExit(
+                f"Invalid capture.adaptive.{key}: {value!r} (must be a positive number)"
+            )
+    if adaptive["min_interval"] > adaptive["max_interval"]:
+        raise SystemExit(
+            "Invalid capture.adaptive: min_interval "
+            f"({adaptive['min_interval']}) exceeds max_interval "
+            f"({adaptive['max_interval']})"
+        )
+    if adaptive["static_threshold"] >= adaptive["active_threshold"]:
+        raise SystemExit(
+            "Invalid capture.adaptive: static_threshold "
+            f"({adaptive['static_threshold']}) must be below active_threshold "
+            f"({adaptive['active_threshold']})"
+        )
+
+    high_rate = capture.get("high_rate", {})
+    if not isinstance(high_rate.get("enabled"), bool):
+        raise SystemExit(
+            f"Invalid capture.high_rate.enabled: {high_rate.get('enabled')!r} "
+            "(must be true or false)"
+        )
+    fps = high_rate.get("fps")
+    if not isinstance(fps, (int, float)) or not (0 < fps <= 30):
+        raise SystemExit(
+            f"Invalid capture.high_rate.fps: {fps!r} (must be above 0, at most 30)"
+        )
+    if high_rate["enabled"]:
+        if burst["frames"] > 1 or burst["mode"] == "fusion":
+            raise SystemExit(
+                "Invalid capture.high_rate: cannot be combined with burst capture"
+            )
+        if adaptive["enabled"]:
+            raise SystemExit(
+                "Invalid capture.high_rate: cannot be combined with the adaptive interval"
+            )
+
     stop_threshold = storage.get("stop_threshold")
     if not isinstance(stop_threshold, (int, float)) or not (0 <= stop_threshold <= 100):
         raise SystemExit(
@@ -69,12 +272,249 @@ def _validate(config: dict) -> None:
             f"Invalid storage.warn_threshold: {warn_threshold!r} (must be 0-100)"
         )
 
+    sample_ttl = storage.get("disk_sample_ttl")
+    if not isinstance(sample_ttl, (int, float)) or sample_ttl < 0:
+        raise SystemExit(
+            f"Invalid storage.disk_sample_ttl: {sample_ttl!r} "
+            "(must be a non-negative number of seconds)"
+        )
+
+    for key in ("status_dir", "status_socket"):
+        value = storage.get(key)
+        if value is not None and (not isinstance(value, str) or not value):
+            raise SystemExit(
+                f"Invalid storage.{key}: {value!r} (must be a path or null)"
+            )
+
+    status_min_interval = storage.get("status_min_interval")
+    if not isinstance(status_min_interval, (int, float)) or status_min_interval < 0:
+        raise SystemExit(
+            f"Invalid storage.status_min_interval: {status_min_interval!r} "
+            "(must be a non-negative number of seconds)"
+        )
+
+    dir_sync_every = storage.get("dir_sync_every")
+    if not isinstance(dir_sync_every, int) or dir_sync_every < 1:
+        raise SystemExit(
+            f"Invalid storage.dir_sync_every: {dir_sync_every!r} "
+            "(must be a positive integer)"
+        )
+
+    dir_sync_interval = storage.get("dir_sync_interval")
+    if not isinstance(dir_sync_interval, (int, float)) or dir_sync_interval <= 0:
+        raise SystemExit(
+            f"Invalid storage.dir_sync_interval: {dir_sync_interval!r} "
+            "(must be a positive number of seconds)"
+        )
+
     retention_days = storage.get("retention_days")
     if not isinstance(retention_days, (int, float)) or retention_days <= 0:
         raise SystemExit(
             f"Invalid storage.retention_days: {retention_days!r} (must be a positive number)"
         )
 
+    if not isinstance(storage.get("previews_enabled"), bool):
+        raise SystemExit(
+            f"Invalid storage.previews_enabled: {storage.get('previews_enabled')!r} "
+            "(must be true or false)"
+        )
+
+    preview_duration = storage.get("preview_duration")
+    if not isinstance(preview_duration, int) or preview_duration <= 0:
+        raise SystemExit(
+            f"Invalid storage.preview_duration: {preview_duration!r} "
+            "(must be a positive integer)"
+        )
+
+    tier_dir = storage.get("tier_dir")
+    if tier_dir is not None and (not isinstance(tier_dir, str) or not tier_dir):
+        raise SystemExit(
+            f"Invalid storage.tier_dir: {tier_dir!r} (must be a path or null)"
+        )
+
+    tier_after_days = storage.get("tier_after_days")
+    if not isinstance(tier_after_days, int) or tier_after_days <= 0:
+        raise SystemExit(
+            f"Invalid storage.tier_after_days: {tier_after_days!r} "
+            "(must be a positive integer)"
+        )
+
+    tier_max_rate_mb = storage.get("tier_max_rate_mb")
+    if not isinstance(tier_max_rate_mb, (int, float)) or tier_max_rate_mb <= 0:
+        raise SystemExit(
+            f"Invalid storage.tier_max_rate_mb: {tier_max_rate_mb!r} "
+            "(must be a positive number)"
+        )
+
+    if not isinstance(storage.get("compact_enabled"), bool):
+        raise SystemExit(
+            f"Invalid storage.compact_enabled: {storage.get('compact_enabled')!r} "
+            "(must be true or false)"
+        )
+
+    compact_after_days = storage.get("compact_after_days")
+    if not isinstance(compact_after_days, int) or compact_after_days <= 0:
+        raise SystemExit(
+            f"Invalid storage.compact_after_days: {compact_after_days!r} "
+            "(must be a positive integer)"
+        )
+
+    compact_quality = storage.get("compact_quality")
+    if not isinstance(compact_quality, int) or not (1 <= compact_quality <= 100):
+        raise SystemExit(
+            f"Invalid storage.compact_quality: {compact_quality!r} "
+            "(must be an integer 1-100)"
+        )
+
+    compact_max_width = storage.get("compact_max_width")
+    if compact_max_width is not None and (
+        not isinstance(compact_max_width, int) or compact_max_width < 16
+    ):
+        raise SystemExit(
+            f"Invalid storage.compact_max_width: {compact_max_width!r} "
+            "(must be an integer of at least 16, or null)"
+        )
+
+    compact_workers = storage.get("compact_workers")
+    if not isinstance(compact_workers, int) or compact_workers < 1:
+        raise SystemExit(
+            f"Invalid storage.compact_workers: {compact_workers!r} "
+            "(must be a positive integer)"
+        )
+
+    horizon = storage.get("forecast_horizon_hours")
+    if not isinstance(horizon, (int, float)) or horizon < 0:
+        raise SystemExit(
+            f"Invalid storage.forecast_horizon_hours: {horizon!r} "
+            "(must be a non-negative number; 0 disables)"
+        )
+
+    degraded_quality = storage.get("degraded_quality")
+    if not isinstance(degraded_quality, int) or not (1 <= degraded_quality <= 100):
+        raise SystemExit(
+            f"Invalid storage.degraded_quality: {degraded_quality!r} "
+            "(must be an integer 1-100)"
+        )
+
+    factor = storage.get("degraded_interval_factor")
+    if not isinstance(factor, (int, float)) or factor < 1:
+        raise SystemExit(
+            f"Invalid storage.degraded_interval_factor: {factor!r} "
+            "(must be a number of at least 1)"
+        )
+
+    capture_trace = config.get("logging", {}).get("capture_trace")
+    if not isinstance(capture_trace, bool):
+        raise SystemExit(
+            f"Invalid logging.capture_trace: {capture_trace!r} (must be true or false)"
+        )
+
+    metrics = config.get("metrics", {})
+    if not isinstance(metrics.get("enabled"), bool):
+        raise SystemExit(
+            f"Invalid metrics.enabled: {metrics.get('enabled')!r} (must be true or false)"
+        )
+
+    metrics_interval = metrics.get("interval")
+    if not isinstance(metrics_interval, (int, float)) or metrics_interval <= 0:
+        raise SystemExit(
+            f"Invalid metrics.interval: {metrics_interval!r} "
+            "(must be a positive number of seconds)"
+        )
+
+    profile_cycles = metrics.get("profile_cycles")
+    if not isinstance(profile_cycles, int) or profile_cycles < 1:
+        raise SystemExit(
+            f"Invalid metrics.profile_cycles: {profile_cycles!r} "
+            "(must be a positive integer)"
+        )
+
+    jobs = web.get("jobs", {})
+    nice = jobs.get("nice")
+    if not isinstance(nice, int) or not (0 <= nice <= 19):
+        raise SystemExit(
+            f"Invalid web.jobs.nice: {nice!r} (must be an integer 0-19)"
+        )
+
+    threads = jobs.get("threads")
+    if not isinstance(threads, int) or threads < 1:
+        raise SystemExit(
+            f"Invalid web.jobs.threads: {threads!r} (must be a positive integer)"
+        )
+
+    jobs_dir = jobs.get("dir")
+    if jobs_dir is not None and (not isinstance(jobs_dir, str) or not jobs_dir):
+        raise SystemExit(f"Invalid web.jobs.dir: {jobs_dir!r} (must be a path or null)")
+
+    keep = jobs.get("keep")
+    if not isinstance(keep, int) or keep < 0:
+        raise SystemExit(
+            f"Invalid web.jobs.keep: {keep!r} (must be a non-negative integer)"
+        )
+
+    max_age_days = jobs.get("max_age_days")
+    if not isinstance(max_age_days, (int, float)) or max_age_days < 0:
+        raise SystemExit(
+            f"Invalid web.jobs.max_age_days: {max_age_days!r} "
+            "(must be a non-negative number, 0 for no age limit)"
+        )
+
+    _validate_cameras(config)
+
+
+def _validate_cameras(config: dict) -> None:
+    """Validate the cameras list and each camera's merged capture settings."""
+    cameras = config.get("cameras")
+    if not isinstance(cameras, list):
+        raise SystemExit(f"Invalid cameras: {cameras!r} (must be a list)")
+
+    allowed = {*_CAMERA_KEYS, *DEFAULTS["capture"], "device_index"}
+    names = set()
+    subdirs = set()
+    for i, camera in enumerate(cameras):
+        if not isinstance(camera, dict):
+            raise SystemExit(f"Invalid cameras[{i}]: {camera!r} (must be a mapping)")
+
+        name = camera.get("name")
+        if not isinstance(name, str) or not re.fullmatch(r"[A-Za-z0-9_-]+", name):
+            raise SystemExit(
+                f"Invalid cameras[{i}].name: {name!r} "
+                "(letters, digits, '-' and '_' only)"
+            )
+        if name in names:
+            raise SystemExit(f"Duplicate camera name: {name!r}")
+        names.add(name)
+
+        unknown = set(camera) - allowed
+        if unknown:
+            raise SystemExit(
+                f"Unknown key(s) in camera {name!r}: {', '.join(sorted(unknown))}"
+            )
+
+        subdir = camera.get("subdir", name)
+        if subdir is not None and (
+            not isinstance(subdir, str)
+            or not subdir
+            or Path(subdir).is_absolute()
+            or ".." in Path(subdir).parts
+        ):
+            raise SystemExit(
+                f"Invalid subdir for camera {name!r}: {subdir!r} "
+                "(must be a relative path inside output_dir, or null)"
+            )
+        if subdir in subdirs:
+            raise SystemExit(
+                f"Cameras share the same subdir {subdir!r}; each needs its own"
+            )
+        subdirs.add(subdir)
+
+    # Each camera's merged capture settings get the same checks as "capture"
+    for camera in camera_configs(config) if cameras else []:
+        try:
+            _validate({**config, "capture": camera["capture"], "cameras": []})
+        except SystemExit as exc:
+            raise SystemExit(f"Camera {camera['name']!r}: {exc}")
+
 
 def load_config(config_path: Path) -> dict:
     """Load YAML configuration from disk, apply defaults, validate, and return.
@@ -103,10 +543,15 @@ def load_config(config_path: Path) -> dict:
 
     config = _deep_merge(DEFAULTS, user_config)
 
-    # Expand ~ in output_dir
+    # Expand ~ in output_dir and the optional storage paths
     config["storage"]["output_dir"] = str(
         Path(config["storage"]["output_dir"]).expanduser()
     )
+    for key in ("tier_dir", "status_dir", "status_socket"):
+        if isinstance(config["storage"][key], str):
+            config["storage"][key] = str(Path(config["storage"][key]).expanduser())
+    if isinstance(config["web"]["jobs"]["dir"], str):
+        config["web"]["jobs"]["dir"] = str(Path(config["web"]["jobs"]["dir"]).expanduser())
 
     _validate(config)
 
@@ -1,28 +1,118 @@
 """Main capture daemon loop with signal handling and error recovery.
 
 Ties together the config, camera, storage, and status subsystems into a
-running daemon that captures images at a configurable interval, checks
-disk space, runs cleanup, and recovers from camera disconnects.
+running daemon that captures images at a configurable (optionally
+adaptive) interval, checks disk space, runs cleanup, and recovers from
+camera disconnects. Maintenance (per-day preview videos, compaction of
+aging originals, then migration of aging days to the secondary storage
+tier) runs in a background thread at startup and after each midnight.
+
+One daemon can drive several cameras (config "cameras"). Each camera is
+a CameraChannel with its own interval, lock file and image subtree; a
+timer heap of per-camera deadlines decides which captures next, and a
+failing camera backs off without delaying the others. Captures run on
+wall-clock slots (see timelapse.scheduler); the loop blocks on a single
+shutdown event until the earliest slot's monotonic deadline. A camera in
+high-rate mode is always due, and its frame stream paces its captures.
+
+Capture, thumbnail, analysis and cleanup timings are recorded in the
+process metrics registry (timelapse.metrics) and written to .metrics.json
+next to the status file every metrics.interval seconds, where the web
+UI's /metrics endpoint picks them up. SIGUSR1 runs cProfile around the
+next metrics.profile_cycles captures and writes the stats next to the
+status file (see timelapse.profiling). Every capture cycle's timings
+are also appended to a compact binary trace in its day directory (see
+timelapse.storage.trace), read by ``timelapse stats``.
+
+When the disk fill forecast falls below storage.forecast_horizon_hours,
+the daemon degrades gracefully (lower JPEG quality, longer interval)
+and runs maintenance early instead of waiting for the stop threshold.
 """
 
+import heapq
 import logging
 import random
+import shutil
 import signal
+import threading
 import time
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
-from timelapse.camera.detect import capture_with_timeout, detect_camera
-from timelapse.config import load_config
-from timelapse.lock import camera_lock
-from timelapse.status import write_status
-from timelapse.storage import StorageManager, cleanup_old_days
-from timelapse.web.thumbnails import generate_thumbnail
+from timelapse.analysis import change_score, compute_stats, load_gray
+from timelapse.camera.detect import (
+    capture_with_timeout,
+    create_camera,
+    invalidate_detection_cache,
+)
+from timelapse.channel import CameraChannel
+from timelapse.config import camera_configs, load_config
+from timelapse.lock import camera_lock, camera_lock_path
+from timelapse.metrics import (
+    REGISTRY,
+    SD_WRITE_INTERVAL,
+    inc,
+    metrics_file_path,
+    observe,
+    set_gauge,
+    summarize_ms,
+    timed,
+)
+from timelapse.profiling import CycleProfiler
+from timelapse.status import (
+    StatusPublisher,
+    status_file_path,
+    status_socket_path,
+    write_status,
+)
+from timelapse.storage import (
+    CaptureWriter,
+    StorageManager,
+    TraceWriter,
+    append_stats,
+    cleanup_old_days,
+    compact_old_days,
+    migrate_old_days,
+    quarantine_truncated,
+    tier_dirs,
+)
+from timelapse.storage.tiering import day_dir, iter_day_dirs
+from timelapse.thumbnails import generate_thumbnail
 
 logger = logging.getLogger("timelapse.daemon")
 
+# Seconds before a capture is abandoned (the capture thread is left behind)
+_CAPTURE_TIMEOUT = 30
+
+# Extra seconds over an isolated backend's own timeouts, which kill its child
+_ISOLATE_TIMEOUT_MARGIN = 10
+
+# Minimum seconds between cleanup and forecast runs for a high-rate camera
+_HIGH_RATE_HOUSEKEEPING_INTERVAL = 60
+
+# Degraded mode is left only once the forecast exceeds the horizon by this
+# factor; degrading itself slows the fill, which would otherwise flap
+_PRESSURE_EXIT_FACTOR = 1.5
+
+# Minimum seconds between early maintenance runs under storage pressure
+_EARLY_MAINTENANCE_INTERVAL = 3600
+
 # Config keys that require a restart to take effect
-_NO_RELOAD_KEYS = {"source", "resolution", "output_dir"}
+_NO_RELOAD_KEYS = {
+    "source",
+    "resolution",
+    "isolate",
+    "isolate_timeout",
+    "burst",
+    "native_jpeg",
+    "usb_fourcc",
+    "usb_buffer_size",
+    "high_rate",
+    "device_index",
+    "output_dir",
+    "status_dir",
+    "status_socket",
+}
 
 
 class CaptureDaemon:
@@ -36,214 +126,595 @@ class CaptureDaemon:
     def __init__(self, config: dict, config_path: Path):
         self._config = config
         self._config_path = config_path
-        self._running = False
+        self._stop = threading.Event()
 
         # State tracking
-        self._consecutive_failures = 0
-        self._captures_today = 0
         self._captures_today_date = datetime.now().date()
         self._start_time = time.monotonic()
 
-        # Initialize subsystems
-        self._camera = detect_camera(config)
+        # Initialize subsystems: one channel per camera
         storage_cfg = config["storage"]
+        output_dir = Path(storage_cfg["output_dir"])
+        self._channels = [
+            CameraChannel(
+                name=camera["name"],
+                capture_cfg=camera["capture"],
+                subdir=camera["subdir"],
+                output_dir=output_dir,
+                camera=create_camera({**config, "capture": camera["capture"]}),
+            )
+            for camera in camera_configs(config)
+        ]
         self._storage = StorageManager(
-            output_dir=Path(storage_cfg["output_dir"]),
+            output_dir=output_dir,
             stop_threshold=storage_cfg["stop_threshold"],
             warn_threshold=storage_cfg["warn_threshold"],
+            sample_ttl=storage_cfg["disk_sample_ttl"],
+        )
+
+        # Captures are written to a temp file, fsynced and renamed into place
+        self._writer = CaptureWriter(
+            dir_sync_every=storage_cfg["dir_sync_every"],
+            dir_sync_interval=storage_cfg["dir_sync_interval"],
         )
+        # Per-capture timing records, appended in the same batches
+        self._trace = TraceWriter(
+            flush_every=storage_cfg["dir_sync_every"],
+            flush_interval=storage_cfg["dir_sync_interval"],
+        )
+
+        # Status file (output directory unless storage.status_dir is set)
+        # and optional live status socket
+        self._status = StatusPublisher(
+            status_file_path(config),
+            min_interval=storage_cfg["status_min_interval"],
+            socket_path=status_socket_path(config),
+        )
+
+        # Metrics snapshot for the web UI's /metrics endpoint
+        self._metrics_path = metrics_file_path(config)
+        self._metrics_written_at: float | None = None
 
-        # Status file location: inside the output directory
-        self._status_path = Path(storage_cfg["output_dir"]) / ".status.json"
+        # cProfile around capture cycles, armed by SIGUSR1
+        self._profiler = CycleProfiler(self._metrics_path.parent, "daemon")
 
-        # Last capture timestamp for status reporting
-        self._last_capture: str | None = None
-        self._last_capture_success: bool | None = None
+        # Background maintenance: previews, compaction, tiering (one run at a time)
+        self._maintenance_thread: threading.Thread | None = None
+        # Whether previews can be encoded; FFmpeg is looked up once
+        self._ffmpeg_available: bool | None = None
+
+        # Disk fill forecast and degraded mode when it is too short
+        self._forecast: dict | None = None
+        self._storage_pressure = False
+        self._last_early_maintenance: float | None = None
 
     def run(self) -> None:
         """Run the main capture loop.
 
-        Registers signal handlers, opens the camera, and enters the
+        Registers signal handlers, opens the cameras, and enters the
         capture loop. Runs until SIGTERM or SIGINT is received.
         """
         # Register signal handlers
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGHUP, self._handle_reload)
+        signal.signal(signal.SIGUSR1, self._handle_profile)
 
-        self._running = True
+        self._stop.clear()
         self._start_time = time.monotonic()
+        self._status.start()
+        if (
+            self._config["metrics"]["enabled"]
+            and not self._status.serves_socket
+            and not self._config["storage"]["status_dir"]
+        ):
+            logger.warning(
+                "No status socket or storage.status_dir: daemon metrics are "
+                "written to %s at most every %ds, so /metrics serves them up "
+                "to that old",
+                self._metrics_path,
+                max(self._config["metrics"]["interval"], SD_WRITE_INTERVAL),
+            )
+        for channel in self._channels:
+            self._quarantine_incomplete(channel)
 
         try:
-            self._camera.open()
+            # Timer heap of (monotonic deadline, channel index)
+            schedule = []
+            for index, channel in enumerate(self._channels):
+                self._open_camera(channel)
+                heapq.heappush(schedule, (self._schedule(channel), index))
             logger.info(
-                "Camera opened (%s), starting capture loop", self._camera.name
+                "Starting capture loop with %d camera(s)", len(self._channels)
             )
+            self._start_maintenance()
 
-            while self._running:
-                loop_start = time.monotonic()
+            while not self._stop.is_set():
+                deadline, index = schedule[0]
 
-                # Reset daily counter at midnight
+                # SIGTERM/SIGINT set the event and end the wait early
+                if self._stop.wait(max(0.0, deadline - time.monotonic())):
+                    break
+                heapq.heappop(schedule)
+
+                # Reset daily counters at midnight
                 today = datetime.now().date()
                 if today != self._captures_today_date:
-                    self._captures_today = 0
+                    for channel in self._channels:
+                        channel.captures_today = 0
                     self._captures_today_date = today
+                    self._start_maintenance()
 
-                self._capture_once()
-                self._write_status("running")
+                # Cameras due now, this one included; above 1 means captures queue up
+                now = time.monotonic()
+                set_gauge(
+                    "timelapse_capture_queue_depth",
+                    1 + sum(1 for due, _ in schedule if due <= now),
+                )
 
-                # Drift-corrected sleep
-                elapsed = time.monotonic() - loop_start
-                interval = self._config["capture"]["interval"]
-                sleep_time = max(0, interval - elapsed)
+                channel = self._channels[index]
+                if not channel.needs_reopen or self._reopen_camera(channel):
+                    channel.slots.record(channel.slot, time.time())
+                    with self._profiler.cycle():
+                        self._capture_once(channel)
+                else:
+                    self._record_trace(channel, time.time(), result="error")
+                self._writer.maybe_sync()
+                self._trace.maybe_flush()
+                self._write_status("running")
 
-                # Sleep in small increments to allow quick shutdown
-                sleep_end = time.monotonic() + sleep_time
-                while self._running and time.monotonic() < sleep_end:
-                    remaining = sleep_end - time.monotonic()
-                    time.sleep(min(0.5, remaining))
+                heapq.heappush(schedule, (self._schedule(channel), index))
 
         except Exception as exc:
             logger.error("Fatal error in capture loop: %s", exc)
             self._write_status("error")
             raise
         finally:
-            try:
-                self._camera.close()
-            except Exception as exc:
-                logger.warning("Error closing camera: %s", exc)
+            for channel in self._channels:
+                try:
+                    channel.camera.close()
+                except Exception as exc:
+                    logger.warning("Error closing camera %s: %s", channel.name, exc)
+            self._writer.sync()
+            self._trace.flush()
             self._write_status("stopped")
+            self._status.close()
             logger.info("Daemon stopped")
 
-    def _capture_once(self) -> None:
-        """Execute a single capture cycle.
+    def _schedule(self, channel: CameraChannel) -> float:
+        """Advance a camera to its next slot and return the monotonic deadline.
 
-        Checks disk space, generates the output path, acquires the camera
-        lock, captures the image, and optionally runs cleanup.
+        Slots are wall-clock times, but the wait is measured on the
+        monotonic clock so clock steps cannot stretch or skip it.
         """
+        now = time.time()
+        slot = channel.advance(now, self._degraded_factor())
+        return time.monotonic() + (slot - now)
+
+    def _open_camera(self, channel: CameraChannel) -> None:
+        """Open a channel's camera at startup; failure schedules a retry."""
+        try:
+            channel.camera.open()
+            logger.info(
+                "Camera %s opened (%s, %s)",
+                channel.name,
+                channel.camera.name,
+                channel.camera.device_id,
+            )
+        except Exception as exc:
+            logger.error("Camera %s failed to open: %s", channel.name, exc)
+            # Detection may have been answered from a stale cache
+            invalidate_detection_cache()
+            self._handle_capture_failure(channel, f"open failed: {exc}")
+
+    def _capture_once(self, channel: CameraChannel) -> None:
+        """Execute a single capture cycle for one camera.
+
+        Checks disk space, generates the output path, acquires the
+        camera's lock, captures the image, and optionally runs cleanup.
+        """
+        cycle_started = time.time()
+
         # Check disk space before capturing
         if not self._storage.has_space():
             logger.error(
                 "Disk usage exceeds %d%% threshold, skipping capture",
                 self._config["storage"]["stop_threshold"],
             )
+            inc("timelapse_captures_total", camera=channel.name, result="skipped")
+            self._record_trace(channel, cycle_started, result="skipped")
             return
 
         now = datetime.now()
-        output_path = self._storage.image_path(now)
-
-        # Check for filename collision (same-second capture)
-        if output_path.exists():
-            logger.debug(
-                "Image already exists at %s, skipping duplicate", output_path
-            )
-            return
-
+        output_path = self._storage.image_path(
+            now, channel.root, millis=channel.high_rate
+        )
+        temp_path = self._writer.temp_path(output_path)
+        capture_stats = {}
+        trace = {}
         try:
-            with camera_lock(blocking=True):
+            lock_path = camera_lock_path(channel.camera.device_id)
+            lock_started = time.monotonic()
+            with camera_lock(lock_path, blocking=True):
+                started = time.monotonic()
                 success = capture_with_timeout(
-                    self._camera,
-                    output_path,
-                    quality=self._config["capture"]["jpeg_quality"],
-                    timeout=30,
+                    channel.camera,
+                    temp_path,
+                    quality=self._capture_quality(channel),
+                    timeout=self._capture_timeout(channel),
+                    stats=capture_stats,
                 )
+                write_ms = (time.monotonic() - started) * 1000
+            trace["lock_wait_ms"] = (started - lock_started) * 1000
+            trace["capture_ms"] = write_ms
+            observe(
+                "timelapse_capture_seconds",
+                time.monotonic() - lock_started,
+                camera=channel.name,
+            )
 
-            self._last_capture = now.isoformat()
+            channel.last_capture = now.isoformat()
 
             if success:
-                self._consecutive_failures = 0
-                self._captures_today += 1
-                self._last_capture_success = True
+                self._writer.commit(temp_path, output_path, write_ms)
+                inc("timelapse_captures_total", camera=channel.name, result="success")
+                trace["result"] = "success"
+                channel.record_capture(now, capture_stats)
 
                 # Generate thumbnail (failure must never break capture loop)
+                thumb_path = None
+                thumb_started = time.monotonic()
                 try:
-                    generate_thumbnail(output_path)
+                    thumb_path = generate_thumbnail(output_path)
                 except Exception as exc:
                     logger.warning("Thumbnail generation failed for %s: %s", output_path, exc)
+                trace["thumb_ms"] = (time.monotonic() - thumb_started) * 1000
+                observe("timelapse_thumbnail_seconds", trace["thumb_ms"] / 1000)
+
+                # Track bytes written for the disk fill forecast
+                try:
+                    written = output_path.stat().st_size
+                    if thumb_path is not None:
+                        written += thumb_path.stat().st_size
+                    self._storage.record_write(written)
+                    trace["size"] = written
+                except OSError:
+                    pass
+
+                # Analyze the capture (failure must never break capture loop)
+                try:
+                    with timed("timelapse_analysis_seconds"):
+                        self._analyze_capture(channel, output_path)
+                except Exception as exc:
+                    logger.warning("Image analysis failed for %s: %s", output_path, exc)
 
                 if self._config["logging"].get("gap_tracking", False):
                     logger.info("Capture saved: %s", output_path)
             else:
-                self._handle_capture_failure("Capture returned False")
+                inc("timelapse_captures_total", camera=channel.name, result="failed")
+                trace["result"] = "failed"
+                self._writer.discard(temp_path)
+                self._handle_capture_failure(channel, "Capture returned False")
 
         except Exception as exc:
-            logger.error("Capture error: %s", exc)
-            self._handle_capture_failure(str(exc))
+            logger.error("Capture error (%s): %s", channel.name, exc)
+            inc("timelapse_captures_total", camera=channel.name, result="error")
+            trace["result"] = "error"
+            self._writer.discard(temp_path)
+            self._handle_capture_failure(channel, str(exc))
+
+        self._record_trace(channel, cycle_started, **trace)
+
+        # A high-rate camera streams several frames a second; retention
+        # cleanup and the forecast need not walk the tiers for every one
+        now_mono = time.monotonic()
+        if (
+            channel.high_rate
+            and channel.housekeeping_at is not None
+            and now_mono - channel.housekeeping_at < _HIGH_RATE_HOUSEKEEPING_INTERVAL
+        ):
+            return
+        channel.housekeeping_at = now_mono
 
         # Run cleanup if enabled
         if self._config["storage"].get("cleanup_enabled", False):
             try:
-                output_dir = Path(self._config["storage"]["output_dir"])
                 retention = self._config["storage"]["retention_days"]
-                deleted = cleanup_old_days(output_dir, retention)
+                deleted = 0
+                with timed("timelapse_cleanup_seconds"):
+                    for root in self._channel_roots(channel):
+                        deleted += cleanup_old_days(root, retention)
                 if deleted > 0:
                     logger.info("Cleanup removed %d old day directories", deleted)
             except Exception as exc:
                 logger.error("Cleanup error: %s", exc)
 
-    def _handle_capture_failure(self, reason: str) -> None:
+        self._update_forecast()
+
+    def _record_trace(self, channel: CameraChannel, started: float, **fields) -> None:
+        """Queue a capture cycle's timing record for its day's trace file.
+
+        Args:
+            channel: Camera the cycle ran for.
+            started: Wall-clock start of the cycle.
+            **fields: Timings, size and result (see TraceWriter.append).
+        """
+        if not self._config["logging"]["capture_trace"]:
+            return
+        self._trace.append(
+            day_dir(channel.root, date.fromtimestamp(started)),
+            slot=channel.slot if channel.slot is not None else started,
+            start=started,
+            interval=channel.interval(self._degraded_factor()),
+            missed=channel.missed_before,
+            **fields,
+        )
+
+    def _channel_roots(self, channel: CameraChannel, config: dict | None = None) -> list[Path]:
+        """A camera's image roots on every storage tier, primary first."""
+        config = config or self._config
+        return [
+            channel.tier_root(config["storage"]["output_dir"]),
+            *(channel.tier_root(tier) for tier in tier_dirs(config)),
+        ]
+
+    def _quarantine_incomplete(self, channel: CameraChannel) -> None:
+        """Quarantine captures left truncated by a crash or power cut.
+
+        Only a camera's newest day directory can hold them: earlier days
+        were finished before the last run.
+        """
+        newest = None
+        for _, path in iter_day_dirs(channel.root):
+            newest = path
+        if newest is None:
+            return
+        try:
+            quarantined = quarantine_truncated(newest)
+        except OSError as exc:
+            logger.warning("Startup scan of %s failed: %s", newest, exc)
+            return
+        if quarantined:
+            logger.warning(
+                "Moved %d incomplete capture(s) to %s/.quarantine",
+                quarantined,
+                newest,
+            )
+
+    def _update_forecast(self) -> None:
+        """Refresh the disk fill forecast and enter/leave degraded mode."""
+        try:
+            self._forecast = self._storage.forecast()
+        except OSError as exc:
+            logger.warning("Disk forecast failed: %s", exc)
+            return
+
+        horizon = self._config["storage"]["forecast_horizon_hours"]
+        hours_to_full = self._forecast["hours_to_full"]
+        # Once degraded, stay degraded until the forecast clears the horizon
+        # with a margin
+        limit = horizon * _PRESSURE_EXIT_FACTOR if self._storage_pressure else horizon
+        pressure = (
+            horizon > 0 and hours_to_full is not None and hours_to_full < limit
+        )
+
+        if pressure and not self._storage_pressure:
+            logger.warning(
+                "Disk projected to reach %d%% in %.1fh (horizon %dh), "
+                "degrading capture and running maintenance early",
+                self._config["storage"]["stop_threshold"],
+                hours_to_full,
+                horizon,
+            )
+        elif self._storage_pressure and not pressure:
+            logger.info(
+                "Disk forecast back above %.0fh, leaving degraded mode", limit
+            )
+        self._storage_pressure = pressure
+
+        if pressure and (
+            self._last_early_maintenance is None
+            or time.monotonic() - self._last_early_maintenance
+            >= _EARLY_MAINTENANCE_INTERVAL
+        ):
+            self._last_early_maintenance = time.monotonic()
+            self._start_maintenance(early=True)
+
+    def _capture_timeout(self, channel: CameraChannel) -> float:
+        """Seconds to wait for a camera's capture before abandoning it.
+
+        An isolated backend times out and kills its own child; waiting
+        longer than it does keeps a slow capture from leaking the child.
+        """
+        own_timeout = channel.camera.max_capture_seconds
+        if own_timeout is None:
+            return _CAPTURE_TIMEOUT
+        return max(_CAPTURE_TIMEOUT, own_timeout + _ISOLATE_TIMEOUT_MARGIN)
+
+    def _capture_quality(self, channel: CameraChannel) -> int:
+        """JPEG quality for a camera's next capture, lowered under storage pressure."""
+        quality = channel.capture_cfg["jpeg_quality"]
+        if self._storage_pressure:
+            return min(quality, self._config["storage"]["degraded_quality"])
+        return quality
+
+    def _start_maintenance(self, early: bool = False) -> None:
+        """Run daily maintenance for finished days in a background thread.
+
+        Args:
+            early: Storage pressure run; compacts every finished day rather
+                than only those past compact_after_days.
+        """
+        if self._maintenance_thread is not None and self._maintenance_thread.is_alive():
+            return
+        self._maintenance_thread = threading.Thread(
+            target=self._run_maintenance,
+            args=(self._config, datetime.now().date(), early),
+            name="timelapse-maintenance",
+            daemon=True,
+        )
+        self._maintenance_thread.start()
+
+    def _run_maintenance(self, config: dict, today, early: bool = False) -> None:
+        """Maintenance thread body (failure must never affect the capture loop).
+
+        Runs for each camera's image subtree in turn. Previews are encoded
+        first so migrated days already carry theirs.
+        """
+        # Pulls in the video generator; only maintenance needs it
+        from timelapse.previews import generate_missing_previews
+
+        storage_cfg = config["storage"]
+
+        for channel in self._channels:
+            roots = self._channel_roots(channel, config)
+
+            if storage_cfg["previews_enabled"] and self._ffmpeg_available is None:
+                self._ffmpeg_available = shutil.which("ffmpeg") is not None
+                if not self._ffmpeg_available:
+                    logger.warning(
+                        "FFmpeg not found on PATH; day previews are disabled "
+                        "(install ffmpeg or set storage.previews_enabled: false)"
+                    )
+
+            if storage_cfg["previews_enabled"] and self._ffmpeg_available:
+                try:
+                    created = generate_missing_previews(
+                        roots[0], today, storage_cfg["preview_duration"]
+                    )
+                    if created > 0:
+                        logger.info("Created %d day preview(s)", created)
+                except (SystemExit, Exception) as exc:
+                    logger.error("Preview generation error: %s", exc)
+
+            if storage_cfg["compact_enabled"]:
+                try:
+                    compacted = compact_old_days(
+                        roots,
+                        1 if early else storage_cfg["compact_after_days"],
+                        storage_cfg["compact_quality"],
+                        storage_cfg["compact_max_width"],
+                        storage_cfg["compact_workers"],
+                    )
+                    if compacted > 0:
+                        logger.info("Compacted %d day(s)", compacted)
+                except Exception as exc:
+                    logger.error("Compaction error: %s", exc)
+
+            for tier_root in roots[1:]:
+                try:
+                    migrated = migrate_old_days(
+                        roots[0],
+                        tier_root,
+                        storage_cfg["tier_after_days"],
+                        storage_cfg["tier_max_rate_mb"],
+                    )
+                    if migrated > 0:
+                        logger.info("Migrated %d day(s) to %s", migrated, tier_root)
+                except Exception as exc:
+                    logger.error("Storage tier migration error: %s", exc)
+
+    def _analyze_capture(self, channel: CameraChannel, image_path: Path) -> None:
+        """Compute per-image stats and score the change from the previous capture.
+
+        Everything is derived from one draft-mode grayscale decode and
+        appended to the day's stats sidecar, so the generator never has to
+        rescan new images. When the adaptive interval is enabled, the
+        change score adjusts the camera's next capture interval.
+
+        Args:
+            channel: Camera that took the image.
+            image_path: Path to the image just captured.
+        """
+        gray = load_gray(image_path)
+        stats = compute_stats(gray)
+        score = None
+        if channel.previous_gray is not None:
+            score = change_score(channel.previous_gray, gray)
+            stats["change"] = round(score, 2)
+        append_stats(image_path.parent, image_path.name, stats)
+        channel.previous_gray = gray
+        channel.last_change_score = score
+
+        if channel.adaptive is not None:
+            channel.adaptive.update(score)
+
+    def _degraded_factor(self) -> float | None:
+        """Interval multiplier under storage pressure, else None."""
+        if self._storage_pressure:
+            return self._config["storage"]["degraded_interval_factor"]
+        return None
+
+    def _handle_capture_failure(self, channel: CameraChannel, reason: str) -> None:
         """Handle a capture failure with exponential backoff recovery.
 
-        Increments the failure counter, calculates a backoff delay, and
-        attempts to reopen the camera.
+        Increments the camera's failure counter, closes it, and schedules
+        a reopen at the first slot after the backoff delay. Other cameras
+        keep capturing meanwhile.
 
         Args:
+            channel: Camera that failed.
             reason: Description of the failure for logging.
         """
-        self._consecutive_failures += 1
-        self._last_capture_success = False
+        channel.consecutive_failures += 1
+        channel.last_capture_success = False
 
         # Exponential backoff: 5s base, 300s max, with jitter
-        backoff = min(
-            5 * (2 ** self._consecutive_failures) + random.uniform(0, 1),
+        channel.backoff = min(
+            5 * (2 ** channel.consecutive_failures) + random.uniform(0, 1),
             300,
         )
 
         logger.warning(
-            "Capture failed (attempt %d): %s -- backing off %.1fs",
-            self._consecutive_failures,
+            "Capture failed on %s (attempt %d): %s -- backing off %.1fs",
+            channel.name,
+            channel.consecutive_failures,
             reason,
-            backoff,
+            channel.backoff,
         )
 
-        # Attempt camera recovery
+        # Attempt camera recovery once the backoff expires
         try:
-            self._camera.close()
+            channel.camera.close()
         except Exception:
             pass
+        channel.needs_reopen = True
 
-        # Sleep for backoff period (interruptible)
-        sleep_end = time.monotonic() + backoff
-        while self._running and time.monotonic() < sleep_end:
-            remaining = sleep_end - time.monotonic()
-            time.sleep(min(0.5, remaining))
-
-        if not self._running:
-            return
-
-        # Attempt to reopen camera
+    def _reopen_camera(self, channel: CameraChannel) -> bool:
+        """Reopen a camera after its backoff. Returns True on success."""
         try:
-            self._camera.open()
-            logger.info(
-                "Camera reconnected (%s) after %d failures",
-                self._camera.name,
-                self._consecutive_failures,
-            )
+            channel.camera.open()
         except Exception as exc:
-            logger.error("Camera reconnect failed: %s", exc)
+            logger.error("Camera reconnect failed (%s): %s", channel.name, exc)
+            self._handle_capture_failure(channel, f"reconnect failed: {exc}")
+            return False
+        channel.needs_reopen = False
+        logger.info(
+            "Camera reconnected (%s, %s) after %d failures",
+            channel.name,
+            channel.camera.name,
+            channel.consecutive_failures,
+        )
+        return True
 
     def _handle_shutdown(self, signum, frame) -> None:
         """Handle SIGTERM/SIGINT for graceful shutdown."""
         sig_name = signal.Signals(signum).name
         logger.info("Received %s, shutting down gracefully", sig_name)
-        self._running = False
+        self._stop.set()
+
+    def _handle_profile(self, signum, frame) -> None:
+        """Handle SIGUSR1: profile the next metrics.profile_cycles captures."""
+        cycles = self._config["metrics"]["profile_cycles"]
+        logger.info("SIGUSR1 received, profiling the next %d capture(s)", cycles)
+        self._profiler.arm(cycles)
 
     def _handle_reload(self, signum, frame) -> None:
         """Handle SIGHUP for configuration reload.
 
         Reloads the config file and updates runtime settings. Settings
-        that require a restart (source, resolution, output_dir) log a
-        warning if changed but are not applied.
+        that require a restart (source, resolution, output_dir, the set
+        of cameras) log a warning if changed but are not applied.
         """
         logger.info("SIGHUP received, reloading configuration")
         try:
@@ -252,64 +723,151 @@ class CaptureDaemon:
             logger.error("Config reload failed, keeping current config: %s", exc)
             return
 
-        # Warn about settings that require a restart
-        for key in _NO_RELOAD_KEYS:
-            old_val = self._config.get("capture", {}).get(
-                key, self._config.get("storage", {}).get(key)
-            )
-            new_val = new_config.get("capture", {}).get(
-                key, new_config.get("storage", {}).get(key)
+        new_cameras = {camera["name"]: camera for camera in camera_configs(new_config)}
+        if [(c.name, c.subdir) for c in self._channels] != [
+            (name, camera["subdir"]) for name, camera in new_cameras.items()
+        ]:
+            logger.warning(
+                "Camera list changed but requires daemon restart to take effect"
             )
-            if old_val != new_val:
-                logger.warning(
-                    "Config key '%s' changed (%s -> %s) but requires daemon "
-                    "restart to take effect",
-                    key,
-                    old_val,
-                    new_val,
+
+        # Warn about settings that require a restart
+        for channel in self._channels:
+            new_camera = new_cameras.get(channel.name)
+            if new_camera is None:
+                continue
+            for key in _NO_RELOAD_KEYS:
+                old_val = channel.capture_cfg.get(
+                    key, self._config.get("storage", {}).get(key)
                 )
+                new_val = new_camera["capture"].get(
+                    key, new_config.get("storage", {}).get(key)
+                )
+                if old_val != new_val:
+                    logger.warning(
+                        "Config key '%s' changed (%s -> %s) but requires daemon "
+                        "restart to take effect",
+                        key,
+                        old_val,
+                        new_val,
+                    )
 
         # Apply reloadable settings
         self._config = new_config
+        for channel in self._channels:
+            if channel.name in new_cameras:
+                channel.reconfigure(new_cameras[channel.name]["capture"])
 
         # Update storage manager thresholds
         storage_cfg = new_config["storage"]
         self._storage._stop_threshold = storage_cfg["stop_threshold"]
         self._storage._warn_threshold = storage_cfg["warn_threshold"]
+        self._storage.sampler.ttl = storage_cfg["disk_sample_ttl"]
+        self._status.min_interval = storage_cfg["status_min_interval"]
+        self._writer.dir_sync_every = storage_cfg["dir_sync_every"]
+        self._writer.dir_sync_interval = storage_cfg["dir_sync_interval"]
+        self._trace.flush_every = storage_cfg["dir_sync_every"]
+        self._trace.flush_interval = storage_cfg["dir_sync_interval"]
 
         logger.info("Configuration reloaded successfully")
 
     def _write_status(self, daemon_state: str) -> None:
         """Write the current daemon status to the JSON status file.
 
+        Top-level capture fields describe the first camera, which is what
+        the web UI shows; every camera is listed under "cameras".
+
         Args:
             daemon_state: Current daemon state (running, stopped, error).
         """
         uptime = time.monotonic() - self._start_time
+        # Published so the web UI never has to query the filesystem itself
         try:
-            disk_percent = self._storage.disk_usage_percent()
-            import shutil
-
-            usage = shutil.disk_usage(self._config["storage"]["output_dir"])
+            usage = self._storage.disk_usage()
+            disk_percent = (usage.used / usage.total) * 100
+            disk_total_gb = round(usage.total / (1024**3), 2)
+            disk_used_gb = round(usage.used / (1024**3), 2)
             disk_free_gb = round(usage.free / (1024**3), 2)
         except Exception:
             disk_percent = -1
-            disk_free_gb = -1
+            disk_total_gb = disk_used_gb = disk_free_gb = -1
+
+        degraded = self._degraded_factor()
+        cameras = {
+            channel.name: channel.status(degraded) for channel in self._channels
+        }
+        primary = self._channels[0]
+        primary_status = cameras[primary.name]
 
         data = {
             "daemon": daemon_state,
-            "camera": self._camera.name if self._camera else "unknown",
-            "last_capture": self._last_capture,
-            "last_capture_success": self._last_capture_success,
-            "consecutive_failures": self._consecutive_failures,
-            "captures_today": self._captures_today,
+            "camera": primary_status["camera"],
+            "last_capture": primary_status["last_capture"],
+            "last_capture_success": primary_status["last_capture_success"],
+            "consecutive_failures": primary_status["consecutive_failures"],
+            "captures_today": primary_status["captures_today"],
+            "capture_interval": primary_status["capture_interval"],
+            "change_score": primary_status["change_score"],
             "disk_usage_percent": round(disk_percent, 1),
+            "disk_total_gb": disk_total_gb,
+            "disk_used_gb": disk_used_gb,
             "disk_free_gb": disk_free_gb,
+            "disk_forecast": self._forecast,
+            "storage_pressure": self._storage_pressure,
+            "capture_quality": self._capture_quality(primary),
+            "write_latency": {
+                **self._writer.latency(),
+                "fresh_frame_ms": summarize_ms(primary.fresh_ms),
+            },
+            "capture_cpu": primary_status["capture_cpu"],
+            "capture_slots": primary_status["slots"],
+            "profiling": self._profiler.status(),
+            "cameras": cameras,
             "uptime_seconds": round(uptime, 1),
             "config_loaded": str(self._config_path),
         }
 
+        # Live metrics ride on the socket, which costs no disk writes
+        live = None
+        if self._config["metrics"]["enabled"] and self._status.serves_socket:
+            live = {"metrics": {"updated": time.time(), "metrics": REGISTRY.snapshot()}}
+
         try:
-            write_status(self._status_path, data)
+            self._status.publish(data, live=live)
         except Exception as exc:
             logger.warning("Failed to write status file: %s", exc)
+
+        self._write_metrics(force=daemon_state != "running")
+
+    def _write_metrics(self, force: bool = False) -> None:
+        """Write the metrics snapshot, at most once per metrics.interval.
+
+        Without storage.status_dir the file sits in output_dir, usually on
+        the SD card, so it is rewritten at most every SD_WRITE_INTERVAL
+        seconds (the status socket carries live metrics meanwhile).
+
+        Args:
+            force: Write regardless of the interval (daemon stopping or
+                failing, so the last counts are not lost).
+        """
+        metrics_cfg = self._config["metrics"]
+        if not metrics_cfg["enabled"]:
+            return
+        interval = metrics_cfg["interval"]
+        if not self._config["storage"]["status_dir"]:
+            interval = max(interval, SD_WRITE_INTERVAL)
+        now = time.monotonic()
+        if (
+            not force
+            and self._metrics_written_at is not None
+            and now - self._metrics_written_at < interval
+        ):
+            return
+        self._metrics_written_at = now
+        try:
+            write_status(
+                self._metrics_path,
+                {"updated": time.time(), "metrics": REGISTRY.snapshot()},
+            )
+        except Exception as exc:
+            logger.warning("Failed to write metrics file: %s", exc)
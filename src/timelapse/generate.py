@@ -3,6 +3,9 @@
 This module provides the full pipeline for generating timelapse videos from
 date-organized image directories using FFmpeg's concat demuxer. No new
 dependencies beyond stdlib + Pillow (already installed).
+
+numpy, Pillow and the image analysis helpers are imported by the steps
+that use them, so argument parsing and --dry-run start quickly.
 """
 
 import argparse
@@ -13,14 +16,23 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 from calendar import monthrange
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
 from datetime import date, timedelta
 from math import ceil
 from pathlib import Path
-
-from PIL import Image
+from typing import TYPE_CHECKING
 
 from timelapse.config import load_config
+from timelapse.storage.compaction import read_compaction
+from timelapse.storage.naming import image_sort_key
+from timelapse.storage.tiering import find_day_dir
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # ---------------------------------------------------------------------------
@@ -62,10 +74,12 @@ def collect_images(
     use_thumbnails: bool = False,
     every_n: int = 1,
     sort: str = "filename",
+    min_brightness: float | None = None,
+    tier_dirs: list[Path] | None = None,
 ) -> list[Path]:
     """Collect image paths from date-organized directories.
 
-    Directory structure: base_dir/YYYY/MM/DD/HHMMSS.jpg
+    Directory structure: base_dir/YYYY/MM/DD/HHMMSS.jpg (or HHMMSSmmm.jpg)
     Thumbnails:          base_dir/YYYY/MM/DD/thumbs/HHMMSS.jpg
 
     Args:
@@ -75,26 +89,31 @@ def collect_images(
         use_thumbnails: If True, look in thumbs/ subdirectories.
         every_n: Use every Nth image after sorting (1 = all).
         sort: Sort order -- "filename" (default, chronological), "mtime", or "random".
+        min_brightness: If set, drop images whose mean luminance (0-255)
+            is below this level, e.g. night frames. Uses cached stats.
+        tier_dirs: Secondary storage tiers to search for days that are
+            not in base_dir.
 
     Returns:
         List of Path objects for selected images.
     """
+    roots = [base_dir, *(tier_dirs or [])]
     images: list[Path] = []
     current = start
     while current <= end:
-        day_dir = (
-            base_dir
-            / current.strftime("%Y")
-            / current.strftime("%m")
-            / current.strftime("%d")
-        )
-        if use_thumbnails:
+        day_dir = find_day_dir(roots, current)
+        if day_dir is not None and use_thumbnails:
             day_dir = day_dir / "thumbs"
-        if day_dir.is_dir():
-            day_images = sorted(day_dir.glob("*.jpg"))
+        if day_dir is not None and day_dir.is_dir():
+            day_images = sorted(
+                day_dir.glob("*.jpg"), key=lambda p: image_sort_key(p.name)
+            )
             images.extend(day_images)
         current += timedelta(days=1)
 
+    if min_brightness is not None:
+        images = filter_by_brightness(images, min_brightness)
+
     # Apply sort order
     if sort == "mtime":
         images.sort(key=lambda p: p.stat().st_mtime)
@@ -109,31 +128,91 @@ def collect_images(
     return images
 
 
+def filter_by_brightness(image_paths: list[Path], min_brightness: float) -> list[Path]:
+    """Drop images darker than min_brightness.
+
+    Mean luminance comes from the day stats sidecars (recorded at capture
+    time, or computed once and cached for older images), so repeat runs
+    do not rescan pixel data.
+
+    Args:
+        image_paths: Image paths to filter.
+        min_brightness: Minimum mean luminance, 0 (black) to 255 (white).
+
+    Returns:
+        The images at or above the threshold, in their original order.
+    """
+    from timelapse.analysis import image_stats
+
+    return [
+        path
+        for path, stats in zip(image_paths, image_stats(image_paths))
+        if stats["luma"] >= min_brightness
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Near-duplicate suppression
+# ---------------------------------------------------------------------------
+
+def dedupe_images(image_paths: list[Path], max_distance: int = 2) -> list[Path]:
+    """Collapse runs of near-identical consecutive images to their first frame.
+
+    Uses per-image difference hashes from the day stats sidecars (recorded
+    at capture time, or computed once and cached for older images). Each
+    image is compared with the first image of the current run, so a slow
+    drift still starts a new run once it exceeds max_distance.
+
+    Args:
+        image_paths: Ordered list of image paths.
+        max_distance: Maximum Hamming distance (out of 64 bits) for an
+            image to count as a duplicate of the run's first image.
+
+    Returns:
+        The images that start a new run, in their original order.
+    """
+    if not image_paths:
+        return []
+
+    from timelapse.analysis import hamming, image_stats
+
+    hashes = [int(stats["dhash"], 16) for stats in image_stats(image_paths)]
+    kept = [image_paths[0]]
+    anchor = hashes[0]
+    for path, value in zip(image_paths[1:], hashes[1:]):
+        if hamming(anchor, value) > max_distance:
+            kept.append(path)
+            anchor = value
+    return kept
+
+
 # ---------------------------------------------------------------------------
 # Gap detection
 # ---------------------------------------------------------------------------
 
-def detect_gaps(base_dir: Path, start: date, end: date) -> list[date]:
+def detect_gaps(
+    base_dir: Path,
+    start: date,
+    end: date,
+    tier_dirs: list[Path] | None = None,
+) -> list[date]:
     """Find dates in the range that have no captured images.
 
     Args:
         base_dir: Root image directory.
         start: First day of range (inclusive).
         end: Last day of range (inclusive).
+        tier_dirs: Secondary storage tiers to search as well.
 
     Returns:
         List of dates with no images.
     """
+    roots = [base_dir, *(tier_dirs or [])]
     missing: list[date] = []
     current = start
     while current <= end:
-        day_dir = (
-            base_dir
-            / current.strftime("%Y")
-            / current.strftime("%m")
-            / current.strftime("%d")
-        )
-        if not day_dir.is_dir() or not any(day_dir.glob("*.jpg")):
+        day_dir = find_day_dir(roots, current)
+        if day_dir is None or not any(day_dir.glob("*.jpg")):
             missing.append(current)
         current += timedelta(days=1)
     return missing
@@ -192,6 +271,9 @@ def detect_resolution(
     If explicit is given, return it directly. Otherwise sample first, middle,
     and last images. If all have the same size, return None (no filter needed).
     If sizes differ, scan all images and return the minimum width and height.
+    Odd dimensions (e.g. 120x67 thumbnails of 16:9 frames) are rounded down
+    to even, since yuv420p encoders reject them. Sizes of compacted days
+    come from their compaction record instead of opening the images.
 
     Args:
         image_paths: List of image paths to check.
@@ -206,25 +288,38 @@ def detect_resolution(
     if not image_paths:
         return None
 
+    from PIL import Image
+
+    records: dict[Path, dict | None] = {}
+
+    def image_size(path: Path) -> tuple[int, int]:
+        if path.parent not in records:
+            records[path.parent] = read_compaction(path.parent)
+        record = records[path.parent]
+        if record is not None and record["uniform"]:
+            return (record["width"], record["height"])
+        with Image.open(path) as im:
+            return im.size
+
     # Sample first, middle, last
     indices = {0, len(image_paths) // 2, len(image_paths) - 1}
-    sizes = set()
-    for idx in indices:
-        with Image.open(image_paths[idx]) as im:
-            sizes.add(im.size)
+    sizes = {image_size(image_paths[idx]) for idx in indices}
 
     if len(sizes) == 1:
-        return None  # All sampled images have the same size -- no filter needed
+        w, h = sizes.pop()
+        if w % 2 == 0 and h % 2 == 0:
+            return None  # All sampled images have the same size -- no filter needed
+        return (w - w % 2, h - h % 2)
 
     # Mixed sizes detected: scan all images for minimum bounding box
     min_w, min_h = float("inf"), float("inf")
     for path in image_paths:
-        with Image.open(path) as im:
-            w, h = im.size
-            min_w = min(min_w, w)
-            min_h = min(min_h, h)
+        w, h = image_size(path)
+        min_w = min(min_w, w)
+        min_h = min(min_h, h)
 
-    return (int(min_w), int(min_h))
+    min_w, min_h = int(min_w), int(min_h)
+    return (min_w - min_w % 2, min_h - min_h % 2)
 
 
 # ---------------------------------------------------------------------------
@@ -259,6 +354,82 @@ def write_concat_file(image_paths: list[Path], fps: float) -> Path:
     return Path(tmp.name)
 
 
+# ---------------------------------------------------------------------------
+# Deflicker
+# ---------------------------------------------------------------------------
+
+# Per-frame gain limits, so a single black or blown-out frame is not
+# amplified into noise
+_DEFLICKER_MIN_GAIN = 0.5
+_DEFLICKER_MAX_GAIN = 2.0
+
+# Skip emitting a command when the gain changes by less than this
+_DEFLICKER_GAIN_STEP = 0.005
+
+
+def compute_deflicker_gains(lumas: "np.ndarray", window: int) -> "np.ndarray":
+    """Compute per-frame gains that pull each frame toward a smoothed luminance curve.
+
+    The target curve is a centered rolling mean of the per-frame mean
+    luminance (edges padded by reflection), so slow changes such as
+    sunrise are preserved while frame-to-frame exposure jumps are evened
+    out. Fully vectorized over the whole sequence.
+
+    Args:
+        lumas: Mean luminance per frame (0-255), in output order.
+        window: Rolling window length in frames.
+
+    Returns:
+        Array of gains, one per frame, clipped to a safe range.
+    """
+    import numpy as np
+
+    lumas = np.asarray(lumas, dtype=np.float64)
+    window = max(1, min(window, len(lumas)))
+    half = window // 2
+    padded = np.pad(lumas, (half, window - 1 - half), mode="reflect")
+    kernel = np.full(window, 1.0 / window)
+    target = np.convolve(padded, kernel, mode="valid")
+    gains = target / np.maximum(lumas, 1.0)
+    return np.clip(gains, _DEFLICKER_MIN_GAIN, _DEFLICKER_MAX_GAIN)
+
+
+def write_deflicker_commands(gains: "np.ndarray", fps: float) -> Path:
+    """Write an FFmpeg sendcmd script applying per-frame gains.
+
+    Each command sets the colorchannelmixer@deflicker gains at the
+    midpoint before its frame's timestamp in the concat stream. Commands
+    are only emitted when the gain actually changes.
+
+    Args:
+        gains: Per-frame gains from compute_deflicker_gains().
+        fps: Frames per second used in the concat file.
+
+    Returns:
+        Path to the generated temporary sendcmd file.
+    """
+    duration = 1.0 / fps
+    tmp = tempfile.NamedTemporaryFile(
+        mode="w", suffix=".cmd", delete=False, prefix="timelapse_"
+    )
+    last = None
+    for index, gain in enumerate(gains):
+        if last is not None and abs(gain - last) < _DEFLICKER_GAIN_STEP:
+            continue
+        start = max(0.0, (index - 0.5) * duration)
+        tmp.write(
+            f"{start:.6f} "
+            + ", ".join(
+                f"colorchannelmixer@deflicker {channel} {gain:.4f}"
+                for channel in ("rr", "gg", "bb")
+            )
+            + ";\n"
+        )
+        last = gain
+    tmp.close()
+    return Path(tmp.name)
+
+
 # ---------------------------------------------------------------------------
 # FFmpeg command construction
 # ---------------------------------------------------------------------------
@@ -270,6 +441,8 @@ def build_ffmpeg_cmd(
     fps: float,
     resolution: tuple[int, int] | None = None,
     codec: str = "libx264",
+    deflicker_file: Path | None = None,
+    threads: int | None = None,
 ) -> list[str]:
     """Build the FFmpeg command list for timelapse encoding.
 
@@ -280,6 +453,10 @@ def build_ffmpeg_cmd(
         fps: Output framerate (capped at 60).
         resolution: (width, height) for scaling, or None to skip.
         codec: FFmpeg video codec name (default: libx264).
+        deflicker_file: sendcmd script from write_deflicker_commands(), or
+            None to skip deflickering.
+        threads: Encoder thread count, or None for FFmpeg's default
+            (one per core).
 
     Returns:
         List of command-line arguments for subprocess.
@@ -296,13 +473,22 @@ def build_ffmpeg_cmd(
         "-progress", "pipe:1",  # Machine-readable progress to stdout
         "-nostats",  # Suppress default stderr stats
     ]
+    filters = []
+    if deflicker_file is not None:
+        filters.append(
+            f"sendcmd=f='{deflicker_file}',"
+            "colorchannelmixer@deflicker=rr=1:gg=1:bb=1"
+        )
     if resolution is not None:
         w, h = resolution
-        cmd.extend([
-            "-vf",
+        filters.append(
             f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
-            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2",
-        ])
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2"
+        )
+    if filters:
+        cmd.extend(["-vf", ",".join(filters)])
+    if threads is not None:
+        cmd.extend(["-threads", str(threads)])
     cmd.append(str(output_path))
     return cmd
 
@@ -311,19 +497,131 @@ def build_ffmpeg_cmd(
 # FFmpeg execution with progress
 # ---------------------------------------------------------------------------
 
+# Lines of FFmpeg stderr kept for error reports and --verbose output
+STDERR_TAIL_LINES = 200
+
+
+@dataclass
+class FFmpegProgress:
+    """Snapshot of an FFmpeg encode, parsed from its -progress output.
+
+    Attributes:
+        frame: Frames encoded so far.
+        total_frames: Expected total number of frames (0 if unknown).
+        fps: Current encoding speed in frames per second.
+        speed: Encoding speed relative to realtime (e.g. 12.5 for "12.5x").
+        out_time_seconds: Output timestamp reached, in seconds.
+        bitrate_kbps: Current output bitrate in kbit/s.
+        finished: True once FFmpeg reports progress=end.
+    """
+
+    frame: int = 0
+    total_frames: int = 0
+    fps: float = 0.0
+    speed: float | None = None
+    out_time_seconds: float = 0.0
+    bitrate_kbps: float | None = None
+    finished: bool = False
+
+    @property
+    def percent(self) -> float:
+        """Completion percentage (0-100), or 0 if the total is unknown."""
+        if self.finished:
+            return 100.0
+        if self.total_frames <= 0:
+            return 0.0
+        return min(100.0, self.frame / self.total_frames * 100)
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Estimated seconds remaining, or None until a rate is known."""
+        if self.finished:
+            return 0.0
+        if self.fps <= 0 or self.total_frames <= 0:
+            return None
+        return max(0, self.total_frames - self.frame) / self.fps
+
+    def as_dict(self) -> dict:
+        """JSON-serializable view including derived fields."""
+        return {
+            **asdict(self),
+            "percent": round(self.percent, 1),
+            "eta_seconds": (
+                round(self.eta_seconds, 1) if self.eta_seconds is not None else None
+            ),
+        }
+
+
+def _parse_progress_value(progress: FFmpegProgress, key: str, value: str) -> None:
+    """Apply one key=value line from FFmpeg's -progress stream."""
+    try:
+        if key == "frame":
+            progress.frame = int(value)
+        elif key == "fps":
+            progress.fps = float(value)
+        elif key == "speed":
+            progress.speed = float(value.rstrip("x"))
+        elif key == "out_time_us":
+            progress.out_time_seconds = int(value) / 1_000_000
+        elif key == "bitrate":
+            progress.bitrate_kbps = float(value.removesuffix("kbits/s"))
+        elif key == "progress":
+            progress.finished = value == "end"
+    except ValueError:
+        # "N/A" values appear before the first frame is encoded
+        pass
+
+
+def print_progress_bar(progress: FFmpegProgress) -> None:
+    """Render a one-line progress bar with ETA on stderr."""
+    if progress.total_frames <= 0:
+        return
+    pct = int(progress.percent)
+    bar_len = 40
+    filled = int(bar_len * pct / 100)
+    bar = "#" * filled + "-" * (bar_len - filled)
+    eta = progress.eta_seconds
+    eta_str = f" ETA {int(eta) // 60}:{int(eta) % 60:02d}" if eta is not None else ""
+    print(
+        f"\r[{bar}] {pct}% ({progress.frame}/{progress.total_frames} frames)"
+        f"{eta_str}",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def _drain_stream(stream, lines: deque) -> None:
+    """Read a text stream to EOF, keeping only the newest lines."""
+    for line in stream:
+        lines.append(line.rstrip("\n"))
+
+
 def run_ffmpeg(
     cmd: list[str],
     total_frames: int,
     show_progress: bool = True,
     verbose: bool = False,
-) -> None:
-    """Run FFmpeg and optionally display a progress bar on stderr.
+    on_progress: Callable[[FFmpegProgress], None] | None = None,
+) -> FFmpegProgress:
+    """Run FFmpeg, parsing its progress and draining stderr concurrently.
+
+    Stdout carries the -progress key=value stream and is parsed on the
+    calling thread. Stderr is drained on a background thread into a
+    bounded ring buffer, so a long encode that emits many warnings (e.g.
+    corrupt JPEGs) can never fill the pipe and deadlock FFmpeg, and
+    memory stays bounded.
 
     Args:
         cmd: FFmpeg command as a list of arguments.
         total_frames: Expected total number of frames for progress calculation.
         show_progress: If True, render a progress bar to stderr.
-        verbose: If True, print FFmpeg's stderr output at the end.
+        verbose: If True, print the tail of FFmpeg's stderr output at the end.
+        on_progress: Optional callback invoked with an FFmpegProgress
+            snapshot after each progress block (roughly twice a second).
+
+    Returns:
+        The final FFmpegProgress snapshot.
 
     Raises:
         RuntimeError: If FFmpeg exits with a non-zero return code.
@@ -334,35 +632,40 @@ def run_ffmpeg(
         stderr=subprocess.PIPE,
         text=True,
     )
-    current_frame = 0
-    for line in proc.stdout:
-        line = line.strip()
-        if line.startswith("frame="):
-            try:
-                current_frame = int(line.split("=", 1)[1])
-            except (ValueError, IndexError):
+
+    stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+    stderr_thread = threading.Thread(
+        target=_drain_stream, args=(proc.stderr, stderr_tail), daemon=True
+    )
+    stderr_thread.start()
+
+    progress = FFmpegProgress(total_frames=total_frames)
+    try:
+        for line in proc.stdout:
+            key, sep, value = line.strip().partition("=")
+            if not sep:
                 continue
-            if show_progress and total_frames > 0:
-                pct = min(100, int(current_frame / total_frames * 100))
-                bar_len = 40
-                filled = int(bar_len * pct / 100)
-                bar = "#" * filled + "-" * (bar_len - filled)
-                print(
-                    f"\r[{bar}] {pct}% ({current_frame}/{total_frames} frames)",
-                    end="",
-                    file=sys.stderr,
-                    flush=True,
-                )
-        elif line == "progress=end":
-            break
-
-    proc.wait()
+            _parse_progress_value(progress, key, value.strip())
+            # Each progress block ends with a progress=continue|end line
+            if key == "progress":
+                snapshot = replace(progress)
+                if show_progress:
+                    print_progress_bar(snapshot)
+                if on_progress is not None:
+                    on_progress(snapshot)
+    except BaseException:
+        # A failing callback (or Ctrl+C) must not leave FFmpeg running
+        proc.kill()
+        raise
+    finally:
+        proc.wait()
+        stderr_thread.join()
 
     # Always print a newline after the progress bar
     if show_progress:
         print(file=sys.stderr)
 
-    stderr_output = proc.stderr.read()
+    stderr_output = "\n".join(stderr_tail)
 
     if verbose and stderr_output:
         print("FFmpeg output:", file=sys.stderr)
@@ -373,6 +676,8 @@ def run_ffmpeg(
             f"FFmpeg failed (exit {proc.returncode}):\n{stderr_output}"
         )
 
+    return progress
+
 
 # ---------------------------------------------------------------------------
 # Duration parser
@@ -477,10 +782,16 @@ def generate_timelapse(
     sort: str = "filename",
     resolution: tuple[int, int] | None = None,
     codec: str = "libx264",
+    threads: int | None = None,
+    dedupe: int | None = None,
+    min_brightness: float | None = None,
+    deflicker: int | None = None,
+    tier_dirs: list[Path] | None = None,
     dry_run: bool = False,
     show_progress: bool = True,
     verbose: bool = False,
     silent: bool = False,
+    on_progress: Callable[[FFmpegProgress], None] | None = None,
 ) -> Path:
     """Orchestrate the full timelapse generation pipeline.
 
@@ -495,10 +806,20 @@ def generate_timelapse(
         sort: Image sort order ("filename", "mtime", "random").
         resolution: Explicit output resolution (width, height), or None for auto.
         codec: FFmpeg video codec name.
+        threads: FFmpeg encoder thread count, or None for the default.
+        dedupe: If set, collapse runs of near-duplicate frames whose hashes
+            differ by at most this many bits. None disables deduplication.
+        min_brightness: If set, skip images with mean luminance (0-255)
+            below this level.
+        deflicker: If set, smooth exposure over a rolling window of this
+            many frames. None disables deflickering.
+        tier_dirs: Secondary storage tiers holding migrated days.
         dry_run: If True, show what would be done without encoding.
         show_progress: If True, display a progress bar during encoding.
         verbose: If True, show detailed FFmpeg output.
         silent: If True, suppress gap warnings.
+        on_progress: Optional callback receiving FFmpegProgress snapshots
+            during encoding.
 
     Returns:
         Path to the output video file.
@@ -518,6 +839,8 @@ def generate_timelapse(
         use_thumbnails=use_thumbnails,
         every_n=every_n,
         sort=sort,
+        min_brightness=min_brightness,
+        tier_dirs=tier_dirs,
     )
     if not images:
         print(
@@ -526,8 +849,21 @@ def generate_timelapse(
         )
         sys.exit(1)
 
-    # 3. Detect gaps and warn
-    gaps = detect_gaps(images_dir, start, end)
+    # 3. Collapse near-duplicate runs (before FPS so duration is preserved)
+    removed = 0
+    if dedupe is not None:
+        original_count = len(images)
+        images = dedupe_images(images, dedupe)
+        removed = original_count - len(images)
+        if not silent:
+            print(
+                f"Dedupe: removed {removed} near-duplicate frame(s), "
+                f"{len(images)} remain",
+                file=sys.stderr,
+            )
+
+    # 4. Detect gaps and warn
+    gaps = detect_gaps(images_dir, start, end, tier_dirs)
     if gaps and not silent:
         gap_strs = [g.isoformat() for g in gaps]
         print(
@@ -536,7 +872,7 @@ def generate_timelapse(
             file=sys.stderr,
         )
 
-    # 4. Calculate FPS (may auto-subsample)
+    # 5. Calculate FPS (may auto-subsample)
     fps, auto_every = calculate_fps(len(images), duration_seconds)
     if auto_every > 1:
         if not silent:
@@ -549,31 +885,49 @@ def generate_timelapse(
         # Recalculate fps with the subsampled count
         fps = len(images) / duration_seconds
 
-    # 5. Detect resolution (scaling needed?)
+    # 6. Detect resolution (scaling needed?)
     resolved_resolution = detect_resolution(images, resolution)
 
-    # 6. Generate default output path if not given
+    # 7. Compute deflicker gains from cached luminance (one vectorized pass)
+    gains = None
+    if deflicker is not None:
+        from timelapse.analysis import image_stats
+
+        lumas = [stats["luma"] for stats in image_stats(images)]
+        gains = compute_deflicker_gains(lumas, deflicker)
+
+    # 8. Generate default output path if not given
     if output_path is None:
         output_path = Path(
             f"timelapse_{start.isoformat()}_{end.isoformat()}.mp4"
         )
 
-    # 7. Dry run: print summary and return
+    # 9. Dry run: print summary and return
     if dry_run:
         est_duration = len(images) / fps if fps > 0 else 0
         print(f"Images:   {len(images)}")
+        if dedupe is not None:
+            print(f"Removed:  {removed} near-duplicate(s)")
         print(f"FPS:      {fps:.1f}")
         print(f"Duration: {est_duration:.1f}s ({est_duration / 60:.1f}m)")
         print(f"Output:   {output_path}")
         if resolved_resolution:
             print(f"Scale to: {resolved_resolution[0]}x{resolved_resolution[1]}")
+        if gains is not None:
+            print(
+                f"Deflicker: {deflicker}-frame window, "
+                f"gain {gains.min():.2f}-{gains.max():.2f}"
+            )
         return output_path
 
-    # 8. Write concat file
+    # 10. Write concat file (and deflicker command script)
     concat_file = write_concat_file(images, fps)
+    deflicker_file = (
+        write_deflicker_commands(gains, fps) if gains is not None else None
+    )
 
     try:
-        # 9. Build FFmpeg command
+        # 11. Build FFmpeg command
         cmd = build_ffmpeg_cmd(
             ffmpeg_path=ffmpeg_path,
             concat_file=concat_file,
@@ -581,18 +935,29 @@ def generate_timelapse(
             fps=fps,
             resolution=resolved_resolution,
             codec=codec,
+            deflicker_file=deflicker_file,
+            threads=threads,
         )
 
-        # 10. Run FFmpeg with progress
-        run_ffmpeg(cmd, len(images), show_progress=show_progress, verbose=verbose)
+        # 12. Run FFmpeg with progress
+        run_ffmpeg(
+            cmd,
+            len(images),
+            show_progress=show_progress,
+            verbose=verbose,
+            on_progress=on_progress,
+        )
     finally:
-        # 11. Clean up temp concat file
-        try:
-            os.unlink(concat_file)
-        except OSError:
-            pass
+        # 13. Clean up temp concat file (and deflicker command script)
+        for tmp_file in (concat_file, deflicker_file):
+            if tmp_file is None:
+                continue
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
 
-    # 12. Print summary line
+    # 14. Print summary line
     file_size = output_path.stat().st_size
     size_mb = file_size / (1024 * 1024)
     est_duration = len(images) / fps if fps > 0 else 0
@@ -626,6 +991,8 @@ def generate_timelapse(
         f"Duration: {actual_duration_str}\n"
         f"Frames:   {len(images)} at {fps:.1f} fps"
     )
+    if dedupe is not None:
+        print(f"Removed:  {removed} near-duplicate frame(s)")
 
-    # 13. Return output path
+    # 15. Return output path
     return output_path
@@ -1,8 +1,11 @@
 """File-based camera mutex using fcntl.flock.
 
 Provides a context manager that acquires an exclusive lock on a lock file
-to prevent simultaneous camera access between the capture daemon and the
-web server (Phase 2).
+to prevent simultaneous camera access. Today only the capture daemon takes
+it (so a second daemon instance cannot open the same device); the web UI
+never touches a camera, and a web live view (Phase 2) would take the same
+per-device lock. Each camera device has its own lock file (see
+camera_lock_path()), so several cameras can capture at the same time.
 """
 
 import fcntl
@@ -13,6 +16,11 @@ from contextlib import contextmanager
 logger = logging.getLogger("timelapse.lock")
 
 
+def camera_lock_path(device_id: str) -> str:
+    """Return the lock file path for one camera device (e.g. "usb0")."""
+    return f"/tmp/timelapse-camera-{device_id}.lock"
+
+
 @contextmanager
 def camera_lock(lock_path: str = "/tmp/timelapse-camera.lock", blocking: bool = True):
     """Acquire an exclusive camera lock.
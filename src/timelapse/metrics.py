@@ -0,0 +1,262 @@
+"""Prometheus-style counters, gauges and histograms.
+
+Each process (capture daemon, web UI) records into its own REGISTRY
+through inc(), set_gauge(), observe() and timed(). Every metric is
+declared once in METRICS below, which doubles as the list of what is
+exported. Recording is a dict update under a lock, cheap enough for
+every capture and request on a Pi Zero.
+
+The daemon shares REGISTRY.snapshot() with the web UI without adding
+writes to the SD card: on the live status socket (storage.status_socket)
+with every status update, and as ``.metrics.json`` next to the status
+file. The file is rewritten every metrics.interval seconds when
+storage.status_dir moves it to tmpfs, but only hourly and on shutdown
+when it would sit in output_dir. The web UI's /metrics endpoint prefers
+the socket, falls back to the file, and renders both processes in the
+Prometheus text exposition format, with a ``process`` label telling
+them apart.
+"""
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+METRICS_FILENAME = ".metrics.json"
+
+# Minimum seconds between metrics file writes when the file is in output_dir
+SD_WRITE_INTERVAL = 3600
+
+# Upper bounds (seconds) of histogram buckets
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# name -> (type, help)
+METRICS = {
+    "timelapse_captures_total": ("counter", "Captures attempted, by camera and result."),
+    "timelapse_capture_seconds": (
+        "histogram",
+        "Time to capture and write one image, including waiting for the camera lock.",
+    ),
+    "timelapse_thumbnail_seconds": ("histogram", "Time to generate one thumbnail."),
+    "timelapse_analysis_seconds": (
+        "histogram",
+        "Time to compute one capture's image statistics and change score.",
+    ),
+    "timelapse_capture_queue_depth": (
+        "gauge",
+        "Cameras due or overdue when the last capture started.",
+    ),
+    "timelapse_disk_sample_seconds": (
+        "histogram",
+        "Time to query filesystem usage (cached samples are not counted).",
+    ),
+    "timelapse_cleanup_seconds": ("histogram", "Time spent in one retention cleanup pass."),
+    "timelapse_status_write_seconds": (
+        "histogram",
+        "Time to write the status or metrics file, by file.",
+    ),
+    "timelapse_http_request_seconds": (
+        "histogram",
+        "Web request handling time, by endpoint, method and status.",
+    ),
+    "timelapse_http_response_bytes_total": (
+        "counter",
+        "Response body bytes sent, by endpoint (chunked responses excluded).",
+    ),
+    "timelapse_daemon_metrics_age_seconds": (
+        "gauge",
+        "Age of the daemon metrics served (from the status socket or metrics file).",
+    ),
+}
+
+
+def metrics_file_path(config: dict) -> Path:
+    """Return the daemon metrics file location (next to the status file)."""
+    storage = config["storage"]
+    return Path(storage.get("status_dir") or storage["output_dir"]) / METRICS_FILENAME
+
+
+class MetricsRegistry:
+    """Thread-safe store of metric samples for one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # name -> {label tuple: value}; histogram values are
+        # [per-bucket counts..., +Inf count, sum]
+        self._samples: dict[str, dict[tuple, object]] = {}
+
+    def _family(self, name: str, kind: str) -> dict:
+        if METRICS[name][0] != kind:
+            raise ValueError(f"{name} is a {METRICS[name][0]}, not a {kind}")
+        return self._samples.setdefault(name, {})
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Add value to a counter."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._family(name, "counter")
+            family[key] = family.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Set a gauge."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._family(name, "gauge")[key] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record one observation (in seconds) in a histogram."""
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(DEFAULT_BUCKETS, value)
+        with self._lock:
+            family = self._family(name, "histogram")
+            counts = family.get(key)
+            if counts is None:
+                counts = family[key] = [0] * (len(DEFAULT_BUCKETS) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def snapshot(self) -> dict:
+        """Return all samples as JSON-serializable data.
+
+        Returns:
+            Dict mapping metric name to a list of [labels dict, value].
+        """
+        with self._lock:
+            return {
+                name: [
+                    [dict(key), list(value) if isinstance(value, list) else value]
+                    for key, value in family.items()
+                ]
+                for name, family in self._samples.items()
+            }
+
+
+REGISTRY = MetricsRegistry()
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Add value to a counter in this process's registry."""
+    REGISTRY.inc(name, value, **labels)
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    """Set a gauge in this process's registry."""
+    REGISTRY.set_gauge(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    """Record a histogram observation in this process's registry."""
+    REGISTRY.observe(name, value, **labels)
+
+
+@contextmanager
+def timed(name: str, **labels):
+    """Observe the wall-clock duration of the with-block in a histogram."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(name, time.perf_counter() - started, **labels)
+
+
+def summarize_ms(values) -> dict | None:
+    """Return last, mean and max of millisecond samples, or None if empty."""
+    values = list(values)
+    if not values:
+        return None
+    return {
+        "last": round(values[-1], 1),
+        "mean": round(sum(values) / len(values), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def _valid_payload(data) -> bool:
+    return isinstance(data, dict) and isinstance(data.get("metrics"), dict)
+
+
+def read_metrics(path: Path, socket_path: Path | None = None) -> dict | None:
+    """Read the daemon's latest metrics snapshot.
+
+    Args:
+        path: Metrics file written by the daemon.
+        socket_path: Live status socket to try first, or None. The file
+            is read if the socket is unavailable.
+
+    Returns:
+        Dict with "updated" (epoch seconds) and "metrics" (a snapshot),
+        or None if neither source has one.
+    """
+    if socket_path is not None:
+        # status imports this module for its write timings
+        from timelapse.status import read_status_socket
+
+        live = (read_status_socket(socket_path) or {}).get("metrics")
+        if _valid_payload(live):
+            return live
+
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if _valid_payload(data) else None
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render(snapshots: list[tuple[dict, dict]]) -> str:
+    """Render snapshots in the Prometheus text exposition format.
+
+    Args:
+        snapshots: (snapshot, extra labels) pairs, e.g. the web registry
+            labelled process="web" and the daemon's labelled
+            process="daemon". Metrics not declared in METRICS (from a
+            newer or older daemon) are skipped.
+
+    Returns:
+        The exposition text, ending with a newline.
+    """
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        samples = [
+            ({**extra, **labels}, value)
+            for snapshot, extra in snapshots
+            for labels, value in snapshot.get(name, [])
+        ]
+        if not samples:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            if kind != "histogram":
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                continue
+            if len(value) != len(DEFAULT_BUCKETS) + 2:
+                continue  # bucket layout from a different version
+            cumulative = 0
+            for bound, count in zip((*DEFAULT_BUCKETS, "+Inf"), value[:-1]):
+                cumulative += count
+                le = bound if bound == "+Inf" else _number(bound)
+                lines.append(f"{name}_bucket{_labels({**labels, 'le': le})} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(value[-1])}")
+            lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,152 @@
+"""Precomputed per-day preview videos.
+
+Each finished day gets a short, low-resolution MP4 encoded from its
+``thumbs/`` images and stored alongside them as
+``YYYY/MM/DD/preview.mp4``, so the Timeline tab can play any past day
+without encoding at request time. Previews live inside the day
+directory, so retention cleanup removes them with the day.
+
+The capture daemon calls generate_missing_previews() in a background
+thread at startup and after midnight. FFmpeg runs single-threaded and
+under ``nice`` so encoding never competes with capture.
+"""
+
+import logging
+import os
+import shutil
+from datetime import date
+from pathlib import Path
+
+from timelapse.generate import (
+    build_ffmpeg_cmd,
+    calculate_fps,
+    check_ffmpeg,
+    collect_images,
+    detect_resolution,
+    run_ffmpeg,
+    write_concat_file,
+)
+from timelapse.storage.tiering import day_dir, iter_day_dirs
+
+logger = logging.getLogger("timelapse.previews")
+
+PREVIEW_FILENAME = "preview.mp4"
+
+# Encoded next to the final file, then renamed into place
+_PARTIAL_FILENAME = ".preview.partial.mp4"
+
+
+def preview_path(images_dir: Path, day: date) -> Path:
+    """Return the preview video path for a day (which may not exist)."""
+    return day_dir(images_dir, day) / PREVIEW_FILENAME
+
+
+def generate_day_preview(
+    images_dir: Path,
+    day: date,
+    duration_seconds: int = 10,
+    ffmpeg_path: str | None = None,
+) -> Path | None:
+    """Encode the preview video for one day from its thumbnails.
+
+    The video is written to a temporary file and renamed into place, so
+    a partially encoded preview is never served.
+
+    Args:
+        images_dir: Root image directory.
+        day: Day to encode.
+        duration_seconds: Target preview duration.
+        ffmpeg_path: FFmpeg binary, or None to look it up.
+
+    Returns:
+        Path to the preview, or None if the day has no thumbnails.
+
+    Raises:
+        SystemExit: If FFmpeg is not installed.
+        RuntimeError: If FFmpeg encoding fails.
+    """
+    if ffmpeg_path is None:
+        ffmpeg_path = check_ffmpeg()
+
+    images = collect_images(images_dir, day, day, use_thumbnails=True)
+    if not images:
+        return None
+
+    fps, every_n = calculate_fps(len(images), duration_seconds)
+    if every_n > 1:
+        images = images[::every_n]
+        fps = len(images) / duration_seconds
+
+    output_path = preview_path(images_dir, day)
+    partial_path = output_path.with_name(_PARTIAL_FILENAME)
+    concat_file = write_concat_file(images, fps)
+    try:
+        cmd = build_ffmpeg_cmd(
+            ffmpeg_path=ffmpeg_path,
+            concat_file=concat_file,
+            output_path=partial_path,
+            fps=fps,
+            resolution=detect_resolution(images),
+            threads=1,
+        )
+        nice_path = shutil.which("nice")
+        if nice_path:
+            cmd = [nice_path, "-n", "19", *cmd]
+        run_ffmpeg(cmd, len(images), show_progress=False)
+        os.replace(partial_path, output_path)
+    finally:
+        try:
+            os.unlink(concat_file)
+        except OSError:
+            pass
+        try:
+            partial_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    return output_path
+
+
+def generate_missing_previews(
+    images_dir: Path,
+    before: date,
+    duration_seconds: int = 10,
+) -> int:
+    """Encode previews for every day before ``before`` that lacks one.
+
+    Days that fail to encode are logged and skipped, to be retried on
+    the next run.
+
+    Args:
+        images_dir: Root image directory.
+        before: First day to exclude (normally today, which is still
+            being captured).
+        duration_seconds: Target preview duration.
+
+    Returns:
+        Count of previews created.
+
+    Raises:
+        SystemExit: If FFmpeg is not installed.
+    """
+    images_dir = Path(images_dir)
+    if not images_dir.is_dir():
+        return 0
+
+    ffmpeg_path = None
+    created = 0
+    for day, path in iter_day_dirs(images_dir):
+        if day >= before or (path / PREVIEW_FILENAME).exists():
+            continue
+        if not (path / "thumbs").is_dir():
+            continue
+        if ffmpeg_path is None:
+            ffmpeg_path = check_ffmpeg()
+        try:
+            if generate_day_preview(images_dir, day, duration_seconds, ffmpeg_path):
+                created += 1
+                logger.info("Created preview for %s", day)
+        except RuntimeError as exc:
+            logger.error("Preview encoding failed for %s: %s", day, exc)
+
+    return created
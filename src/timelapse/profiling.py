@@ -0,0 +1,156 @@
+"""On-demand cProfile sessions over a hot path.
+
+A CycleProfiler stays idle until armed with a number of cycles, then
+runs cProfile around each of the next cycles (the daemon's capture
+cycles, or the web UI's requests) and writes the accumulated stats next
+to the status file once they are done:
+
+    .profile-<name>-<YYYYmmdd-HHMMSS>.prof   binary, for pstats or snakeviz
+    .profile-<name>-<YYYYmmdd-HHMMSS>.txt    top functions by cumulative time
+
+The daemon arms its profiler on SIGUSR1 (for metrics.profile_cycles
+captures); the Control tab's /control/profile endpoint arms either
+process. Only the newest few dumps per process are kept. When idle the
+cost is one attribute check per cycle.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger("timelapse.profiling")
+
+# Dumps kept per profiler; older ones are deleted
+_KEEP_DUMPS = 5
+
+# Functions listed in the text summary
+_SUMMARY_LINES = 40
+
+
+class CycleProfiler:
+    """Profiles the next N cycles of a hot path when armed.
+
+    Args:
+        output_dir: Directory the stats are written to.
+        name: Process name used in dump file names ("daemon", "web").
+    """
+
+    def __init__(self, output_dir: Path, name: str):
+        self._output_dir = Path(output_dir)
+        self._name = name
+        # Only one cycle is profiled at a time; cProfile is per-thread
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._profile: cProfile.Profile | None = None
+        self._cycles = 0
+        self._started: float | None = None
+        self._last_dump: str | None = None
+
+    def arm(self, cycles: int) -> None:
+        """Profile the next cycles cycles (restarting the count if active).
+
+        Only sets a counter, so it is safe to call from a signal handler.
+        """
+        self._remaining = max(0, int(cycles))
+
+    @property
+    def active(self) -> bool:
+        return self._remaining > 0
+
+    def start(self) -> bool:
+        """Begin profiling a cycle if armed.
+
+        Returns:
+            True if this cycle is profiled; stop() must then be called
+            from the same thread.
+        """
+        if self._remaining <= 0 or not self._lock.acquire(blocking=False):
+            return False
+        if self._remaining <= 0:
+            self._lock.release()
+            return False
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+            self._cycles = 0
+            self._started = time.monotonic()
+        try:
+            self._profile.enable()
+        except ValueError as exc:
+            # Another profiler (a debugger, a second session) is active
+            logger.warning("Cannot profile %s: %s", self._name, exc)
+            self._remaining = 0
+            self._profile = None
+            self._lock.release()
+            return False
+        return True
+
+    def stop(self) -> None:
+        """End a cycle begun by start(); dumps the stats after the last one."""
+        try:
+            self._profile.disable()
+            self._cycles += 1
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self._dump()
+        finally:
+            self._lock.release()
+
+    @contextmanager
+    def cycle(self):
+        """Profile the with-block if the profiler is armed."""
+        profiling = self.start()
+        try:
+            yield
+        finally:
+            if profiling:
+                self.stop()
+
+    def status(self) -> dict:
+        """Profiler state for the status file and the Control tab."""
+        return {
+            "active": self.active,
+            "remaining": self._remaining,
+            "last_dump": self._last_dump,
+        }
+
+    def _dump(self) -> None:
+        profile, self._profile = self._profile, None
+        self._remaining = 0
+        stem = f".profile-{self._name}-{datetime.now():%Y%m%d-%H%M%S}"
+        elapsed = time.monotonic() - self._started
+        try:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            prof_path = self._output_dir / f"{stem}.prof"
+            profile.dump_stats(prof_path)
+
+            summary = io.StringIO()
+            summary.write(
+                f"{self._cycles} {self._name} cycle(s) profiled over {elapsed:.1f}s\n\n"
+            )
+            stats = pstats.Stats(profile, stream=summary)
+            stats.sort_stats("cumulative").print_stats(_SUMMARY_LINES)
+            (self._output_dir / f"{stem}.txt").write_text(summary.getvalue())
+        except OSError as exc:
+            logger.error("Could not write profile to %s: %s", self._output_dir, exc)
+            return
+
+        self._last_dump = str(prof_path)
+        logger.info(
+            "Profiled %d %s cycle(s), stats written to %s",
+            self._cycles,
+            self._name,
+            prof_path,
+        )
+        self._prune()
+
+    def _prune(self) -> None:
+        dumps = sorted(self._output_dir.glob(f".profile-{self._name}-*.prof"))
+        for old in dumps[:-_KEEP_DUMPS]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".txt").unlink(missing_ok=True)
@@ -0,0 +1,161 @@
+"""Capture interval scheduling.
+
+Provides an adaptive interval that shortens while the scene is changing
+and lengthens while it is static, driven by per-capture change scores,
+and the capture slot arithmetic used by the daemon's timer heap.
+
+Slots are absolute wall-clock times. With alignment on they fall on
+multiples of the interval counted from local midnight (an interval of
+30 captures at :00 and :30), so a slow capture delays only itself, never
+the slots after it. SlotTracker counts slots run late and slots missed.
+"""
+
+import logging
+import math
+from collections import deque
+from datetime import datetime, timedelta
+
+from timelapse.metrics import summarize_ms
+
+logger = logging.getLogger("timelapse.scheduler")
+
+# A capture starting this many seconds after its slot counts as late
+LATE_THRESHOLD = 1.0
+
+# Slots kept for lateness statistics
+_LATENESS_SAMPLES = 100
+
+
+def next_slot(after: float, interval: float, align: bool = True) -> float:
+    """Return the first capture slot strictly after a wall-clock time.
+
+    Args:
+        after: Wall-clock time (epoch seconds), usually the previous slot.
+        interval: Seconds between slots.
+        align: Place slots on multiples of interval since local midnight.
+            Each day's grid restarts at midnight, so intervals that do not
+            divide a day still land on the same times every day.
+            Otherwise the slot is simply after + interval.
+
+    Returns:
+        The slot as epoch seconds.
+    """
+    if not align:
+        return after + interval
+    midnight_dt = datetime.fromtimestamp(after).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    midnight = midnight_dt.timestamp()
+    slot = midnight + (math.floor((after - midnight) / interval) + 1) * interval
+    return min(slot, (midnight_dt + timedelta(days=1)).timestamp())
+
+
+class SlotTracker:
+    """Late and missed capture slot statistics for one camera.
+
+    Args:
+        late_threshold: Seconds after its slot at which a capture is late.
+    """
+
+    def __init__(self, late_threshold: float = LATE_THRESHOLD):
+        self._late_threshold = late_threshold
+        self.run = 0
+        self.late = 0
+        self.missed = 0
+        self._lateness_ms: deque[float] = deque(maxlen=_LATENESS_SAMPLES)
+
+    def record(self, slot: float, started: float) -> None:
+        """Record a capture started at wall-clock time started for slot."""
+        lateness = max(0.0, started - slot)
+        self.run += 1
+        self._lateness_ms.append(lateness * 1000)
+        if lateness > self._late_threshold:
+            self.late += 1
+            logger.debug("Capture started %.2fs after its slot", lateness)
+
+    def skip(self, count: int) -> None:
+        """Record slots that passed without a capture."""
+        if count > 0:
+            self.missed += count
+            logger.warning("Missed %d capture slot(s)", count)
+
+    def summary(self) -> dict:
+        """Slot counters and lateness (last/mean/max ms) for the status file."""
+        return {
+            "run": self.run,
+            "late": self.late,
+            "missed": self.missed,
+            "lateness_ms": summarize_ms(self._lateness_ms),
+        }
+
+
+class AdaptiveInterval:
+    """Capture interval that adapts to scene activity.
+
+    The interval halves whenever a capture's change score reaches the
+    active threshold, so bursts of activity are caught quickly, and
+    grows by 25% per static capture so quiet periods back off gradually.
+    Scores between the thresholds leave the interval unchanged.
+
+    Args:
+        base_interval: Starting interval in seconds.
+        min_interval: Shortest allowed interval in seconds.
+        max_interval: Longest allowed interval in seconds.
+        active_threshold: Change score (percent) at or above which the
+            scene counts as active.
+        static_threshold: Change score (percent) at or below which the
+            scene counts as static.
+    """
+
+    _SHORTEN_FACTOR = 0.5
+    _LENGTHEN_FACTOR = 1.25
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        active_threshold: float,
+        static_threshold: float,
+    ):
+        self._min = min_interval
+        self._max = max_interval
+        self._active = active_threshold
+        self._static = static_threshold
+        self._interval = self._clamp(base_interval)
+
+    @property
+    def interval(self) -> float:
+        """Current interval in seconds."""
+        return self._interval
+
+    def update(self, score: float | None) -> float:
+        """Adjust the interval for the latest change score.
+
+        Args:
+            score: Change score from the latest capture, or None if there
+                was nothing to compare against.
+
+        Returns:
+            The new interval in seconds.
+        """
+        if score is None:
+            return self._interval
+
+        previous = self._interval
+        if score >= self._active:
+            self._interval = self._clamp(self._interval * self._SHORTEN_FACTOR)
+        elif score <= self._static:
+            self._interval = self._clamp(self._interval * self._LENGTHEN_FACTOR)
+
+        if self._interval != previous:
+            logger.debug(
+                "Change score %.2f: interval %.1fs -> %.1fs",
+                score,
+                previous,
+                self._interval,
+            )
+        return self._interval
+
+    def _clamp(self, value: float) -> float:
+        return min(self._max, max(self._min, value))
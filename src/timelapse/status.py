@@ -4,32 +4,82 @@ Provides functions to write and read a JSON status file used to communicate
 daemon state to the web UI (Phase 2). Writes are atomic: data is written to
 a temporary file in the same directory, then renamed to the target path.
 This prevents readers from seeing a partially-written file.
+
+The daemon publishes through StatusPublisher, which only rewrites the
+file when something other than the uptime counter changed, and coalesces
+routine updates (new captures, disk figures) to at most one write per
+storage.status_min_interval. The file can be moved off the SD card with
+storage.status_dir (e.g. the /run/timelapse tmpfs). Readers that want
+every update can connect to the optional storage.status_socket Unix
+socket, which always returns the latest status without touching disk.
+The socket can also carry data that is never written to the file, such
+as the daemon's metrics snapshot.
 """
 
 import json
 import logging
 import os
+import socket
 import tempfile
+import threading
+import time
 from pathlib import Path
 
+from timelapse.metrics import observe
+
 logger = logging.getLogger("timelapse.status")
 
+STATUS_FILENAME = ".status.json"
+
+# Changes to these keys are written immediately rather than coalesced
+_IMMEDIATE_KEYS = (
+    "daemon",
+    "camera",
+    "last_capture_success",
+    "storage_pressure",
+    "config_loaded",
+)
+
+# Keys that change on every update and never justify a write on their own
+_VOLATILE_KEYS = ("uptime_seconds",)
+
+
+def status_file_path(config: dict) -> Path:
+    """Return the status file location for a configuration.
+
+    Both the daemon and the web UI derive the path from the same config,
+    so they agree on where it lives.
+    """
+    storage = config["storage"]
+    return Path(storage.get("status_dir") or storage["output_dir"]) / STATUS_FILENAME
+
+
+def status_socket_path(config: dict) -> Path | None:
+    """Return the live status socket path, or None if it is disabled."""
+    sock = config["storage"].get("status_socket")
+    return Path(sock) if sock else None
+
 
 def write_status(status_path: Path, data: dict) -> None:
     """Write status data to a JSON file atomically.
 
     Writes to a temporary file in the same directory as status_path, then
     renames it to the target path. This ensures readers never see a
-    partially-written file.
+    partially-written file. The daemon also writes its metrics
+    snapshot with it. Write times are recorded per file name in the
+    timelapse_status_write_seconds metric.
 
     Args:
         status_path: Path to the status JSON file.
         data: Dictionary of status data. Expected keys:
             daemon, camera, last_capture, last_capture_success,
-            consecutive_failures, captures_today, disk_usage_percent,
-            disk_free_gb, uptime_seconds, config_loaded
+            consecutive_failures, captures_today, capture_interval,
+            change_score, disk_usage_percent, disk_total_gb, disk_used_gb,
+            disk_free_gb, disk_forecast, storage_pressure, capture_quality,
+            write_latency, capture_cpu, uptime_seconds, config_loaded
     """
     status_path = Path(status_path)
+    started = time.perf_counter()
     status_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to a temp file in the same directory, then rename for atomicity
@@ -38,8 +88,13 @@ def write_status(status_path: Path, data: dict) -> None:
     )
     try:
         with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+            json.dump(data, f, separators=(",", ":"), default=str)
         os.rename(tmp_path, status_path)
+        observe(
+            "timelapse_status_write_seconds",
+            time.perf_counter() - started,
+            file=status_path.name,
+        )
         logger.debug("Status file written: %s", status_path)
     except Exception:
         # Clean up temp file on failure
@@ -50,16 +105,23 @@ def write_status(status_path: Path, data: dict) -> None:
         raise
 
 
-def read_status(status_path: Path) -> dict | None:
+def read_status(status_path: Path, socket_path: Path | None = None) -> dict | None:
     """Read status data from a JSON file.
 
     Args:
         status_path: Path to the status JSON file.
+        socket_path: Live status socket to try first, or None. The file
+            is read if the socket is unavailable.
 
     Returns:
         A dict of status data, or None if the file does not exist or
         cannot be parsed.
     """
+    if socket_path is not None:
+        status = read_status_socket(socket_path)
+        if status is not None:
+            return status
+
     status_path = Path(status_path)
     if not status_path.exists():
         return None
@@ -70,3 +132,147 @@ def read_status(status_path: Path) -> dict | None:
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Could not read status file %s: %s", status_path, exc)
         return None
+
+
+def read_status_socket(socket_path: Path, timeout: float = 0.5) -> dict | None:
+    """Fetch the latest status from a StatusPublisher's Unix socket.
+
+    Args:
+        socket_path: Path to the status socket.
+        timeout: Seconds to wait for the daemon to answer.
+
+    Returns:
+        A dict of status data, or None if the socket is unavailable.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+        return json.loads(b"".join(chunks))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+class StatusPublisher:
+    """Publishes daemon status to the status file and optional socket.
+
+    Args:
+        status_path: Path to the status JSON file.
+        min_interval: Minimum seconds between routine file writes. Changes
+            to the daemon state, camera, capture success or storage
+            pressure are always written immediately.
+        socket_path: Unix socket to serve the latest status on, or None.
+    """
+
+    def __init__(
+        self,
+        status_path: Path,
+        min_interval: float = 60,
+        socket_path: Path | None = None,
+    ):
+        self._status_path = Path(status_path)
+        self.min_interval = min_interval
+        self._socket_path = Path(socket_path) if socket_path else None
+        self._lock = threading.Lock()
+        self._latest = b"{}"
+        self._written: dict | None = None
+        self._written_at = 0.0
+        self._server: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start serving the socket, if one is configured.
+
+        Failure to bind is logged and leaves file publication working.
+        """
+        if self._socket_path is None:
+            return
+        try:
+            self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+            # Left behind by a daemon that did not shut down cleanly
+            self._socket_path.unlink(missing_ok=True)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(str(self._socket_path))
+            server.listen(8)
+            server.settimeout(0.5)
+        except OSError as exc:
+            logger.warning(
+                "Could not open status socket %s: %s", self._socket_path, exc
+            )
+            return
+        self._server = server
+        self._thread = threading.Thread(
+            target=self._serve, name="status-socket", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop serving the socket and remove it."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        server.close()
+        self._socket_path.unlink(missing_ok=True)
+
+    def _serve(self) -> None:
+        while self._server is not None:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            with conn:
+                with self._lock:
+                    payload = self._latest
+                try:
+                    conn.sendall(payload)
+                except OSError:
+                    pass
+
+    @property
+    def serves_socket(self) -> bool:
+        """Whether the live status socket is open."""
+        return self._server is not None
+
+    def publish(self, data: dict, live: dict | None = None) -> bool:
+        """Publish a status update.
+
+        Args:
+            data: Status data.
+            live: Extra keys served on the socket only, never written to
+                the file, or None.
+
+        The socket always serves the new data. The file is rewritten only
+        if a material field changed, and routine changes are held back
+        until min_interval has passed since the last write; the held-back
+        state goes out with the next publish after that.
+
+        Returns:
+            True if the status file was written.
+        """
+        with self._lock:
+            self._latest = json.dumps(
+                {**data, **live} if live else data, separators=(",", ":"), default=str
+            ).encode()
+
+        material = {k: v for k, v in data.items() if k not in _VOLATILE_KEYS}
+        if material == self._written:
+            return False
+
+        now = time.monotonic()
+        urgent = self._written is None or any(
+            material.get(key) != self._written.get(key) for key in _IMMEDIATE_KEYS
+        )
+        if not urgent and now - self._written_at < self.min_interval:
+            return False
+
+        write_status(self._status_path, data)
+        self._written = material
+        self._written_at = now
+        return True
@@ -1,6 +1,28 @@
-"""Storage management: disk space checking, path generation, and cleanup."""
+"""Storage management: disk space checking, path generation, cleanup, tiering,
+compaction, crash-safe capture writes, stats sidecars, and capture traces."""
 
 from timelapse.storage.manager import StorageManager
 from timelapse.storage.cleanup import cleanup_old_days
+from timelapse.storage.compaction import compact_old_days, read_compaction
+from timelapse.storage.durable import CaptureWriter, quarantine_truncated
+from timelapse.storage.sidecar import append_stats, load_day_stats
+from timelapse.storage.usage import DiskUsageSampler
+from timelapse.storage.tiering import find_day_dir, migrate_old_days, tier_dirs
+from timelapse.storage.trace import TraceWriter, load_trace
 
-__all__ = ["StorageManager", "cleanup_old_days"]
+__all__ = [
+    "CaptureWriter",
+    "DiskUsageSampler",
+    "StorageManager",
+    "TraceWriter",
+    "append_stats",
+    "cleanup_old_days",
+    "compact_old_days",
+    "find_day_dir",
+    "load_day_stats",
+    "load_trace",
+    "migrate_old_days",
+    "quarantine_truncated",
+    "read_compaction",
+    "tier_dirs",
+]
@@ -0,0 +1,208 @@
+"""Re-encode aging originals at lower JPEG quality or resolution.
+
+Full-quality originals are rarely needed once a day is more than a week
+old. Compaction re-encodes every original in such a day at a lower JPEG
+quality and, optionally, a smaller maximum width, in parallel worker
+processes running at low priority.
+
+Each file is written to a hidden temporary name in the same directory
+and renamed over the original, so the web UI never serves a
+half-written image. Temporary files left by an interrupted run (power
+cut, daemon killed) are removed when the day is compacted again.
+Thumbnails and preview videos are left alone.
+
+When a day is finished, a ``.compaction.json`` record is written next to
+its images with the compaction level and the resulting frame size, so
+detect_resolution() can use the recorded size instead of opening images,
+and already-compacted days are skipped on later runs.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from timelapse.storage.tiering import iter_day_dirs
+
+logger = logging.getLogger("timelapse.storage.compaction")
+
+COMPACTION_FILENAME = ".compaction.json"
+
+# Niceness applied to worker processes
+_WORKER_NICE = 19
+
+# Suffix of the hidden temporary file each image is re-encoded into
+_TMP_SUFFIX = ".compact"
+
+
+def read_compaction(day_dir: Path) -> dict | None:
+    """Return a day's compaction record, or None if it was never compacted."""
+    try:
+        with open(Path(day_dir) / COMPACTION_FILENAME) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _compact_image(path: Path, quality: int, max_width: int | None) -> tuple | None:
+    """Worker: re-encode one image in place.
+
+    Returns:
+        Tuple of (width, height, bytes_before, bytes_after), or None if
+        the image could not be decoded (it is left untouched).
+    """
+    from PIL import Image
+
+    stat = path.stat()
+    tmp_path = path.with_name(f".{path.name}{_TMP_SUFFIX}")
+    try:
+        with Image.open(path) as im:
+            if max_width is not None and im.width > max_width:
+                height = round(im.height * max_width / im.width)
+                im = im.resize((max_width, height - height % 2), Image.LANCZOS)
+            im.save(tmp_path, "JPEG", quality=quality)
+            size = im.size
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return None
+
+    # Keep the capture time for mtime-sorted generation
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(tmp_path, path)
+    return size[0], size[1], stat.st_size, path.stat().st_size
+
+
+def compact_day(
+    day_dir: Path,
+    quality: int,
+    max_width: int | None = None,
+    workers: int = 2,
+) -> dict | None:
+    """Re-encode every original in a day directory and record the result.
+
+    Args:
+        day_dir: YYYY/MM/DD directory to compact.
+        quality: JPEG quality (1-100) to re-encode at.
+        max_width: Downscale wider images to this width, or None to keep
+            the resolution.
+        workers: Number of worker processes.
+
+    Returns:
+        The compaction record written, or None if the day has no images.
+    """
+    day_dir = Path(day_dir)
+
+    # An interrupted run leaves its temporaries behind; the day has no
+    # record yet, so it is back here and nothing else would remove them
+    for stale in day_dir.glob(f".*{_TMP_SUFFIX}"):
+        stale.unlink(missing_ok=True)
+    (day_dir / f".{COMPACTION_FILENAME}.tmp").unlink(missing_ok=True)
+
+    images = sorted(day_dir.glob("*.jpg"))
+    if not images:
+        return None
+
+    # spawn (not fork): the daemon is multi-threaded
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=os.nice,
+        initargs=(_WORKER_NICE,),
+    ) as pool:
+        results = list(
+            pool.map(
+                _compact_image,
+                images,
+                [quality] * len(images),
+                [max_width] * len(images),
+                chunksize=8,
+            )
+        )
+
+    failed = sum(1 for r in results if r is None)
+    if failed:
+        logger.warning("%d unreadable image(s) left as-is in %s", failed, day_dir)
+    results = [r for r in results if r is not None]
+    if not results:
+        return None
+
+    sizes = {(w, h) for w, h, _, _ in results}
+    width = min(w for w, _ in sizes)
+    height = min(h for _, h in sizes)
+    record = {
+        "quality": quality,
+        "max_width": max_width,
+        "width": width,
+        "height": height,
+        "uniform": len(sizes) == 1,
+        "images": len(results),
+        "failed": failed,
+        "bytes_before": sum(r[2] for r in results),
+        "bytes_after": sum(r[3] for r in results),
+        "compacted": datetime.now().isoformat(timespec="seconds"),
+    }
+    tmp_path = day_dir / f".{COMPACTION_FILENAME}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp_path, day_dir / COMPACTION_FILENAME)
+    return record
+
+
+def _needs_compaction(record: dict | None, quality: int, max_width: int | None) -> bool:
+    """Whether a day must be (re-)compacted to reach the requested level."""
+    if record is None:
+        return True
+    if record["quality"] > quality:
+        return True
+    if max_width is not None and record["width"] > max_width:
+        return True
+    return False
+
+
+def compact_old_days(
+    roots: list[Path],
+    after_days: int,
+    quality: int,
+    max_width: int | None = None,
+    workers: int = 2,
+) -> int:
+    """Compact every day older than after_days, across all storage tiers.
+
+    Days already compacted to the requested level (or lower) are skipped.
+
+    Args:
+        roots: Storage tier root directories.
+        after_days: Days to keep at full quality.
+        quality: JPEG quality to re-encode at.
+        max_width: Maximum image width after compaction, or None.
+        workers: Number of worker processes.
+
+    Returns:
+        Count of day directories compacted.
+    """
+    cutoff = (datetime.now() - timedelta(days=after_days)).date()
+    compacted = 0
+
+    for root in roots:
+        for day, day_dir in iter_day_dirs(root):
+            if day >= cutoff:
+                break
+            if not _needs_compaction(read_compaction(day_dir), quality, max_width):
+                continue
+            record = compact_day(day_dir, quality, max_width, workers)
+            if record is None:
+                continue
+            compacted += 1
+            logger.info(
+                "Compacted %s: %d images, %.1f MB -> %.1f MB",
+                day,
+                record["images"],
+                record["bytes_before"] / (1024 * 1024),
+                record["bytes_after"] / (1024 * 1024),
+            )
+
+    return compacted
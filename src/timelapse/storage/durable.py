@@ -0,0 +1,197 @@
+"""Crash-safe capture writes with batched directory syncs.
+
+Camera backends write each capture into a hidden ``.incoming/``
+directory inside its day directory. CaptureWriter then fsyncs the file
+and renames it to its final name, so a power cut leaves either the
+complete JPEG or no JPEG at all under YYYY/MM/DD -- never a truncated
+one that would break detect_resolution() or FFmpeg later.
+
+The rename itself only becomes durable once the day directory is
+fsynced. Directory syncs are batched, every ``dir_sync_every`` captures
+or ``dir_sync_interval`` seconds, whichever comes first, to bound flash
+wear: a crash can lose at most that batch of captures, never corrupt
+them.
+
+At startup, quarantine_truncated() moves anything left half-written
+(leftovers in ``.incoming/`` and JPEGs without an end-of-image marker)
+into the day's ``.quarantine/`` directory, where readers do not look.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from pathlib import Path
+
+from timelapse.metrics import summarize_ms
+
+logger = logging.getLogger("timelapse.storage.durable")
+
+INCOMING_DIRNAME = ".incoming"
+QUARANTINE_DIRNAME = ".quarantine"
+
+# Captures kept for latency statistics
+_LATENCY_SAMPLES = 100
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def is_complete_jpeg(path: Path) -> bool:
+    """Whether a file starts with a JPEG SOI marker and ends with EOI.
+
+    Trailing zero padding after the EOI marker is tolerated.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(2) != b"\xff\xd8":
+                return False
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 64))
+            tail = f.read().rstrip(b"\x00")
+    except OSError:
+        return False
+    return tail.endswith(b"\xff\xd9")
+
+
+def quarantine_truncated(day_dir: Path) -> int:
+    """Move incomplete captures in a day directory to ``.quarantine/``.
+
+    Args:
+        day_dir: YYYY/MM/DD directory to scan.
+
+    Returns:
+        Count of files quarantined.
+    """
+    day_dir = Path(day_dir)
+    if not day_dir.is_dir():
+        return 0
+
+    suspects = [p for p in day_dir.glob("*.jpg") if not is_complete_jpeg(p)]
+    incoming = day_dir / INCOMING_DIRNAME
+    if incoming.is_dir():
+        suspects.extend(p for p in incoming.iterdir() if p.is_file())
+    if not suspects:
+        return 0
+
+    quarantine = day_dir / QUARANTINE_DIRNAME
+    quarantine.mkdir(exist_ok=True)
+    for path in suspects:
+        target = quarantine / path.name
+        if target.exists():
+            target = quarantine / f"{path.stem}-{time.time_ns()}{path.suffix}"
+        os.replace(path, target)
+        logger.warning("Quarantined incomplete capture %s", path)
+    _fsync_dir(day_dir)
+    return len(suspects)
+
+
+class CaptureWriter:
+    """Turns captures written to a temporary path into durable final files.
+
+    Args:
+        dir_sync_every: Sync directories after this many captures.
+        dir_sync_interval: Maximum seconds a renamed capture may wait for
+            its directory sync.
+    """
+
+    def __init__(self, dir_sync_every: int = 10, dir_sync_interval: float = 300):
+        self.dir_sync_every = dir_sync_every
+        self.dir_sync_interval = dir_sync_interval
+        self._dirty: set[Path] = set()
+        self._known: set[Path] = set()
+        self._pending = 0
+        self._oldest_pending = 0.0
+
+        # Per-capture (write_ms, fsync_ms) and per-batch dir fsync ms
+        self._file_latency: deque[tuple[float, float]] = deque(maxlen=_LATENCY_SAMPLES)
+        self._dir_latency: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    @staticmethod
+    def temp_path(final_path: Path) -> Path:
+        """Return where a backend should write the capture for final_path.
+
+        Keeps the file name, so backends that infer the format from the
+        extension still produce JPEGs.
+        """
+        final_path = Path(final_path)
+        return final_path.parent / INCOMING_DIRNAME / final_path.name
+
+    def commit(self, temp_path: Path, final_path: Path, write_ms: float) -> None:
+        """fsync a finished capture and rename it into place.
+
+        Args:
+            temp_path: File the backend wrote (from temp_path()).
+            final_path: Destination in the day directory.
+            write_ms: How long the backend took to capture and write it.
+
+        Raises:
+            OSError: If the file cannot be synced or renamed.
+        """
+        started = time.monotonic()
+        fd = os.open(temp_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        fsync_ms = (time.monotonic() - started) * 1000
+        os.replace(temp_path, final_path)
+        self._file_latency.append((write_ms, fsync_ms))
+
+        day_dir = Path(final_path).parent
+        self._dirty.add(day_dir)
+        if day_dir not in self._known:
+            # A new day directory also needs its entry in the month made durable
+            self._known.add(day_dir)
+            self._dirty.update((day_dir.parent, day_dir.parent.parent))
+        if self._pending == 0:
+            self._oldest_pending = time.monotonic()
+        self._pending += 1
+        self.maybe_sync()
+
+    def discard(self, temp_path: Path) -> None:
+        """Remove the temporary file of a failed capture, if any."""
+        try:
+            Path(temp_path).unlink()
+        except OSError:
+            pass
+
+    def maybe_sync(self) -> None:
+        """Sync directories if the batch is full or its time window passed."""
+        if self._pending and (
+            self._pending >= self.dir_sync_every
+            or time.monotonic() - self._oldest_pending >= self.dir_sync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        """fsync every directory with renames not yet made durable."""
+        if not self._dirty:
+            return
+        started = time.monotonic()
+        for path in sorted(self._dirty, key=lambda p: len(p.parts), reverse=True):
+            try:
+                _fsync_dir(path)
+            except OSError as exc:
+                logger.warning("Directory sync failed for %s: %s", path, exc)
+        self._dir_latency.append((time.monotonic() - started) * 1000)
+        self._dirty.clear()
+        self._pending = 0
+
+    def latency(self) -> dict:
+        """Write and sync latency over recent captures, in milliseconds.
+
+        Returns:
+            Dict with write_ms, fsync_ms and dir_fsync_ms, each a dict of
+            last, mean and max (or None before the first sample).
+        """
+        return {
+            "write_ms": summarize_ms(w for w, _ in self._file_latency),
+            "fsync_ms": summarize_ms(f for _, f in self._file_latency),
+            "dir_fsync_ms": summarize_ms(self._dir_latency),
+        }
@@ -1,20 +1,42 @@
-"""Storage manager: disk space checking, image path generation, output directory validation."""
+"""Storage manager: disk space checking, fill forecasting, image path generation,
+output directory validation."""
 
 import logging
-import shutil
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+from timelapse.storage.naming import image_filename
+from timelapse.storage.usage import DiskUsageSampler
+
 logger = logging.getLogger("timelapse.storage.manager")
 
+# Seconds of write history used for the fill-rate estimate
+_RATE_WINDOW = 24 * 3600
+
+# Writes needed before a forecast is made
+_MIN_RATE_SAMPLES = 3
+
+# Minimum seconds between the used-bytes samples kept for the net fill rate
+_USED_SAMPLE_INTERVAL = 60
+
+# Seconds of used-bytes history needed before time to full is forecast
+_MIN_NET_SPAN = 3600
+
 
 class StorageManager:
     """Manages disk space checks, image path generation, and output directory validation.
 
+    Also tracks bytes written per capture and per day (via record_write),
+    and the filesystem's used bytes over time, to forecast how long until
+    disk usage reaches the stop threshold.
+
     Args:
         output_dir: Base directory for captured images.
         stop_threshold: Disk usage percentage at which captures are refused.
         warn_threshold: Disk usage percentage at which a warning is logged.
+        sample_ttl: Seconds to reuse a disk usage sample (see DiskUsageSampler).
     """
 
     def __init__(
@@ -22,14 +44,27 @@ class StorageManager:
         output_dir: Path,
         stop_threshold: float = 90.0,
         warn_threshold: float = 85.0,
+        sample_ttl: float = 30,
     ):
         self._output_dir = Path(output_dir)
         self._stop_threshold = stop_threshold
         self._warn_threshold = warn_threshold
+        self.sampler = DiskUsageSampler(self._output_dir, sample_ttl)
+
+        # (wall time, bytes) per capture within the rate window
+        self._writes: deque[tuple[float, int]] = deque()
+        self._bytes_today = 0
+        self._bytes_today_date = datetime.now().date()
+        # (wall time, used bytes) samples within the rate window
+        self._used: deque[tuple[float, int]] = deque()
+
+    def disk_usage(self):
+        """Return the (possibly cached) (total, used, free) disk usage tuple."""
+        return self.sampler.sample()
 
     def disk_usage_percent(self) -> float:
-        """Return current disk usage as a percentage (0-100)."""
-        usage = shutil.disk_usage(self._output_dir)
+        """Return disk usage as a percentage (0-100), at most sample_ttl old."""
+        usage = self.disk_usage()
         return (usage.used / usage.total) * 100
 
     def has_space(self) -> bool:
@@ -56,26 +91,111 @@ class StorageManager:
             )
         return True
 
-    def image_path(self, timestamp: datetime) -> Path:
+    def record_write(self, nbytes: int) -> None:
+        """Record the bytes written by one capture (image plus derived files)."""
+        now = time.time()
+        self._writes.append((now, nbytes))
+        while self._writes and self._writes[0][0] < now - _RATE_WINDOW:
+            self._writes.popleft()
+
+        today = datetime.now().date()
+        if today != self._bytes_today_date:
+            self._bytes_today = 0
+            self._bytes_today_date = today
+        self._bytes_today += nbytes
+
+    def forecast(self) -> dict:
+        """Forecast time until disk usage reaches the stop threshold.
+
+        bytes_per_day is the gross write rate: the bytes recorded over the
+        last 24 hours (or since startup) divided by the time they span.
+        The time to full uses the net rate instead, the change in the
+        filesystem's used bytes over the same window, so space freed by
+        retention cleanup (or by anything else) is counted. A disk held
+        steady by cleanup is not forecast to fill at all.
+
+        Returns:
+            Dict with keys bytes_per_capture, bytes_per_day,
+            net_bytes_per_day, bytes_today and hours_to_full. Rate-derived
+            values are None until a few captures (an hour of usage history
+            for the net rate) have been recorded. hours_to_full is None
+            while usage is not growing, and 0 at or above the stop
+            threshold.
+        """
+        result = {
+            "bytes_per_capture": None,
+            "bytes_per_day": None,
+            "net_bytes_per_day": None,
+            "bytes_today": self._bytes_today,
+            "hours_to_full": None,
+        }
+
+        usage = self.disk_usage()
+        now = time.time()
+        if not self._used or now - self._used[-1][0] >= _USED_SAMPLE_INTERVAL:
+            self._used.append((now, usage.used))
+        while self._used[0][0] < now - _RATE_WINDOW:
+            self._used.popleft()
+
+        if len(self._writes) < _MIN_RATE_SAMPLES:
+            return result
+
+        total = sum(nbytes for _, nbytes in self._writes)
+        result["bytes_per_capture"] = round(total / len(self._writes))
+
+        # Span from the first write to now covers the gaps between captures
+        span = now - self._writes[0][0]
+        if span > 0:
+            result["bytes_per_day"] = round(total / span * 86400)
+
+        remaining = usage.total * self._stop_threshold / 100 - usage.used
+        if remaining <= 0:
+            result["hours_to_full"] = 0.0
+            return result
+
+        net_span = now - self._used[0][0]
+        if net_span < _MIN_NET_SPAN:
+            return result
+        net_rate = (usage.used - self._used[0][1]) / net_span
+        result["net_bytes_per_day"] = round(net_rate * 86400)
+        if net_rate > 0:
+            result["hours_to_full"] = round(remaining / net_rate / 3600, 1)
+        return result
+
+    def image_path(
+        self, timestamp: datetime, root: Path | None = None, millis: bool = False
+    ) -> Path:
         """Generate the full path for an image based on a timestamp.
 
-        Path format: output_dir/YYYY/MM/DD/HHMMSS.jpg
-        Creates parent directories if they do not exist.
+        Path format: output_dir/YYYY/MM/DD/HHMMSS.jpg (HHMMSSmmm.jpg with
+        millis), or HHMMSS_N.jpg if that name is already taken. Creates
+        parent directories if they do not exist.
 
         Args:
             timestamp: The datetime to derive the path from.
+            root: Image root to use instead of output_dir (e.g. a camera's
+                subdirectory).
+            millis: Include milliseconds in the name (high-rate capture).
 
         Returns:
             Full Path to the image file.
         """
         path = (
-            self._output_dir
+            Path(root or self._output_dir)
             / timestamp.strftime("%Y")
             / timestamp.strftime("%m")
             / timestamp.strftime("%d")
-            / f"{timestamp.strftime('%H%M%S')}.jpg"
+            / image_filename(timestamp, millis)
         )
         path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Same-second captures get a suffix rather than overwriting or
+        # being dropped (see timelapse.storage.naming for their order)
+        count = 0
+        stem = path.stem
+        while path.exists():
+            count += 1
+            path = path.with_name(f"{stem}_{count}.jpg")
         return path
 
     def ensure_output_dir(self) -> None:
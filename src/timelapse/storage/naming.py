@@ -0,0 +1,58 @@
+"""Capture file names and their chronological order.
+
+Captures are named after their local capture time inside the day
+directory:
+
+    HHMMSS.jpg        one capture per second (the default)
+    HHMMSSmmm.jpg     high-rate mode, with milliseconds
+    HHMMSS_N.jpg      a second (or millisecond) that already had a capture
+
+Plain name order is chronological for days written in a single mode, but
+not when a day mixes modes or same-second suffixes. Readers therefore
+sort with image_sort_key(), which orders by the time the name starts
+with and keeps anything unrecognised after the captures, in name order.
+"""
+
+import re
+from datetime import datetime
+
+_NAME_RE = re.compile(r"(\d{2})(\d{2})(\d{2})(\d{3})?(?:_(\d+))?")
+
+
+def image_filename(timestamp: datetime, millis: bool = False) -> str:
+    """Return the file name for a capture taken at timestamp.
+
+    Args:
+        timestamp: Capture time.
+        millis: Include milliseconds (high-rate mode).
+    """
+    name = timestamp.strftime("%H%M%S")
+    if millis:
+        name += f"{timestamp.microsecond // 1000:03d}"
+    return f"{name}.jpg"
+
+
+def image_sort_key(name: str) -> tuple:
+    """Sort key putting capture file names (or stems) in capture order."""
+    stem = name[:-4] if name.lower().endswith(".jpg") else name
+    match = _NAME_RE.match(stem)
+    if match is None:
+        return (1, 0, 0, name)
+    hh, mm, ss, ms, seq = match.groups()
+    return (0, int(hh + mm + ss) * 1000 + int(ms or 0), int(seq or 0), name)
+
+
+def format_image_time(stem: str) -> str:
+    """Return the display time of a capture from its file stem.
+
+    "143022" gives "14:30:22" and "143022125" gives "14:30:22.125";
+    stems that do not start with a time are returned unchanged.
+    """
+    match = _NAME_RE.match(stem)
+    if match is None:
+        return stem
+    hh, mm, ss, ms, _ = match.groups()
+    time_str = f"{hh}:{mm}:{ss}"
+    if ms is not None:
+        time_str += f".{ms}"
+    return time_str
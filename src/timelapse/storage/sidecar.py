@@ -0,0 +1,57 @@
+"""Per-day image statistics sidecar.
+
+Each day directory may contain a ``.stats.jsonl`` file with one JSON
+record per line, keyed by image filename. Records are append-only so
+the capture daemon never rewrites the file on the SD card; later lines
+for the same image add or override keys from earlier ones. The file is
+hidden and removed with its day directory by cleanup.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger("timelapse.storage.sidecar")
+
+SIDECAR_NAME = ".stats.jsonl"
+
+
+def append_stats(day_dir: Path, filename: str, stats: dict) -> None:
+    """Append a stats record for one image to the day's sidecar.
+
+    Args:
+        day_dir: Day directory (YYYY/MM/DD) containing the image.
+        filename: Image filename (e.g. "143022.jpg").
+        stats: Keys to record for the image.
+    """
+    record = {"file": filename, **stats}
+    with open(Path(day_dir) / SIDECAR_NAME, "a") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def load_day_stats(day_dir: Path) -> dict[str, dict]:
+    """Load and merge all stats records for a day.
+
+    Args:
+        day_dir: Day directory (YYYY/MM/DD).
+
+    Returns:
+        Dict mapping image filename to its merged stats. Empty if the
+        sidecar does not exist. Malformed lines (e.g. a write cut short
+        by power loss) are skipped.
+    """
+    path = Path(day_dir) / SIDECAR_NAME
+    stats: dict[str, dict] = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    filename = record.pop("file")
+                except (json.JSONDecodeError, KeyError, AttributeError):
+                    logger.debug("Skipping malformed line in %s", path)
+                    continue
+                stats.setdefault(filename, {}).update(record)
+    except FileNotFoundError:
+        pass
+    return stats
@@ -0,0 +1,191 @@
+"""Tiered storage: migrate aging day directories to a secondary volume.
+
+Days older than a configurable age are moved from the primary output
+directory (usually the SD card) to a secondary mount such as a USB SSD
+or NAS share, keeping the same YYYY/MM/DD layout there. Readers look
+up a day in every tier with find_day_dir(), so generation and the web
+UI resolve images transparently wherever they live.
+
+A migration copies the day into a hidden staging directory on the
+secondary tier, renames it into place, then renames the primary copy
+aside before deleting it. At every point each tier holds either the
+complete day or nothing a reader would pick up. Copies are throttled
+to a byte rate so capture and web I/O on the primary card are not
+starved.
+"""
+
+import logging
+import os
+import shutil
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger("timelapse.storage.tiering")
+
+# Copy buffer size; the rate limiter sleeps between chunks
+_CHUNK_BYTES = 1024 * 1024
+
+
+def day_dir(root: Path, day: date) -> Path:
+    """Return root/YYYY/MM/DD for a day (which may not exist)."""
+    return Path(root) / day.strftime("%Y") / day.strftime("%m") / day.strftime("%d")
+
+
+def tier_dirs(config: dict) -> list[Path]:
+    """Return the configured secondary tiers (currently at most one)."""
+    tier_dir = config["storage"].get("tier_dir")
+    return [Path(tier_dir)] if tier_dir else []
+
+
+def find_day_dir(roots: list[Path], day: date) -> Path | None:
+    """Return the first tier's directory holding the day, or None."""
+    for root in roots:
+        path = day_dir(root, day)
+        if path.is_dir():
+            return path
+    return None
+
+
+def iter_day_dirs(root: Path):
+    """Yield (date, day_dir) for every YYYY/MM/DD directory, oldest first.
+
+    Non-date directories are silently skipped.
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return
+    for year_dir in sorted(root.iterdir()):
+        if not year_dir.is_dir():
+            continue
+        for month_dir in sorted(year_dir.iterdir()):
+            if not month_dir.is_dir():
+                continue
+            for dir_path in sorted(month_dir.iterdir()):
+                if not dir_path.is_dir():
+                    continue
+                try:
+                    day = datetime.strptime(
+                        f"{year_dir.name}/{month_dir.name}/{dir_path.name}",
+                        "%Y/%m/%d",
+                    ).date()
+                except ValueError:
+                    continue
+                yield day, dir_path
+
+
+class _RateLimiter:
+    """Sleep as needed to keep throughput at or below bytes_per_second."""
+
+    def __init__(self, bytes_per_second: float):
+        self._rate = bytes_per_second
+        self._start = time.monotonic()
+        self._sent = 0
+
+    def consume(self, nbytes: int) -> None:
+        self._sent += nbytes
+        ahead = self._sent / self._rate - (time.monotonic() - self._start)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+def _copy_tree(src: Path, dst: Path, limiter: _RateLimiter) -> int:
+    """Copy a directory tree chunk by chunk under the rate limit.
+
+    Returns:
+        Bytes copied.
+    """
+    copied = 0
+    dst.mkdir(parents=True, exist_ok=True)
+    for entry in sorted(src.iterdir()):
+        target = dst / entry.name
+        if entry.is_dir():
+            copied += _copy_tree(entry, target, limiter)
+            continue
+        with open(entry, "rb") as fin, open(target, "wb") as fout:
+            while chunk := fin.read(_CHUNK_BYTES):
+                fout.write(chunk)
+                limiter.consume(len(chunk))
+                copied += len(chunk)
+            fout.flush()
+            os.fsync(fout.fileno())
+        shutil.copystat(entry, target)
+    return copied
+
+
+def _migrate_day(src: Path, tier_dir: Path, day: date, limiter: _RateLimiter) -> int:
+    """Move one day directory from the primary tier to tier_dir.
+
+    Returns:
+        Bytes copied.
+    """
+    dest = day_dir(tier_dir, day)
+    staging = dest.with_name(f".{dest.name}.partial")
+    if staging.exists():
+        # Left over from an interrupted migration
+        shutil.rmtree(staging)
+
+    if dest.exists():
+        # A previous run placed the day but did not remove the primary copy
+        copied = 0
+    else:
+        copied = _copy_tree(src, staging, limiter)
+        staging.rename(dest)
+
+    retired = src.with_name(f".{src.name}.migrated")
+    src.rename(retired)
+    shutil.rmtree(retired)
+    return copied
+
+
+def migrate_old_days(
+    output_dir: Path,
+    tier_dir: Path,
+    after_days: int,
+    max_rate_mb: float = 8,
+) -> int:
+    """Move day directories older than after_days to the secondary tier.
+
+    The secondary tier must already exist (i.e. be mounted); it is never
+    created here, so an unmounted USB drive or NAS does not silently
+    fill the SD card's mount point instead.
+
+    Args:
+        output_dir: Primary directory containing the YYYY/MM/DD structure.
+        tier_dir: Secondary directory (mount point) to migrate into.
+        after_days: Days to keep on the primary tier.
+        max_rate_mb: Copy rate limit in megabytes per second.
+
+    Returns:
+        Count of day directories migrated.
+    """
+    output_dir = Path(output_dir)
+    tier_dir = Path(tier_dir)
+    if not tier_dir.is_dir():
+        logger.warning("Storage tier %s is not available, skipping migration", tier_dir)
+        return 0
+
+    cutoff = (datetime.now() - timedelta(days=after_days)).date()
+    limiter = _RateLimiter(max_rate_mb * 1024 * 1024)
+    migrated = 0
+
+    for day, src in list(iter_day_dirs(output_dir)):
+        if day >= cutoff:
+            break
+        started = time.monotonic()
+        copied = _migrate_day(src, tier_dir, day, limiter)
+        migrated += 1
+        logger.info(
+            "Migrated %s to %s (%.1f MB in %.0fs)",
+            day,
+            tier_dir,
+            copied / (1024 * 1024),
+            time.monotonic() - started,
+        )
+
+        # Clean up empty month/year directories on the primary tier
+        for parent in (src.parent, src.parent.parent):
+            if parent.is_dir() and not any(parent.iterdir()):
+                parent.rmdir()
+
+    return migrated
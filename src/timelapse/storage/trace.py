@@ -0,0 +1,166 @@
+"""Per-day binary capture timing trace.
+
+Each day directory may contain a ``.trace-v1.bin`` file holding one
+fixed-size 40-byte little-endian record per capture slot the daemon ran
+(successful or not), in the order they ran:
+
+    field         type  meaning
+    slot          f8    scheduled slot (epoch seconds)
+    start         f8    time the capture cycle started (epoch seconds)
+    interval      f4    capture interval in effect (seconds)
+    lock_wait_ms  f4    wait for the camera lock
+    capture_ms    f4    camera capture and write, lock held
+    thumb_ms      f4    thumbnail generation
+    size          u4    bytes written (image and thumbnail)
+    missed        u2    slots skipped just before this one
+    result        u1    index into RESULTS
+    (padding)     u1
+
+The file has no header, so it can be read with
+``numpy.fromfile(path, dtype=trace_dtype())`` or memory-mapped with
+numpy.memmap; load_trace() does the former. The version in the file
+name changes if the layout ever does.
+
+TraceWriter buffers records in memory and appends them in batches,
+together with the daemon's directory syncs, so tracing adds no write of
+its own per capture. A power cut can lose the pending batch; a record
+cut short is ignored by load_trace() and dropped by the next append.
+The file is hidden, and moves to the secondary tier or is removed by
+cleanup together with its day directory.
+"""
+
+import logging
+import struct
+import time
+from pathlib import Path
+
+logger = logging.getLogger("timelapse.storage.trace")
+
+TRACE_NAME = ".trace-v1.bin"
+
+# Record outcomes; same names as the timelapse_captures_total metric
+RESULTS = ("success", "failed", "error", "skipped")
+
+_RECORD = struct.Struct("<ddffffIHBx")
+RECORD_SIZE = _RECORD.size
+
+# numpy field layout of one record (numpy is only imported by readers)
+TRACE_FIELDS = [
+    ("slot", "<f8"),
+    ("start", "<f8"),
+    ("interval", "<f4"),
+    ("lock_wait_ms", "<f4"),
+    ("capture_ms", "<f4"),
+    ("thumb_ms", "<f4"),
+    ("size", "<u4"),
+    ("missed", "<u2"),
+    ("result", "u1"),
+    ("pad", "u1"),
+]
+
+
+def trace_dtype():
+    """Return the numpy dtype of a trace record."""
+    import numpy as np
+
+    return np.dtype(TRACE_FIELDS)
+
+
+def load_trace(day_dir: Path):
+    """Read a day's trace records.
+
+    Args:
+        day_dir: Day directory (YYYY/MM/DD).
+
+    Returns:
+        numpy structured array of records (empty if the day has no
+        trace). A trailing partial record is ignored.
+    """
+    import numpy as np
+
+    path = Path(day_dir) / TRACE_NAME
+    try:
+        count = path.stat().st_size // RECORD_SIZE
+    except FileNotFoundError:
+        count = 0
+    if count == 0:
+        return np.empty(0, dtype=trace_dtype())
+    return np.fromfile(path, dtype=trace_dtype(), count=count)
+
+
+class TraceWriter:
+    """Buffers trace records and appends them to per-day files in batches.
+
+    Args:
+        flush_every: Append after this many records.
+        flush_interval: Append at least this often (seconds) while
+            records are pending.
+    """
+
+    def __init__(self, flush_every: int = 10, flush_interval: float = 300):
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: dict[Path, bytearray] = {}
+        self._count = 0
+        self._flushed_at = time.monotonic()
+
+    def append(
+        self,
+        day_dir: Path,
+        slot: float,
+        start: float,
+        interval: float,
+        lock_wait_ms: float = 0.0,
+        capture_ms: float = 0.0,
+        thumb_ms: float = 0.0,
+        size: int = 0,
+        missed: int = 0,
+        result: str = "success",
+    ) -> None:
+        """Queue one record for a day directory's trace."""
+        record = _RECORD.pack(
+            slot,
+            start,
+            interval,
+            lock_wait_ms,
+            capture_ms,
+            thumb_ms,
+            min(max(size, 0), 0xFFFFFFFF),
+            min(max(missed, 0), 0xFFFF),
+            RESULTS.index(result),
+        )
+        self._pending.setdefault(Path(day_dir), bytearray()).extend(record)
+        self._count += 1
+
+    def maybe_flush(self) -> None:
+        """Append pending records if the batch is full or old enough."""
+        if not self._count:
+            return
+        if (
+            self._count >= self.flush_every
+            or time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all pending records now."""
+        pending, self._pending = self._pending, {}
+        self._count = 0
+        self._flushed_at = time.monotonic()
+        for day_dir, records in pending.items():
+            try:
+                day_dir.mkdir(parents=True, exist_ok=True)
+                with open(day_dir / TRACE_NAME, "ab") as f:
+                    # Drop a record cut short by a power cut, or every
+                    # later record would be misaligned
+                    partial = f.tell() % RECORD_SIZE
+                    if partial:
+                        f.truncate(f.tell() - partial)
+                    f.write(records)
+            except OSError as exc:
+                logger.warning(
+                    "Could not append %d trace record(s) to %s: %s",
+                    len(records) // RECORD_SIZE,
+                    day_dir,
+                    exc,
+                )
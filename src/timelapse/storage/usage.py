@@ -0,0 +1,56 @@
+"""Cached disk usage sampling.
+
+statvfs is cheap but not free, and the capture loop, status writer and
+forecast all need the same number every cycle. DiskUsageSampler
+performs at most one shutil.disk_usage() call per TTL and hands every
+caller the cached sample in between. The daemon publishes its samples
+through .status.json, so the web app does not need to statvfs on the
+request path at all. Each real query is timed in the
+timelapse_disk_sample_seconds metric.
+"""
+
+import shutil
+import time
+from pathlib import Path
+
+from timelapse.metrics import observe
+
+
+class DiskUsageSampler:
+    """Disk usage of one filesystem, re-sampled at most once per TTL.
+
+    Args:
+        path: Any path on the filesystem to measure.
+        ttl: Seconds a sample stays valid. 0 samples on every call.
+    """
+
+    def __init__(self, path: Path, ttl: float = 30):
+        self._path = Path(path)
+        self._ttl = ttl
+        self._sample = None
+        self._sampled_at: float | None = None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float) -> None:
+        self._ttl = value
+
+    def sample(self):
+        """Return a (total, used, free) usage tuple, sampling if stale.
+
+        Raises:
+            OSError: If the filesystem cannot be queried.
+        """
+        now = time.monotonic()
+        if self._sampled_at is None or now - self._sampled_at >= self._ttl:
+            self._sample = shutil.disk_usage(self._path)
+            self._sampled_at = time.monotonic()
+            observe("timelapse_disk_sample_seconds", self._sampled_at - now)
+        return self._sample
+
+    def invalidate(self) -> None:
+        """Force the next sample() to query the filesystem."""
+        self._sampled_at = None
@@ -0,0 +1,170 @@
+"""Capture timing reports from the per-day binary trace.
+
+Backs ``timelapse stats``: loads each day's trace records (see
+timelapse.storage.trace) across storage tiers with numpy, then reports
+outcome counts, latency percentiles, late captures and missed slots for
+a date range, overall and per day. Each day is one numpy.fromfile()
+call, so months of history report in well under a second.
+"""
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from timelapse.scheduler import LATE_THRESHOLD
+from timelapse.storage.tiering import find_day_dir
+from timelapse.storage.trace import RESULTS, load_trace, trace_dtype
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def _percentiles(values_ms) -> dict | None:
+    """Percentiles and max of a sample in ms, or None if it is empty."""
+    if len(values_ms) == 0:
+        return None
+    points = np.percentile(values_ms, PERCENTILES)
+    summary = {f"p{p}": round(float(v), 1) for p, v in zip(PERCENTILES, points)}
+    summary["max"] = round(float(np.max(values_ms)), 1)
+    return summary
+
+
+def build_report(
+    roots: list[Path], start: date, end: date, late_threshold: float = LATE_THRESHOLD
+) -> dict:
+    """Summarize trace records for the days start..end (inclusive).
+
+    Args:
+        roots: One camera's image roots on every storage tier, primary
+            first.
+        start: First day.
+        end: Last day.
+        late_threshold: Seconds after its slot at which a capture is late.
+
+    Returns:
+        Dict with totals, percentiles (ms) and per-day rows; see
+        format_report().
+    """
+    days = []
+    per_day = []
+    missed_by_hour = np.zeros(24, dtype=np.int64)
+    day = start
+    while day <= end:
+        path = find_day_dir(roots, day)
+        records = load_trace(path) if path is not None else None
+        if records is not None and len(records):
+            days.append(records)
+            lateness = np.maximum(records["start"] - records["slot"], 0)
+            success = records["result"] == RESULTS.index("success")
+            capture_p95 = _percentiles(records["capture_ms"][success])
+            per_day.append(
+                {
+                    "date": day.isoformat(),
+                    "cycles": len(records),
+                    "success": int(success.sum()),
+                    "missed": int(records["missed"].sum()),
+                    "late": int((lateness > late_threshold).sum()),
+                    "capture_p95_ms": capture_p95["p95"] if capture_p95 else None,
+                }
+            )
+            # Missed slots are booked to the hour of the slot that followed
+            midnight = datetime.combine(day, datetime.min.time()).timestamp()
+            hours = np.clip((records["slot"] - midnight) // 3600, 0, 23).astype(int)
+            np.add.at(missed_by_hour, hours, records["missed"])
+        day += timedelta(days=1)
+
+    records = np.concatenate(days) if days else np.empty(0, dtype=trace_dtype())
+    lateness_ms = np.maximum(records["start"] - records["slot"], 0) * 1000
+    success = records["result"] == RESULTS.index("success")
+    missed = int(records["missed"].sum())
+    cycles = len(records)
+
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": len(days),
+        "cycles": cycles,
+        "missed": missed,
+        "slots_run_percent": (
+            round(100 * cycles / (cycles + missed), 2) if cycles + missed else None
+        ),
+        "late": int((lateness_ms > late_threshold * 1000).sum()),
+        "late_threshold": late_threshold,
+        "results": {
+            name: int((records["result"] == index).sum())
+            for index, name in enumerate(RESULTS)
+        },
+        "ms": {
+            "lateness": _percentiles(lateness_ms),
+            "lock_wait": _percentiles(records["lock_wait_ms"][success]),
+            "capture": _percentiles(records["capture_ms"][success]),
+            "thumbnail": _percentiles(records["thumb_ms"][success]),
+        },
+        "mean_size_bytes": (
+            int(records["size"][success].mean()) if success.any() else None
+        ),
+        "missed_by_hour": {
+            f"{hour:02d}:00": int(count)
+            for hour, count in enumerate(missed_by_hour)
+            if count
+        },
+        "per_day": per_day,
+    }
+
+
+def format_report(report: dict, camera: str) -> str:
+    """Render a build_report() result as a plain-text table."""
+    lines = [
+        f"Capture trace {report['start']} to {report['end']} "
+        f"(camera {camera}, {report['days']} day(s) with data)"
+    ]
+    if not report["cycles"]:
+        lines.append("No trace records in this range.")
+        return "\n".join(lines)
+
+    lines.append(
+        f"Cycles: {report['cycles']} run, {report['missed']} slot(s) missed "
+        f"({report['slots_run_percent']}% of slots run), {report['late']} late "
+        f"(> {report['late_threshold']:g}s after the slot)"
+    )
+    lines.append(
+        "Results: "
+        + ", ".join(f"{name} {count}" for name, count in report["results"].items())
+    )
+    if report["mean_size_bytes"] is not None:
+        lines.append(f"Mean size: {report['mean_size_bytes'] / 1024:.0f} KiB")
+
+    lines.append("")
+    header = f"{'Timing (ms)':14}" + "".join(
+        f"{name:>10}" for name in (*(f"p{p}" for p in PERCENTILES), "max")
+    )
+    lines.append(header)
+    for name, summary in report["ms"].items():
+        if summary is None:
+            continue
+        lines.append(
+            f"  {name.replace('_', ' '):12}"
+            + "".join(f"{value:10.1f}" for value in summary.values())
+        )
+
+    lines.append("")
+    lines.append(
+        f"{'Date':12}{'cycles':>8}{'success':>9}{'missed':>8}{'late':>6}"
+        f"{'capture p95':>13}"
+    )
+    for row in report["per_day"]:
+        p95 = f"{row['capture_p95_ms']:.1f}" if row["capture_p95_ms"] is not None else "-"
+        lines.append(
+            f"{row['date']:12}{row['cycles']:8}{row['success']:9}"
+            f"{row['missed']:8}{row['late']:6}{p95:>13}"
+        )
+
+    if report["missed_by_hour"]:
+        lines.append("")
+        lines.append(
+            "Missed slots by hour: "
+            + ", ".join(
+                f"{hour} {count}" for hour, count in report["missed_by_hour"].items()
+            )
+        )
+    return "\n".join(lines)
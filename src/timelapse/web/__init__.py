@@ -36,7 +36,14 @@ def create_app(config_path: Path | None = None) -> Flask:
 
     app.config["TIMELAPSE"] = timelapse_cfg
     app.config["OUTPUT_DIR"] = Path(timelapse_cfg["storage"]["output_dir"])
-    app.config["STATUS_FILE"] = app.config["OUTPUT_DIR"] / ".status.json"
+    # Same location the daemon publishes to (see storage.status_dir)
+    from timelapse.status import status_file_path
+
+    app.config["STATUS_FILE"] = status_file_path(timelapse_cfg)
+    # Primary output directory first, then secondary storage tiers
+    from timelapse.storage import tier_dirs
+
+    app.config["IMAGE_ROOTS"] = [app.config["OUTPUT_DIR"], *tier_dirs(timelapse_cfg)]
     # Only used for flash messages; local network only
     app.config["SECRET_KEY"] = "timelapse-local-network"
 
@@ -44,10 +51,49 @@ def create_app(config_path: Path | None = None) -> Flask:
     from timelapse.web.blueprints.timeline import timeline_bp
     from timelapse.web.blueprints.latest import latest_bp
     from timelapse.web.blueprints.control import control_bp
+    from timelapse.web.blueprints.jobs import jobs_bp
 
     app.register_blueprint(timeline_bp)
     app.register_blueprint(latest_bp, url_prefix="/latest")
     app.register_blueprint(control_bp, url_prefix="/control")
+    app.register_blueprint(jobs_bp, url_prefix="/jobs")
+
+    # Request timing and the /metrics endpoint (see timelapse.metrics)
+    if timelapse_cfg["metrics"]["enabled"]:
+        from timelapse.web.blueprints.metrics import metrics_bp
+
+        app.register_blueprint(metrics_bp)
+
+    # Fallback disk sampler for when the daemon has not published a sample
+    from timelapse.storage import DiskUsageSampler
+
+    app.extensions["timelapse_disk"] = DiskUsageSampler(
+        app.config["OUTPUT_DIR"], timelapse_cfg["storage"]["disk_sample_ttl"]
+    )
+
+    # On-demand request profiling, armed from the Control tab
+    from timelapse.profiling import CycleProfiler
+
+    app.extensions["timelapse_profiler"] = CycleProfiler(
+        app.config["STATUS_FILE"].parent, "web"
+    )
+
+    # Background video generation queue (jobs persist under web.jobs.dir,
+    # by default output_dir/.jobs)
+    from timelapse.web.jobs import JobQueue
+
+    jobs_cfg = timelapse_cfg["web"]["jobs"]
+    job_queue = JobQueue(
+        Path(jobs_cfg["dir"]) if jobs_cfg["dir"] else app.config["OUTPUT_DIR"] / ".jobs",
+        app.config["OUTPUT_DIR"],
+        tier_dirs=app.config["IMAGE_ROOTS"][1:],
+        nice=jobs_cfg["nice"],
+        threads=jobs_cfg["threads"],
+        keep=jobs_cfg["keep"],
+        max_age_days=jobs_cfg["max_age_days"],
+    )
+    job_queue.start()
+    app.extensions["timelapse_jobs"] = job_queue
 
     # Inject health data into all templates via context processor
     @app.context_processor
@@ -1,14 +1,17 @@
 """Control tab blueprint.
 
-Provides PAM-authenticated daemon start/stop controls and full system
-health display. All routes require HTTP Basic Auth verified against
-Linux PAM credentials.
+Provides PAM-authenticated daemon start/stop controls, on-demand
+profiling of the daemon or the web UI, and full system health display.
+All routes require HTTP Basic Auth verified against Linux PAM
+credentials.
 """
 
 import logging
+import os
+import signal
 import subprocess
 
-from flask import Blueprint, current_app, jsonify, render_template
+from flask import Blueprint, current_app, g, jsonify, render_template, request
 
 from timelapse.web.auth import auth
 from timelapse.web.health import get_full_system_info
@@ -20,6 +23,9 @@ control_bp = Blueprint("control", __name__)
 SERVICE_NAME = "timelapse-capture"
 SYSTEMCTL_PATH = "/usr/bin/systemctl"
 
+# Upper bound on web requests profiled in one session
+_MAX_PROFILE_REQUESTS = 1000
+
 
 def _get_service_status() -> str:
     """Check if the capture service is running.
@@ -87,6 +93,36 @@ def _stop_service() -> tuple[bool, str]:
         return False, str(e)
 
 
+def _signal_daemon(signum: int) -> tuple[bool, str]:
+    """Send a signal to the capture daemon's main process.
+
+    Both services run as the same user, so no sudo is needed; the PID
+    comes from systemd rather than the status file, which may be stale.
+
+    Returns:
+        Tuple of (success, message).
+    """
+    try:
+        result = subprocess.run(
+            [SYSTEMCTL_PATH, "show", "--property=MainPID", "--value", SERVICE_NAME],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        pid = int(result.stdout.strip() or 0)
+    except subprocess.TimeoutExpired:
+        return False, "Timeout looking up the capture service"
+    except (OSError, ValueError) as e:
+        return False, str(e)
+    if pid <= 0:
+        return False, "Capture service is not running"
+    try:
+        os.kill(pid, signum)
+    except OSError as e:
+        return False, f"Could not signal the capture daemon: {e}"
+    return True, f"Sent {signal.Signals(signum).name} to the capture daemon"
+
+
 def _get_config_summary(config: dict) -> dict:
     """Extract relevant config values for display.
 
@@ -112,6 +148,17 @@ def _get_config_summary(config: dict) -> dict:
     }
 
 
+@control_bp.before_app_request
+def _start_request_profile():
+    g.profiling = current_app.extensions["timelapse_profiler"].start()
+
+
+@control_bp.teardown_app_request
+def _stop_request_profile(exc):
+    if g.pop("profiling", False):
+        current_app.extensions["timelapse_profiler"].stop()
+
+
 @control_bp.route("/")
 @auth.login_required
 def index():
@@ -121,7 +168,10 @@ def index():
     return render_template(
         "control.html",
         service_status=_get_service_status(),
-        system_info=get_full_system_info(),
+        system_info=get_full_system_info(
+            current_app.config["STATUS_FILE"],
+            current_app.extensions["timelapse_disk"],
+        ),
         config_summary=_get_config_summary(config),
         user=auth.current_user(),
     )
@@ -158,6 +208,56 @@ def status():
         {
             "service_status": _get_service_status(),
             "health": get_health_summary(status_file, config),
-            "system_info": get_full_system_info(),
+            "system_info": get_full_system_info(
+                status_file, current_app.extensions["timelapse_disk"]
+            ),
         }
     )
+
+
+@control_bp.route("/profile", methods=["GET", "POST"])
+@auth.login_required
+def profile():
+    """Start a profiling session, or report on them (GET). Returns JSON.
+
+    Fields: target ("daemon" or "web"); cycles (web only: requests to
+    profile, default metrics.profile_cycles). The daemon profiles its
+    next metrics.profile_cycles captures, as on SIGUSR1. Stats are
+    written next to the status file.
+    """
+    from timelapse.status import read_status, status_socket_path
+
+    profiler = current_app.extensions["timelapse_profiler"]
+    config = current_app.config["TIMELAPSE"]
+
+    if request.method == "POST":
+        data = request.get_json(silent=True) or request.form
+        target = data.get("target", "daemon")
+        if target == "daemon":
+            success, message = _signal_daemon(signal.SIGUSR1)
+            if not success:
+                return jsonify({"success": False, "message": message}), 503
+        elif target == "web":
+            try:
+                cycles = int(data.get("cycles", config["metrics"]["profile_cycles"]))
+            except (TypeError, ValueError):
+                cycles = 0
+            if not 1 <= cycles <= _MAX_PROFILE_REQUESTS:
+                return jsonify(
+                    {
+                        "success": False,
+                        "message": f"cycles must be 1-{_MAX_PROFILE_REQUESTS}",
+                    }
+                ), 400
+            profiler.arm(cycles)
+            message = f"Profiling the next {cycles} web request(s)"
+        else:
+            return jsonify(
+                {"success": False, "message": "target must be 'daemon' or 'web'"}
+            ), 400
+        logger.info("%s (requested by %s)", message, auth.current_user())
+        return jsonify({"success": True, "message": message}), 202
+
+    # The socket has the current session state; the file may lag behind
+    status = read_status(current_app.config["STATUS_FILE"], status_socket_path(config)) or {}
+    return jsonify({"daemon": status.get("profiling"), "web": profiler.status()})
@@ -0,0 +1,125 @@
+"""Video generation jobs blueprint.
+
+Accepts generation requests from the Control tab into the persistent
+JobQueue, reports job progress as JSON or a Server-Sent Events stream,
+and serves finished videos with HTTP range support so browsers can
+seek during playback. Submitting and deleting jobs requires PAM
+authentication; reading job state and videos does not, matching the
+Timeline tab.
+"""
+
+import json
+import time
+from datetime import date
+
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    request,
+    send_file,
+    stream_with_context,
+)
+
+from timelapse.web.auth import auth
+
+jobs_bp = Blueprint("jobs", __name__)
+
+# Seconds between job file polls in the SSE stream
+_EVENT_POLL_INTERVAL = 1.0
+
+
+def _queue():
+    return current_app.extensions["timelapse_jobs"]
+
+
+@jobs_bp.route("/", methods=["POST"])
+@auth.login_required
+def submit():
+    """Queue a generation job from JSON or form fields.
+
+    Fields: start, end (YYYY-MM-DD), duration (e.g. 2m, 90s),
+    profile (preview, hd, or full).
+    """
+    from timelapse.generate import parse_duration
+
+    data = request.get_json(silent=True) or request.form
+    try:
+        job = _queue().submit(
+            start=date.fromisoformat(data.get("start", "")),
+            end=date.fromisoformat(data.get("end", "")),
+            duration=parse_duration(str(data.get("duration", "2m"))),
+            profile=data.get("profile", "preview"),
+        )
+    except Exception as exc:
+        # fromisoformat/submit raise ValueError; parse_duration raises
+        # argparse.ArgumentTypeError
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(job), 202
+
+
+@jobs_bp.route("/")
+def index():
+    """Return all jobs, newest first, as JSON."""
+    return jsonify({"jobs": _queue().list()})
+
+
+@jobs_bp.route("/<job_id>")
+def detail(job_id: str):
+    """Return a single job as JSON."""
+    job = _queue().get(job_id)
+    if job is None:
+        abort(404)
+    return jsonify(job)
+
+
+@jobs_bp.route("/<job_id>", methods=["DELETE"])
+@auth.login_required
+def delete(job_id: str):
+    """Delete a queued or finished job and its video."""
+    try:
+        deleted = _queue().delete(job_id)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 409
+    if not deleted:
+        abort(404)
+    return "", 204
+
+
+@jobs_bp.route("/<job_id>/events")
+def events(job_id: str):
+    """Stream job updates as Server-Sent Events until the job finishes."""
+    queue = _queue()
+    if queue.get(job_id) is None:
+        abort(404)
+
+    def generate():
+        last = None
+        while True:
+            job = queue.get(job_id)
+            if job is None:
+                return
+            payload = json.dumps(job)
+            if payload != last:
+                yield f"data: {payload}\n\n"
+                last = payload
+            if job["status"] in ("done", "failed"):
+                return
+            time.sleep(_EVENT_POLL_INTERVAL)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@jobs_bp.route("/<job_id>/video")
+def video(job_id: str):
+    """Serve a finished job's video, honouring Range requests."""
+    path = _queue().video_path(job_id)
+    if path is None:
+        abort(404)
+    return send_file(path, mimetype="video/mp4", conditional=True)
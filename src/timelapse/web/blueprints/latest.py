@@ -10,6 +10,8 @@ from pathlib import Path
 
 from flask import Blueprint, current_app, jsonify, render_template, send_file
 
+from timelapse.storage.naming import image_sort_key
+
 latest_bp = Blueprint("latest", __name__)
 
 
@@ -38,7 +40,12 @@ def _find_latest_image(output_dir: Path) -> Path | None:
             for day_dir in sorted(month_dir.iterdir(), reverse=True):
                 if not day_dir.is_dir():
                     continue
-                for entry in sorted(day_dir.iterdir(), reverse=True):
+                entries = sorted(
+                    day_dir.iterdir(),
+                    key=lambda p: image_sort_key(p.name),
+                    reverse=True,
+                )
+                for entry in entries:
                     if entry.name == "thumbs" or entry.is_dir():
                         continue
                     if entry.suffix.lower() == ".jpg":
@@ -0,0 +1,67 @@
+"""Prometheus metrics blueprint.
+
+Times every request the web UI serves, by endpoint, method and status,
+and serves /metrics in the Prometheus text format: the web process's own
+metrics plus the capture daemon's, read from the live status socket when
+one is configured and otherwise from the .metrics.json snapshot it writes
+next to the status file. Like the timeline, /metrics needs no login;
+disable it with metrics.enabled: false.
+"""
+
+import time
+
+from flask import Blueprint, Response, current_app, g, request
+
+from timelapse.metrics import (
+    REGISTRY,
+    inc,
+    metrics_file_path,
+    observe,
+    read_metrics,
+    render,
+)
+from timelapse.status import status_socket_path
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.before_app_request
+def _start_timer():
+    g.metrics_started = time.perf_counter()
+
+
+@metrics_bp.after_app_request
+def _record_request(response):
+    started = g.pop("metrics_started", None)
+    if started is None:
+        return response
+    # Endpoint names keep label values bounded; raw paths would not
+    endpoint = request.endpoint or "unmatched"
+    observe(
+        "timelapse_http_request_seconds",
+        time.perf_counter() - started,
+        endpoint=endpoint,
+        method=request.method,
+        status=str(response.status_code),
+    )
+    # Generated (chunked) responses have no length up front and are skipped
+    if response.content_length is not None:
+        inc("timelapse_http_response_bytes_total", response.content_length, endpoint=endpoint)
+    return response
+
+
+@metrics_bp.route("/metrics")
+def metrics():
+    """Serve web and daemon metrics in the Prometheus text format."""
+    snapshots = [(REGISTRY.snapshot(), {"process": "web"})]
+    config = current_app.config["TIMELAPSE"]
+    daemon = read_metrics(metrics_file_path(config), status_socket_path(config))
+    if daemon is not None:
+        age = {
+            "timelapse_daemon_metrics_age_seconds": [
+                [{}, round(max(0.0, time.time() - daemon.get("updated", 0)), 1)]
+            ]
+        }
+        snapshots.append((age, {"process": "web"}))
+        snapshots.append((daemon["metrics"], {"process": "daemon"}))
+    return Response(render(snapshots), mimetype="text/plain; version=0.0.4")
@@ -2,10 +2,14 @@
 
 Serves the filmstrip timeline browser for navigating captured images by date.
 Provides JSON API endpoints for listing available dates and images, plus
-routes for serving full-size images and thumbnails (with on-demand fallback).
+routes for serving full-size images, thumbnails (with on-demand fallback),
+and precomputed per-day preview videos. Days are looked up across all
+storage tiers (primary output directory first), so migrated days stay
+browsable.
 """
 
 import re
+from datetime import date
 from pathlib import Path
 
 from flask import (
@@ -15,80 +19,99 @@ from flask import (
     jsonify,
     render_template,
     request,
+    send_file,
     send_from_directory,
 )
 
+from timelapse.previews import PREVIEW_FILENAME
+from timelapse.storage.naming import format_image_time, image_sort_key
+from timelapse.storage.tiering import find_day_dir, iter_day_dirs
+
 timeline_bp = Blueprint("timeline", __name__)
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
 
-def _list_available_dates(output_dir: Path) -> list[str]:
-    """Walk YYYY/MM/DD directory structure, return sorted date strings.
+def _find_day_dir(roots: list[Path], year: str, month: str, day: str) -> Path | None:
+    """Return the first storage tier's directory for a day, or None.
+
+    Takes the URL's path components; an impossible date is not found.
+    """
+    try:
+        return find_day_dir(roots, date(int(year), int(month), int(day)))
+    except ValueError:
+        return None
+
+
+def _has_jpg(day_dir: Path) -> bool:
+    """Whether a day directory holds at least one image (thumbs/ excluded)."""
+    return any(f.suffix.lower() == ".jpg" and f.is_file() for f in day_dir.iterdir())
+
+
+def _list_available_dates(roots: list[Path]) -> list[str]:
+    """Walk YYYY/MM/DD directory structures, return sorted date strings.
 
     Only includes directories that contain at least one .jpg file
-    (excluding the thumbs/ subdirectory).
+    (excluding the thumbs/ subdirectory). Dates from all storage tiers
+    are merged.
 
     Returns:
         Sorted list of date strings in YYYY-MM-DD format.
     """
-    dates: list[str] = []
-    if not output_dir.is_dir():
-        return dates
+    dates: set[str] = set()
+    for root in roots:
+        for day, day_dir in iter_day_dirs(root):
+            if _has_jpg(day_dir):
+                dates.add(day.isoformat())
+    return sorted(dates)
 
-    for year_dir in sorted(output_dir.iterdir()):
-        if not year_dir.is_dir() or not re.fullmatch(r"\d{4}", year_dir.name):
-            continue
-        for month_dir in sorted(year_dir.iterdir()):
-            if not month_dir.is_dir() or not re.fullmatch(r"\d{2}", month_dir.name):
-                continue
-            for day_dir in sorted(month_dir.iterdir()):
-                if not day_dir.is_dir() or not re.fullmatch(r"\d{2}", day_dir.name):
-                    continue
-                # Check if day directory contains at least one .jpg
-                has_jpg = any(
-                    f.suffix.lower() == ".jpg"
-                    for f in day_dir.iterdir()
-                    if f.is_file()
-                )
-                if has_jpg:
-                    dates.append(
-                        f"{year_dir.name}-{month_dir.name}-{day_dir.name}"
-                    )
-    return dates
-
-
-def _list_images_for_date(output_dir: Path, date_str: str) -> list[dict]:
+
+def _list_preview_dates(roots: list[Path]) -> list[str]:
+    """Return sorted YYYY-MM-DD strings of days with a preview video."""
+    dates = set()
+    for root in roots:
+        for day, day_dir in iter_day_dirs(root):
+            if (day_dir / PREVIEW_FILENAME).is_file():
+                dates.add(day.isoformat())
+    return sorted(dates)
+
+
+def _has_preview(roots: list[Path], date_str: str) -> bool:
+    """Whether a YYYY-MM-DD day (or "" for none) has a preview video."""
+    if not date_str:
+        return False
+    day_dir = find_day_dir(roots, date.fromisoformat(date_str))
+    return day_dir is not None and (day_dir / PREVIEW_FILENAME).is_file()
+
+
+def _list_images_for_date(roots: list[Path], date_str: str) -> list[dict]:
     """List image metadata for a given date.
 
     Args:
-        output_dir: Root output directory.
+        roots: Storage tier root directories, primary first.
         date_str: Date in YYYY-MM-DD format (already validated).
 
     Returns:
         Sorted list of dicts with filename, thumb_url, full_url, time.
     """
     year, month, day = date_str.split("-")
-    day_dir = output_dir / year / month / day
+    day_dir = _find_day_dir(roots, year, month, day)
 
-    if not day_dir.is_dir():
+    if day_dir is None:
         return []
 
     images: list[dict] = []
-    for f in sorted(day_dir.iterdir()):
+    for f in sorted(day_dir.iterdir(), key=lambda p: image_sort_key(p.name)):
         if not f.is_file() or f.suffix.lower() != ".jpg":
             continue
         # Skip thumbs directory entries (shouldn't be files, but guard anyway)
         if f.parent.name == "thumbs":
             continue
 
-        # Derive time from filename (e.g., 143022.jpg -> 14:30:22)
-        stem = f.stem
-        if len(stem) >= 6 and stem[:6].isdigit():
-            time_str = f"{stem[0:2]}:{stem[2:4]}:{stem[4:6]}"
-        else:
-            time_str = stem
+        # Derive time from filename (143022.jpg -> 14:30:22,
+        # 143022125.jpg -> 14:30:22.125)
+        time_str = format_image_time(f.stem)
 
         images.append(
             {
@@ -132,8 +155,8 @@ def index():
     Query params:
         date: YYYY-MM-DD to select. Defaults to most recent date with images.
     """
-    output_dir = current_app.config["OUTPUT_DIR"]
-    dates = _list_available_dates(output_dir)
+    roots = current_app.config["IMAGE_ROOTS"]
+    dates = _list_available_dates(roots)
 
     # Determine selected date
     selected_date = request.args.get("date", "")
@@ -141,24 +164,32 @@ def index():
         selected_date = dates[-1] if dates else ""
 
     # Get images for selected date
-    images = _list_images_for_date(output_dir, selected_date) if selected_date else []
+    images = _list_images_for_date(roots, selected_date) if selected_date else []
 
     return render_template(
         "timeline.html",
         dates=dates,
         selected_date=selected_date,
         images=images,
+        has_preview=_has_preview(roots, selected_date),
     )
 
 
 @timeline_bp.route("/api/dates")
 def api_dates():
     """Return JSON array of available date strings (YYYY-MM-DD), sorted ascending."""
-    output_dir = current_app.config["OUTPUT_DIR"]
-    dates = _list_available_dates(output_dir)
+    roots = current_app.config["IMAGE_ROOTS"]
+    dates = _list_available_dates(roots)
     return jsonify(dates)
 
 
+@timeline_bp.route("/api/previews")
+def api_previews():
+    """Return JSON array of dates (YYYY-MM-DD) that have a preview video."""
+    roots = current_app.config["IMAGE_ROOTS"]
+    return jsonify(_list_preview_dates(roots))
+
+
 @timeline_bp.route("/api/images/<date>")
 def api_images(date: str):
     """Return JSON array of image objects for a given date.
@@ -168,8 +199,8 @@ def api_images(date: str):
     if _validate_date(date) is None:
         abort(404)
 
-    output_dir = current_app.config["OUTPUT_DIR"]
-    images = _list_images_for_date(output_dir, date)
+    roots = current_app.config["IMAGE_ROOTS"]
+    images = _list_images_for_date(roots, date)
     return jsonify(images)
 
 
@@ -185,10 +216,9 @@ def serve_image(year: str, month: str, day: str, filename: str):
     ):
         abort(404)
 
-    output_dir = current_app.config["OUTPUT_DIR"]
-    image_dir = output_dir / year / month / day
+    image_dir = _find_day_dir(current_app.config["IMAGE_ROOTS"], year, month, day)
 
-    if not image_dir.is_dir():
+    if image_dir is None:
         abort(404)
 
     return send_from_directory(image_dir, filename)
@@ -210,8 +240,9 @@ def serve_thumb(year: str, month: str, day: str, filename: str):
     ):
         abort(404)
 
-    output_dir = current_app.config["OUTPUT_DIR"]
-    day_dir = output_dir / year / month / day
+    day_dir = _find_day_dir(current_app.config["IMAGE_ROOTS"], year, month, day)
+    if day_dir is None:
+        abort(404)
     thumb_dir = day_dir / "thumbs"
 
     # If thumbnail exists, serve it directly
@@ -224,7 +255,7 @@ def serve_thumb(year: str, month: str, day: str, filename: str):
         abort(404)
 
     # Generate thumbnail using the existing module
-    from timelapse.web.thumbnails import generate_thumbnail
+    from timelapse.thumbnails import generate_thumbnail
 
     try:
         generate_thumbnail(full_image, thumb_dir)
@@ -233,3 +264,20 @@ def serve_thumb(year: str, month: str, day: str, filename: str):
         abort(404)
 
     return send_from_directory(thumb_dir, filename, max_age=86400)
+
+
+@timeline_bp.route("/preview/<year>/<month>/<day>")
+def serve_preview(year: str, month: str, day: str):
+    """Serve a day's precomputed preview video, honouring Range requests."""
+    if not (
+        _validate_path_component(year, r"\d{4}")
+        and _validate_path_component(month, r"\d{2}")
+        and _validate_path_component(day, r"\d{2}")
+    ):
+        abort(404)
+
+    day_dir = _find_day_dir(current_app.config["IMAGE_ROOTS"], year, month, day)
+    if day_dir is None or not (day_dir / PREVIEW_FILENAME).is_file():
+        abort(404)
+
+    return send_file(day_dir / PREVIEW_FILENAME, mimetype="video/mp4", conditional=True)
@@ -2,14 +2,15 @@
 
 Reads daemon state from .status.json and aggregates system information
 for display in the base template's health indicators and the Control tab's
-full system info panel.
+full system info panel. Disk figures come from the daemon's published
+sample, so request handlers do not query the filesystem.
 """
 
-import shutil
 import subprocess
 from pathlib import Path
 
-from timelapse.status import read_status
+from timelapse.status import read_status, status_socket_path
+from timelapse.storage import DiskUsageSampler
 
 
 def get_health_summary(status_path: Path, config: dict) -> dict:
@@ -22,11 +23,18 @@ def get_health_summary(status_path: Path, config: dict) -> dict:
     Returns:
         Dict with keys: daemon_state, last_capture, disk_usage_percent,
         disk_free_gb, disk_warning, captures_today, consecutive_failures,
-        camera, uptime_seconds, config_loaded, capture_interval.
+        camera, uptime_seconds, config_loaded, capture_interval,
+        change_score, disk_full_in, disk_per_day_mb, storage_pressure,
+        write_latency, capture_cpu, capture_slots.
     """
-    status = read_status(status_path) or {}
+    # Prefer the daemon's live socket when configured; it never touches disk
+    status = read_status(status_path, status_socket_path(config)) or {}
     warn_threshold = config["storage"]["warn_threshold"]
     disk_pct = status.get("disk_usage_percent", -1)
+    forecast = status.get("disk_forecast") or {}
+    per_day = forecast.get("bytes_per_day")
+    # Retention cleanup can hold usage steady or shrinking
+    net_per_day = forecast.get("net_bytes_per_day")
 
     return {
         "daemon_state": status.get("daemon", "unknown"),
@@ -39,13 +47,81 @@ def get_health_summary(status_path: Path, config: dict) -> dict:
         "camera": status.get("camera", "unknown"),
         "uptime_seconds": status.get("uptime_seconds", 0),
         "config_loaded": status.get("config_loaded", "unknown"),
-        "capture_interval": config["capture"]["interval"],
+        # Adaptive intervals vary; prefer the daemon's current value
+        "capture_interval": status.get(
+            "capture_interval", config["capture"]["interval"]
+        ),
+        "change_score": status.get("change_score"),
+        "disk_full_in": (
+            "Not filling"
+            if net_per_day is not None and net_per_day <= 0
+            else _format_hours(forecast.get("hours_to_full"))
+        ),
+        "disk_per_day_mb": (
+            round(per_day / (1024**2), 1) if per_day is not None else None
+        ),
+        "storage_pressure": status.get("storage_pressure", False),
+        "write_latency": _format_latency(status.get("write_latency") or {}),
+        "capture_cpu": _format_capture_cpu(status.get("capture_cpu") or {}),
+        "capture_slots": _format_slots(status.get("capture_slots") or {}),
     }
 
 
-def get_full_system_info() -> dict:
+def _format_slots(slots: dict) -> str:
+    """Format late/missed capture slot counts for display."""
+    if not slots:
+        return "Unknown"
+    text = f"{slots['late']} late, {slots['missed']} missed"
+    lateness = slots.get("lateness_ms")
+    if lateness:
+        text += f" ({lateness['mean']:.0f} ms mean delay)"
+    return text
+
+
+def _format_capture_cpu(cpu: dict) -> str:
+    """Format mean capture CPU time of the current encode path for display."""
+    encode = cpu.get("encode")
+    mean = cpu.get(f"{encode}_ms") if encode else None
+    if mean is None:
+        return "Unknown"
+    return f"{mean:.0f} ms ({encode} JPEG)"
+
+
+def _format_latency(latency: dict) -> str:
+    """Format mean capture write / fsync / fresh-frame latency for display."""
+    write = latency.get("write_ms")
+    fsync = latency.get("fsync_ms")
+    if not write or not fsync:
+        return "Unknown"
+    text = f"{write['mean']:.0f} ms write, {fsync['mean']:.0f} ms fsync"
+    fresh = latency.get("fresh_frame_ms")
+    if fresh:
+        text += f", {fresh['mean']:.0f} ms to fresh frame"
+    return text
+
+
+def _format_hours(hours: float | None) -> str:
+    """Format a time-to-full forecast for display."""
+    if hours is None:
+        return "Unknown"
+    if hours >= 48:
+        return f"{hours / 24:.1f} days"
+    return f"{hours:.1f} hours"
+
+
+def get_full_system_info(
+    status_path: Path, sampler: DiskUsageSampler | None = None
+) -> dict:
     """Extended system info for hover popups and the Control tab.
 
+    Disk figures describe the output directory's filesystem, as last
+    sampled by the daemon. If the daemon has never published them, they
+    are taken from sampler (rate-limited by its TTL) instead.
+
+    Args:
+        status_path: Path to the .status.json file written by the daemon.
+        sampler: Fallback sampler for the output directory, or None.
+
     Returns:
         Dict with keys: system_uptime, disk_total_gb, disk_used_gb,
         disk_free_gb.
@@ -61,12 +137,20 @@ def get_full_system_info() -> dict:
     except Exception:
         system_uptime = "unknown"
 
-    try:
-        usage = shutil.disk_usage("/")
-        disk_total_gb = round(usage.total / (1024**3), 1)
-        disk_used_gb = round(usage.used / (1024**3), 1)
-        disk_free_gb = round(usage.free / (1024**3), 1)
-    except Exception:
+    status = read_status(status_path) or {}
+    if "disk_total_gb" in status:
+        disk_total_gb = round(status["disk_total_gb"], 1)
+        disk_used_gb = round(status.get("disk_used_gb", -1), 1)
+        disk_free_gb = round(status.get("disk_free_gb", -1), 1)
+    elif sampler is not None:
+        try:
+            usage = sampler.sample()
+            disk_total_gb = round(usage.total / (1024**3), 1)
+            disk_used_gb = round(usage.used / (1024**3), 1)
+            disk_free_gb = round(usage.free / (1024**3), 1)
+        except OSError:
+            disk_total_gb = disk_used_gb = disk_free_gb = -1
+    else:
         disk_total_gb = disk_used_gb = disk_free_gb = -1
 
     return {
@@ -0,0 +1,354 @@
+"""Persistent background queue for web-triggered video generation.
+
+Jobs are stored as one JSON file each under ``output_dir/.jobs/`` (or
+web.jobs.dir) so the queue survives web server restarts, with the
+finished video alongside as ``<job id>.mp4``. The runner deletes
+finished jobs beyond the newest web.jobs.keep, or older than
+web.jobs.max_age_days, so videos do not pile up next to the images.
+
+A single runner thread executes jobs one at a time, each in a child
+process that lowers its own CPU priority (os.nice) and limits FFmpeg's
+thread count. The web service's CPUQuota applies to the child too,
+since it stays in the same cgroup, so generation cannot starve the
+capture daemon.
+
+The child reuses generate_timelapse() and writes FFmpeg progress
+snapshots into the job file, where the web endpoints pick them up. A
+failed job leaves no partial video behind, and a job interrupted by
+restarts more than _MAX_ATTEMPTS times is marked failed rather than
+retried forever.
+"""
+
+import contextlib
+import io
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from timelapse.status import read_status, write_status
+
+logger = logging.getLogger(__name__)
+
+# Named generation presets offered in the UI. "full" is capped at 1080p:
+# encoding larger sources (e.g. 4056x3040 HQ camera frames) needs more
+# memory than the web service's MemoryMax allows.
+PROFILES = {
+    "preview": {"use_thumbnails": True},
+    "hd": {"resolution": (1280, 720)},
+    "full": {"resolution": (1920, 1080)},
+}
+
+JOB_ID_PATTERN = r"\d{8}-\d{6}-[0-9a-f]{6}"
+
+# Seconds between progress writes to the job file
+_PROGRESS_WRITE_INTERVAL = 1.0
+
+# Times a job is started before a restart mid-job marks it failed
+_MAX_ATTEMPTS = 3
+
+# Seconds the runner waits after an unexpected error before retrying
+_ERROR_BACKOFF = 30
+
+
+def _run_job(
+    job_path: Path,
+    images_dir: Path,
+    tier_dirs: list[Path],
+    nice: int,
+    threads: int,
+) -> None:
+    """Child process entry point: generate one video and record the outcome."""
+    from timelapse.generate import generate_timelapse
+
+    os.nice(nice)
+    job = read_status(job_path)
+    params = job["params"]
+    last_write = [0.0]
+
+    def on_progress(progress) -> None:
+        now = time.monotonic()
+        if not progress.finished and now - last_write[0] < _PROGRESS_WRITE_INTERVAL:
+            return
+        last_write[0] = now
+        job["progress"] = progress.as_dict()
+        # Progress is best effort; a full disk must not abort the encode
+        try:
+            write_status(job_path, job)
+        except OSError as exc:
+            logger.warning("Could not record progress of %s: %s", job_path.stem, exc)
+
+    # generate_timelapse reports problems on stdout/stderr; keep them for the job
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            generate_timelapse(
+                images_dir=images_dir,
+                tier_dirs=tier_dirs,
+                start=date.fromisoformat(params["start"]),
+                end=date.fromisoformat(params["end"]),
+                duration_seconds=params["duration"],
+                output_path=job_path.with_suffix(".mp4"),
+                threads=threads,
+                show_progress=False,
+                silent=True,
+                on_progress=on_progress,
+                **PROFILES[params["profile"]],
+            )
+    except BaseException as exc:
+        # generate_timelapse exits via SystemExit (after printing the reason)
+        # for problems such as "no images found"
+        lines = [line for line in output.getvalue().splitlines() if line.strip()]
+        job["status"] = "failed"
+        job["error"] = (
+            lines[-1] if isinstance(exc, SystemExit) and lines else str(exc)
+        ) or type(exc).__name__
+        job_path.with_suffix(".mp4").unlink(missing_ok=True)
+    else:
+        job["status"] = "done"
+        job["output"] = job_path.with_suffix(".mp4").name
+    job["finished"] = datetime.now().isoformat(timespec="seconds")
+    write_status(job_path, job)
+
+
+class JobQueue:
+    """Queue of video generation jobs, executed one at a time.
+
+    Args:
+        jobs_dir: Directory holding job files and finished videos.
+        images_dir: Root image directory passed to generate_timelapse().
+        tier_dirs: Secondary storage tiers passed to generate_timelapse().
+        nice: Niceness increment applied to each job process.
+        threads: FFmpeg encoder thread count for each job.
+        keep: Finished jobs (and their videos) kept; older ones are deleted.
+        max_age_days: Days a finished job is kept, or 0 for no age limit.
+    """
+
+    def __init__(
+        self,
+        jobs_dir: Path,
+        images_dir: Path,
+        tier_dirs: list[Path] | None = None,
+        nice: int = 19,
+        threads: int = 1,
+        keep: int = 10,
+        max_age_days: float = 14,
+    ):
+        self._jobs_dir = Path(jobs_dir)
+        self._images_dir = Path(images_dir)
+        self._tier_dirs = list(tier_dirs or [])
+        self._nice = nice
+        self._threads = threads
+        self._keep = keep
+        self._max_age_days = max_age_days
+        # Serializes status changes between the runner and delete()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the runner thread, resuming jobs left over from a restart."""
+        if self._thread is not None:
+            return
+        self._jobs_dir.mkdir(parents=True, exist_ok=True)
+        for job in self.list():
+            if job["status"] != "running":
+                continue
+            # The web server stopped mid-job; run it again unless it keeps
+            # taking the server down with it (e.g. running out of memory)
+            attempts = job.get("attempts", 1)
+            if attempts >= _MAX_ATTEMPTS:
+                self._fail(
+                    job,
+                    f"Interrupted {attempts} times by a web service restart; "
+                    "not retrying",
+                )
+                continue
+            job["status"] = "queued"
+            job["progress"] = None
+            write_status(self._job_path(job["id"]), job)
+        self._thread = threading.Thread(
+            target=self._run, name="timelapse-jobs", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, start: date, end: date, duration: int, profile: str) -> dict:
+        """Queue a new job.
+
+        Raises:
+            ValueError: If the parameters are invalid.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile: {profile!r}")
+        if end < start:
+            raise ValueError("End date is before start date")
+        if duration <= 0:
+            raise ValueError("Duration must be positive")
+
+        now = datetime.now()
+        job = {
+            "id": f"{now:%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}",
+            "status": "queued",
+            "created": now.isoformat(timespec="seconds"),
+            "started": None,
+            "finished": None,
+            "params": {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "duration": duration,
+                "profile": profile,
+            },
+            "progress": None,
+            "error": None,
+            "output": None,
+            "attempts": 0,
+        }
+        self._jobs_dir.mkdir(parents=True, exist_ok=True)
+        write_status(self._job_path(job["id"]), job)
+        self._wake.set()
+        return job
+
+    def get(self, job_id: str) -> dict | None:
+        """Return a job by id, or None if unknown."""
+        if not re.fullmatch(JOB_ID_PATTERN, job_id):
+            return None
+        return read_status(self._job_path(job_id))
+
+    def list(self) -> list[dict]:
+        """Return all jobs, newest first."""
+        if not self._jobs_dir.is_dir():
+            return []
+        jobs = []
+        for path in sorted(self._jobs_dir.glob("*.json"), reverse=True):
+            job = read_status(path)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    def video_path(self, job_id: str) -> Path | None:
+        """Return the finished video for a job, or None if not available."""
+        job = self.get(job_id)
+        if job is None or job["status"] != "done":
+            return None
+        path = self._job_path(job_id).with_suffix(".mp4")
+        return path if path.is_file() else None
+
+    def delete(self, job_id: str) -> bool:
+        """Delete a queued or finished job and its video.
+
+        Returns:
+            True if the job was deleted, False if it is unknown.
+
+        Raises:
+            ValueError: If the job is running.
+        """
+        with self._lock:
+            job = self.get(job_id)
+            if job is None:
+                return False
+            if job["status"] == "running":
+                raise ValueError("Job is running")
+            self._remove(job_id)
+        return True
+
+    def _remove(self, job_id: str) -> None:
+        job_path = self._job_path(job_id)
+        job_path.with_suffix(".mp4").unlink(missing_ok=True)
+        job_path.unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Delete finished jobs beyond the retention limits."""
+        finished = [job for job in self.list() if job["status"] in ("done", "failed")]
+        cutoff = None
+        if self._max_age_days:
+            cutoff = datetime.now() - timedelta(days=self._max_age_days)
+        for index, job in enumerate(finished):
+            expired = (
+                cutoff is not None
+                and job.get("finished")
+                and datetime.fromisoformat(job["finished"]) < cutoff
+            )
+            if index >= self._keep or expired:
+                self._remove(job["id"])
+                logger.info("Deleted finished generation job %s", job["id"])
+
+    def _job_path(self, job_id: str) -> Path:
+        return self._jobs_dir / f"{job_id}.json"
+
+    def _fail(self, job: dict, error: str) -> None:
+        """Record a job as failed and remove any partial video."""
+        job_path = self._job_path(job["id"])
+        job["status"] = "failed"
+        job["error"] = error
+        job["finished"] = datetime.now().isoformat(timespec="seconds")
+        write_status(job_path, job)
+        job_path.with_suffix(".mp4").unlink(missing_ok=True)
+
+    def _run(self) -> None:
+        """Runner loop: execute queued jobs oldest-first, one at a time."""
+        ctx = multiprocessing.get_context("spawn")
+        while True:
+            # The thread must outlive any error, or the queue silently stalls
+            try:
+                self._prune()
+                ran = self._run_next(ctx)
+            except Exception:
+                logger.exception("Generation job runner error")
+                time.sleep(_ERROR_BACKOFF)
+                continue
+            if not ran:
+                self._wake.wait(timeout=30)
+                self._wake.clear()
+
+    def _run_next(self, ctx) -> bool:
+        """Run the oldest queued job, if any.
+
+        Returns:
+            True if a job was run.
+        """
+        with self._lock:
+            queued = [job for job in reversed(self.list()) if job["status"] == "queued"]
+            if not queued:
+                return False
+
+            job = queued[0]
+            job_path = self._job_path(job["id"])
+            job["status"] = "running"
+            job["started"] = datetime.now().isoformat(timespec="seconds")
+            job["attempts"] = job.get("attempts", 0) + 1
+            write_status(job_path, job)
+
+        try:
+            logger.info("Starting generation job %s", job["id"])
+
+            proc = ctx.Process(
+                target=_run_job,
+                args=(
+                    job_path,
+                    self._images_dir,
+                    self._tier_dirs,
+                    self._nice,
+                    self._threads,
+                ),
+                name=f"timelapse-job-{job['id']}",
+            )
+            proc.start()
+            proc.join()
+
+            # If the child died without recording an outcome, record one
+            job = read_status(job_path) or job
+            if job["status"] == "running":
+                error = f"Job process exited with code {proc.exitcode}"
+                if proc.exitcode == -9:
+                    error += " (killed, possibly out of memory)"
+                self._fail(job, error)
+        except Exception as exc:
+            logger.exception("Generation job %s failed", job["id"])
+            self._fail(job, str(exc) or type(exc).__name__)
+        logger.info("Generation job %s %s", job["id"], job["status"])
+        return True
@@ -143,6 +143,20 @@
                 if (diskUsed) diskUsed.textContent = si.disk_used_gb + " GB";
                 if (diskFree) diskFree.textContent = si.disk_free_gb + " GB";
 
+                var perDay = document.getElementById("disk-per-day");
+                if (perDay) {
+                    perDay.textContent = h.disk_per_day_mb !== null ? h.disk_per_day_mb + " MB" : "Unknown";
+                }
+                var fullIn = document.getElementById("disk-full-in");
+                if (fullIn) {
+                    fullIn.textContent = h.disk_full_in + (h.storage_pressure ? " (degraded)" : "");
+                    fullIn.className = h.storage_pressure ? "failure-highlight" : "";
+                }
+                var writeLatency = document.getElementById("disk-write-latency");
+                if (writeLatency) {
+                    writeLatency.textContent = h.write_latency;
+                }
+
                 var daemonState = document.getElementById("daemon-state");
                 if (daemonState) {
                     daemonState.textContent = h.daemon_state.charAt(0).toUpperCase() + h.daemon_state.slice(1);
@@ -166,6 +180,10 @@
                     var cam = h.camera || "unknown";
                     camera.textContent = cam.charAt(0).toUpperCase() + cam.slice(1);
                 }
+                var captureCpu = document.getElementById("capture-cpu");
+                if (captureCpu) captureCpu.textContent = h.capture_cpu;
+                var captureSlots = document.getElementById("capture-slots");
+                if (captureSlots) captureSlots.textContent = h.capture_slots;
 
                 var uptime = document.getElementById("system-uptime");
                 if (uptime) uptime.textContent = si.system_uptime;
@@ -0,0 +1,194 @@
+/**
+ * Control tab - video generation job form, job list, and live progress.
+ *
+ * Running and queued jobs are followed over Server-Sent Events; finished
+ * videos play inline from /jobs/<id>/video and can be deleted.
+ */
+
+(function () {
+    "use strict";
+
+    const form = document.getElementById("job-form");
+    const submitBtn = document.getElementById("job-submit");
+    const messageEl = document.getElementById("job-message");
+    const listEl = document.getElementById("job-list");
+    const player = document.getElementById("job-player");
+
+    // Job id -> EventSource for jobs still queued or running
+    const streams = {};
+
+    function showMessage(text, isError) {
+        messageEl.textContent = text;
+        messageEl.className = "action-message" + (isError ? " error" : "");
+    }
+
+    /**
+     * Human-readable status line for a job.
+     */
+    function describe(job) {
+        const p = job.params;
+        let text = p.start + " to " + p.end + " (" + p.profile + ", " + p.duration + "s) - " + job.status;
+        if (job.status === "running" && job.progress) {
+            if (job.progress.percent !== null) {
+                text += " " + Math.round(job.progress.percent) + "%";
+            }
+            if (job.progress.eta_seconds !== null) {
+                text += ", " + Math.round(job.progress.eta_seconds) + "s left";
+            }
+        }
+        if (job.status === "failed" && job.error) {
+            text += ": " + job.error;
+        }
+        return text;
+    }
+
+    /**
+     * Create or update the list entry for a job.
+     */
+    function render(job) {
+        let li = document.getElementById("job-" + job.id);
+        if (!li) {
+            li = document.createElement("li");
+            li.id = "job-" + job.id;
+            listEl.prepend(li);
+        }
+        li.textContent = "";
+
+        const label = document.createElement("span");
+        label.textContent = describe(job);
+        label.className = job.status;
+        li.appendChild(label);
+
+        if (job.status === "running") {
+            const bar = document.createElement("progress");
+            bar.max = 100;
+            if (job.progress && job.progress.percent !== null) {
+                bar.value = job.progress.percent;
+            }
+            li.appendChild(bar);
+        }
+
+        if (job.status === "done") {
+            const play = document.createElement("a");
+            play.href = "/jobs/" + job.id + "/video";
+            play.textContent = "Play";
+            play.addEventListener("click", function (e) {
+                e.preventDefault();
+                player.src = play.href;
+                player.hidden = false;
+                player.play();
+            });
+            li.appendChild(play);
+
+            const download = document.createElement("a");
+            download.href = "/jobs/" + job.id + "/video";
+            download.download = "timelapse_" + job.params.start + "_" + job.params.end + ".mp4";
+            download.textContent = "Download";
+            li.appendChild(download);
+        }
+
+        if (job.status !== "running") {
+            const remove = document.createElement("a");
+            remove.href = "#";
+            remove.textContent = "Delete";
+            remove.addEventListener("click", function (e) {
+                e.preventDefault();
+                deleteJob(job, li);
+            });
+            li.appendChild(remove);
+        }
+    }
+
+    function deleteJob(job, li) {
+        fetch("/jobs/" + job.id, { method: "DELETE", credentials: "same-origin" })
+            .then(function (resp) {
+                if (resp.ok || resp.status === 404) {
+                    if (streams[job.id]) {
+                        streams[job.id].close();
+                        delete streams[job.id];
+                    }
+                    li.remove();
+                } else {
+                    showMessage("Failed to delete job", true);
+                }
+            })
+            .catch(function (err) {
+                showMessage("Error: " + err.message, true);
+            });
+    }
+
+    /**
+     * Follow a queued/running job until it finishes.
+     */
+    function follow(job) {
+        if (streams[job.id] || job.status === "done" || job.status === "failed") {
+            return;
+        }
+        const source = new EventSource("/jobs/" + job.id + "/events");
+        streams[job.id] = source;
+        source.onmessage = function (e) {
+            const update = JSON.parse(e.data);
+            render(update);
+            if (update.status === "done" || update.status === "failed") {
+                source.close();
+                delete streams[job.id];
+            }
+        };
+        source.onerror = function () {
+            // Stream ended or connection dropped; a reload picks it back up
+            source.close();
+            delete streams[job.id];
+        };
+    }
+
+    function loadJobs() {
+        fetch("/jobs/", { credentials: "same-origin" })
+            .then(function (resp) {
+                return resp.json();
+            })
+            .then(function (data) {
+                // Render oldest first so prepend leaves the newest on top
+                data.jobs.slice().reverse().forEach(function (job) {
+                    render(job);
+                    follow(job);
+                });
+            })
+            .catch(function () {
+                // Silently ignore (e.g. network issue)
+            });
+    }
+
+    form.addEventListener("submit", function (e) {
+        e.preventDefault();
+        submitBtn.disabled = true;
+        showMessage("Queueing...", false);
+
+        fetch("/jobs/", {
+            method: "POST",
+            credentials: "same-origin",
+            body: new FormData(form),
+        })
+            .then(function (resp) {
+                return resp.json().then(function (data) {
+                    return { ok: resp.ok, data: data };
+                });
+            })
+            .then(function (result) {
+                if (result.ok) {
+                    showMessage("Job queued", false);
+                    render(result.data);
+                    follow(result.data);
+                } else {
+                    showMessage(result.data.error || "Failed to queue job", true);
+                }
+            })
+            .catch(function (err) {
+                showMessage("Error: " + err.message, true);
+            })
+            .finally(function () {
+                submitBtn.disabled = false;
+            });
+    });
+
+    loadJobs();
+})();
@@ -5,6 +5,7 @@
  *   currentIndex   - currently selected thumbnail index
  *   currentDate    - currently displayed date (YYYY-MM-DD)
  *   availableDates - array of date strings from /api/dates
+ *   previewDates   - dates with a precomputed preview video (/api/previews)
  *   images         - image objects for the current day
  */
 
@@ -16,6 +17,7 @@
   let currentIndex = 0;
   let currentDate = "";
   let availableDates = [];
+  let previewDates = [];
   let images = [];
 
   // ── DOM references ──────────────────────────────────────────────────
@@ -26,6 +28,8 @@
   const datePicker = document.getElementById("date-picker");
   const dateDisplay = document.getElementById("current-date-display");
   const dataEl = document.getElementById("timeline-data");
+  const playBtn = document.getElementById("play-day");
+  const preview = document.getElementById("day-preview");
 
   // If no filmstrip (no images page), bail out early
   if (!filmstrip) return;
@@ -50,10 +54,22 @@
         availableDates = [];
       });
 
+    // Fetch dates that have a preview video
+    fetch("/api/previews")
+      .then(function (resp) { return resp.json(); })
+      .then(function (dates) {
+        previewDates = dates;
+        updatePlayButton();
+      })
+      .catch(function () {
+        previewDates = [];
+      });
+
     // Attach event listeners
     filmstrip.addEventListener("keydown", handleKeydown);
     filmstrip.addEventListener("click", handleClick);
     datePicker.addEventListener("change", handleDateChange);
+    playBtn.addEventListener("click", togglePreview);
 
     // Focus filmstrip so keyboard events work immediately
     filmstrip.focus();
@@ -82,6 +98,7 @@
    */
   function navigateTo(index) {
     if (index < 0 || index >= images.length) return;
+    hidePreview();
 
     var thumbs = filmstrip.querySelectorAll(".thumb");
 
@@ -119,6 +136,8 @@
 
         currentDate = dateStr;
         images = data;
+        hidePreview();
+        updatePlayButton();
 
         // Rebuild filmstrip DOM
         filmstrip.innerHTML = "";
@@ -152,6 +171,43 @@
       });
   }
 
+  // ── Day preview ─────────────────────────────────────────────────────
+
+  /**
+   * Show the play button only when the current day has a preview video.
+   */
+  function updatePlayButton() {
+    playBtn.hidden = previewDates.indexOf(currentDate) === -1;
+  }
+
+  /**
+   * Swap the main image for the day's preview video, or back again.
+   */
+  function togglePreview() {
+    if (!preview.hidden) {
+      hidePreview();
+      filmstrip.focus();
+      return;
+    }
+    preview.src = "/preview/" + currentDate.replace(/-/g, "/");
+    preview.hidden = false;
+    mainImage.hidden = true;
+    timestamp.hidden = true;
+    playBtn.textContent = "Show images";
+    preview.play();
+  }
+
+  function hidePreview() {
+    if (preview.hidden) return;
+    preview.pause();
+    preview.removeAttribute("src");
+    preview.load();
+    preview.hidden = true;
+    mainImage.hidden = false;
+    timestamp.hidden = false;
+    playBtn.textContent = "Play day";
+  }
+
   // ── Event Handlers ──────────────────────────────────────────────────
 
   function handleKeydown(e) {